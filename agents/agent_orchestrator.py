@@ -281,17 +281,15 @@ class AgentOrchestrator:
         logger.info("Executing session cleanup")
         
         try:
-            # Get all sessions
-            sessions = self.game_state_agent.get_all_sessions()
+            # Sessions created more than 24 hours ago, oldest first
+            cutoff = datetime.now() - timedelta(hours=24)
+            expired = self.game_state_agent.session_expiry.expire_due(cutoff)
             
             cleaned_count = 0
-            for session in sessions:
-                # Check if session is old (more than 24 hours)
-                created_at = datetime.fromisoformat(session["created_at"])
-                if datetime.now() - created_at > timedelta(hours=24):
-                    # End the session
-                    if self.game_state_agent.end_session(session["session_id"]):
-                        cleaned_count += 1
+            for session_id in expired:
+                # End the session
+                if self.game_state_agent.end_session(session_id):
+                    cleaned_count += 1
             
             # Update workflow status
             self.workflows["session_cleanup"] = {
@@ -0,0 +1,303 @@
+"""
+Batch Curation
+
+Curates the whole scenario library in one run. Scenarios are fanned out
+over a process pool and skipped when their content hash matches the last
+curated result, so re-running after a small content drop only re-curates
+what changed. Results are consolidated into a single report. A scenario
+that fails to curate is reported as failed and left out of the cache (so
+the next run retries it); the rest of the library is still curated.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LIBRARY_PATTERNS = ("*scenarios*.json", "expanded_*.json")
+CURATION_METADATA_KEYS = {"curated_at", "curated_by", "quality_improved"}
+
+# Per-process curator, created lazily in pool workers
+_worker_agent = None
+
+
+def _get_worker_agent():
+    """Return the curator for this process, creating it on first use."""
+    global _worker_agent
+    if _worker_agent is None:
+        from .content_curator_agent import ContentCuratorAgent
+        _worker_agent = ContentCuratorAgent()
+    return _worker_agent
+
+
+def content_hash(data: Any) -> str:
+    """Stable hash of JSON-serializable content."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def iter_library_scenarios(data: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(scenario_id, scenario)`` for the scenario file layouts used in data/."""
+    if isinstance(data, dict):
+        if isinstance(data.get("enhanced_scenarios"), dict):
+            data = data["enhanced_scenarios"]
+        elif isinstance(data.get("scenarios"), list):
+            data = data["scenarios"]
+
+    if isinstance(data, list):
+        for index, scenario in enumerate(data):
+            if isinstance(scenario, dict):
+                yield str(scenario.get("id", index)), scenario
+    elif isinstance(data, dict):
+        for scenario_id, scenario in data.items():
+            if isinstance(scenario, dict):
+                yield str(scenario_id), scenario
+
+
+def curate_library_scenario(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate, curate and consistency-check one scenario (runs in pool workers)."""
+    agent = _get_worker_agent()
+    # validate_content scans the text fields; reuse its hits instead of scanning again
+    validation = agent.validate_content(scenario, "scenario")
+    content_hits = validation["content_hits"]
+    consistency = agent._check_consistency(scenario, content_hits)
+    curated = agent._curate_scenario(json.loads(json.dumps(scenario)))
+
+    return {
+        "valid": validation["valid"],
+        "rating": validation["rating"],
+        "issues": validation["issues"],
+        "suggestions": validation["suggestions"] + consistency["suggestions"],
+        "consistent": consistency["consistent"],
+        "inconsistencies": consistency["inconsistencies"],
+        "content_hits": content_hits,
+        "curated_fields": sorted(
+            key for key in curated
+            if key not in CURATION_METADATA_KEYS and curated.get(key) != scenario.get(key)
+        )
+    }
+
+
+def _curate_or_error(scenario: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """curate_library_scenario, returning (result, None) or (None, error) instead of raising."""
+    try:
+        return curate_library_scenario(scenario), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+class BatchCurator:
+    """Incremental, parallel curation of every scenario file in the library."""
+
+    def __init__(self, data_dir: str = "data", cache_file: str = None,
+                 report_file: str = None, max_workers: int = None):
+        """Initialize the batch curator."""
+        self.data_dir = Path(data_dir)
+        self.cache_file = Path(cache_file) if cache_file else self.data_dir / "curation_cache.json"
+        self.report_file = Path(report_file) if report_file else self.data_dir / "curation_report.json"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the last curated results."""
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if isinstance(cache, dict):
+                    cache.setdefault("files", {})
+                    cache.setdefault("scenarios", {})
+                    return cache
+        except Exception as e:
+            logger.error(f"Error loading curation cache: {e}")
+        return {"files": {}, "scenarios": {}}
+
+    def _save_cache(self):
+        """Persist the curated results."""
+        try:
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Error saving curation cache: {e}")
+
+    def library_files(self) -> List[Path]:
+        """Return every scenario file in the library."""
+        files = set()
+        for pattern in LIBRARY_PATTERNS:
+            files.update(self.data_dir.glob(pattern))
+        return sorted(path for path in files if path not in (self.cache_file, self.report_file))
+
+    def _collect(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Tuple[str, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Hash the library and split it into cached and dirty scenarios.
+
+        Returns (file entries, dirty scenarios keyed by cache key, file errors).
+        Unchanged files are recognised from their byte hash and never parsed.
+        """
+        file_entries = {}
+        dirty = {}
+        errors = []
+
+        for path in self.library_files():
+            name = path.name
+            try:
+                raw = path.read_bytes()
+            except OSError as e:
+                errors.append({"file": name, "error": str(e)})
+                continue
+
+            file_hash = hashlib.sha256(raw).hexdigest()
+            previous = self.cache["files"].get(name)
+            if previous and previous["hash"] == file_hash and all(
+                key in self.cache["scenarios"] for key in previous["scenarios"]
+            ):
+                file_entries[name] = previous
+                continue
+
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except ValueError as e:
+                errors.append({"file": name, "error": f"Invalid JSON: {e}"})
+                continue
+
+            keys = []
+            for scenario_id, scenario in iter_library_scenarios(data):
+                key = f"{name}::{scenario_id}"
+                keys.append(key)
+                scenario_hash = content_hash(scenario)
+                cached = self.cache["scenarios"].get(key)
+                if not cached or cached["hash"] != scenario_hash:
+                    dirty[key] = (scenario_hash, scenario)
+            file_entries[name] = {"hash": file_hash, "scenarios": keys}
+
+        return file_entries, dirty, errors
+
+    def _curate_dirty(self, dirty: Dict[str, Tuple[str, Dict[str, Any]]]
+                      ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Curate changed scenarios, in a process pool when there is more than one.
+
+        Returns (cache entries of the curated scenarios, error per failed scenario key).
+        """
+        keys = list(dirty)
+        scenarios = [dirty[key][1] for key in keys]
+
+        if len(keys) <= 1 or self.max_workers <= 1:
+            outcomes = [_curate_or_error(scenario) for scenario in scenarios]
+        else:
+            workers = min(self.max_workers, len(keys))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_curate_or_error, scenarios))
+
+        curated_at = datetime.now().isoformat()
+        curated = {}
+        failures = {}
+        for key, (result, error) in zip(keys, outcomes):
+            if error is None:
+                curated[key] = {"hash": dirty[key][0], "curated_at": curated_at, "result": result}
+            else:
+                logger.error(f"Error curating {key}: {error}")
+                failures[key] = error
+        return curated, failures
+
+    def run(self) -> Dict[str, Any]:
+        """Curate the library and write the consolidated report."""
+        started = datetime.now()
+        file_entries, dirty, errors = self._collect()
+
+        failures = {}
+        if dirty:
+            logger.info(f"Curating {len(dirty)} changed scenarios")
+            curated, failures = self._curate_dirty(dirty)
+            self.cache["scenarios"].update(curated)
+
+        live_keys = {key for entry in file_entries.values() for key in entry["scenarios"]}
+        cache_changed = bool(dirty) or file_entries != self.cache["files"]
+        self.cache["files"] = file_entries
+        self.cache["scenarios"] = {
+            key: value for key, value in self.cache["scenarios"].items() if key in live_keys
+        }
+        if cache_changed:
+            self._save_cache()
+
+        report = self._build_report(file_entries, set(dirty) - set(failures), errors, started,
+                                    {key: (dirty[key][0], error) for key, error in failures.items()})
+        self._write_report(report)
+        return report
+
+    def _build_report(self, file_entries: Dict[str, Dict[str, Any]], curated_keys: set,
+                      errors: List[Dict[str, Any]], started: datetime,
+                      failures: Optional[Dict[str, Tuple[str, str]]] = None) -> Dict[str, Any]:
+        """Consolidate cached and fresh results (and failed scenarios) into one report."""
+        failures = failures or {}
+        scenarios = []
+        approved = 0
+        inconsistent = 0
+        for name in sorted(file_entries):
+            for key in file_entries[name]["scenarios"]:
+                if key in failures:
+                    scenario_hash, error = failures[key]
+                    scenarios.append({
+                        "file": name,
+                        "scenario_id": key.split("::", 1)[1],
+                        "content_hash": scenario_hash,
+                        "failed": True,
+                        "error": error
+                    })
+                    continue
+                entry = self.cache["scenarios"][key]
+                result = entry["result"]
+                approved += result["rating"] == "approved"
+                inconsistent += not result["consistent"]
+                scenarios.append({
+                    "file": name,
+                    "scenario_id": key.split("::", 1)[1],
+                    "content_hash": entry["hash"],
+                    "curated_at": entry["curated_at"],
+                    "from_cache": key not in curated_keys,
+                    **result
+                })
+
+        total = len(scenarios)
+        return {
+            "report_id": f"curation_{started.strftime('%Y%m%d_%H%M%S')}",
+            "generated_at": datetime.now().isoformat(),
+            "duration_ms": round((datetime.now() - started).total_seconds() * 1000, 2),
+            "summary": {
+                "files": len(file_entries),
+                "scenarios": total,
+                "curated": len(curated_keys),
+                "failed": len(failures),
+                "skipped_unchanged": total - len(curated_keys) - len(failures),
+                "approved": approved,
+                "rejected": total - approved - len(failures),
+                "inconsistent": inconsistent,
+                "approval_rate": approved / total if total else 0.0
+            },
+            "errors": errors,
+            "scenarios": scenarios
+        }
+
+    def _write_report(self, report: Dict[str, Any]):
+        """Write the consolidated report."""
+        try:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            logger.info(f"Curation report written to {self.report_file}")
+        except Exception as e:
+            logger.error(f"Error writing curation report: {e}")
+
+
+def curate_library(data_dir: str = "data", max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Curate every scenario file under data_dir and return the report."""
+    return BatchCurator(data_dir, max_workers=max_workers).run()
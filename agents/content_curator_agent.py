@@ -15,6 +15,8 @@ from langchain.prompts import StringPromptTemplate
 from langchain_openai import OpenAI
 from langchain.chains import LLMChain
 
+from .content_scanner import ContentScanner
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,6 +39,7 @@ class ContentCuratorAgent:
         self.llm = OpenAI(temperature=0.3, api_key=api_key) if api_key else None
         self.memory = ConversationBufferMemory(memory_key="chat_history")
         self.content_guidelines = self._load_content_guidelines()
+        self.content_scanner = self._compile_content_scanner()
         self.curated_content = {}
         self.content_metrics = {
             "scenarios_reviewed": 0,
@@ -68,24 +71,44 @@ class ContentCuratorAgent:
                 "min_choices_per_scene": 2,  # New requirement
                 "min_scenes_per_scenario": 3,  # New requirement
                 "required_elements": ["title", "description", "scenes", "choices"],
-                "forbidden_content": ["explicit_violence", "adult_themes", "discrimination"]
+                "forbidden_content": ["explicit_violence", "adult_themes", "discrimination"],
+                "filter_patterns": [
+                    "explicit", "adult", "inappropriate", "offensive",
+                    "discriminatory", "hate", "violence", "gore"
+                ]
             },
             "themes": {
                 "fantasy": {
                     "appropriate": ["magic", "adventure", "heroism", "quests", "dragons", "wizards", "enchanted"],
-                    "avoid": ["explicit_gore", "sexual_content", "real_world_politics"]
+                    "avoid": ["explicit_gore", "sexual_content", "real_world_politics"],
+                    "keywords": ["magic", "sword", "dragon", "elf", "dwarf"]
                 },
                 "warhammer_40k": {
                     "appropriate": ["grimdark", "war", "imperial_duty", "chaos", "space_marines", "xenos"],
-                    "avoid": ["explicit_torture", "real_world_religion", "excessive_gore"]
+                    "avoid": ["explicit_torture", "real_world_religion", "excessive_gore"],
+                    "keywords": ["space", "marine", "imperium", "chaos", "xenos"]
                 },
                 "cyberpunk": {
                     "appropriate": ["technology", "corporate_espionage", "hacking", "street_life", "neon", "cybernetics"],
-                    "avoid": ["explicit_violence", "drug_glorification", "real_world_crimes"]
+                    "avoid": ["explicit_violence", "drug_glorification", "real_world_crimes"],
+                    "keywords": ["cyber", "hack", "corporate", "neon", "tech"]
                 }
             }
         }
     
+    def _compile_content_scanner(self) -> ContentScanner:
+        """Compile every guideline keyword into a single scanner."""
+        quality_metrics = self.content_guidelines["quality_metrics"]
+        keywords = list(quality_metrics["forbidden_content"]) + list(quality_metrics["filter_patterns"])
+        for theme_guidelines in self.content_guidelines["themes"].values():
+            for group in ("appropriate", "avoid", "keywords"):
+                keywords.extend(theme_guidelines.get(group, []))
+        return ContentScanner(keywords)
+    
+    def scan_content(self, content: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Scan content text fields once; returns keyword -> field paths."""
+        return self.content_scanner.scan(content)
+    
     def _initialize_tools(self) -> List[Tool]:
         """Initialize agent tools."""
         return [
@@ -222,11 +245,14 @@ class ContentCuratorAgent:
         
         # Check for forbidden content
         forbidden_content = self.content_guidelines["quality_metrics"]["forbidden_content"]
-        content_text = str(content).lower()
+        content_hits = self.scan_content(content)
+        validation_result["content_hits"] = content_hits
         for forbidden in forbidden_content:
-            if forbidden in content_text:
+            if forbidden in content_hits:
                 validation_result["valid"] = False
-                validation_result["issues"].append(f"Forbidden content detected: {forbidden}")
+                validation_result["issues"].append(
+                    f"Forbidden content detected: {forbidden} (in {', '.join(content_hits[forbidden])})"
+                )
                 validation_result["rating"] = "rejected"
         
         # Theme-specific validation
@@ -237,7 +263,7 @@ class ContentCuratorAgent:
             if theme_guidelines:
                 # Check for appropriate content
                 appropriate_content = theme_guidelines.get("appropriate", [])
-                content_has_appropriate = any(appropriate in content_text for appropriate in appropriate_content)
+                content_has_appropriate = any(appropriate in content_hits for appropriate in appropriate_content)
                 
                 if not content_has_appropriate:
                     validation_result["suggestions"].append(f"Consider adding more {theme}-appropriate content")
@@ -245,7 +271,7 @@ class ContentCuratorAgent:
                 # Check for avoided content
                 avoid_content = theme_guidelines.get("avoid", [])
                 for avoid in avoid_content:
-                    if avoid in content_text:
+                    if avoid in content_hits:
                         validation_result["issues"].append(f"Avoided content for {theme}: {avoid}")
         
         # Update metrics
@@ -490,14 +516,10 @@ class ContentCuratorAgent:
         }
         
         # Check for inappropriate words/phrases
-        inappropriate_patterns = [
-            "explicit", "adult", "inappropriate", "offensive",
-            "discriminatory", "hate", "violence", "gore"
-        ]
-        
-        content_lower = content.lower()
+        inappropriate_patterns = self.content_guidelines["quality_metrics"]["filter_patterns"]
+        found_patterns = self.content_scanner.scan_text(content)
         for pattern in inappropriate_patterns:
-            if pattern in content_lower:
+            if pattern in found_patterns:
                 filter_result["filtered"] = True
                 filter_result["issues_found"].append(f"Inappropriate content: {pattern}")
                 filter_result["replacement_suggestions"].append(f"Replace '{pattern}' with appropriate alternative")
@@ -509,7 +531,7 @@ class ContentCuratorAgent:
         
         return filter_result
     
-    def _check_consistency(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_consistency(self, content: Dict[str, Any], content_hits: Dict[str, List[str]] = None) -> Dict[str, Any]:
         """Check content consistency and coherence."""
         logger.info("Checking content consistency")
         
@@ -538,16 +560,11 @@ class ContentCuratorAgent:
         # Check theme consistency
         if "theme" in content:
             theme = content["theme"]
-            theme_keywords = {
-                "fantasy": ["magic", "sword", "dragon", "elf", "dwarf"],
-                "warhammer_40k": ["space", "marine", "imperium", "chaos", "xenos"],
-                "cyberpunk": ["cyber", "hack", "corporate", "neon", "tech"]
-            }
-            
-            content_text = str(content).lower()
-            theme_words = theme_keywords.get(theme, [])
+            if content_hits is None:
+                content_hits = self.scan_content(content)
+            theme_words = self.content_guidelines["themes"].get(theme, {}).get("keywords", [])
             
-            theme_consistency = any(word in content_text for word in theme_words)
+            theme_consistency = any(word in content_hits for word in theme_words)
             if not theme_consistency:
                 consistency_result["suggestions"].append(f"Add more {theme}-themed content")
         
@@ -0,0 +1,109 @@
+"""
+Content Scanner
+
+Single-pass keyword scanning for curated content. A scenario is flattened
+into its text fields once, then every guideline keyword is located with one
+compiled pattern instead of one substring search per keyword.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# Fields are joined with a separator no keyword can span
+FIELD_SEPARATOR = "\n"
+
+
+class KeywordMatcher:
+    """
+    Compiled multi-keyword matcher with substring semantics.
+
+    Keywords are compiled into one longest-first regex alternation. Each
+    search reports the longest keyword at the leftmost position, and every
+    shorter keyword that is a prefix of it is reported alongside, so the
+    results are the same as running ``keyword in text`` for every keyword,
+    overlapping matches included.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the keyword set."""
+        self.keywords = sorted({k.lower() for k in keywords if k}, key=lambda k: (-len(k), k))
+        self._prefixes = {
+            keyword: [other for other in self.keywords if other != keyword and keyword.startswith(other)]
+            for keyword in self.keywords
+        }
+        self._regex = re.compile("|".join(re.escape(k) for k in self.keywords)) if self.keywords else None
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield ``(offset, keyword)`` for every keyword occurrence in lowercased text."""
+        if self._regex is None:
+            return
+        search = self._regex.search
+        match = search(text)
+        while match:
+            start = match.start()
+            keyword = match.group()
+            yield start, keyword
+            for prefix in self._prefixes[keyword]:
+                yield start, prefix
+            match = search(text, start + 1)
+
+    def find_all(self, text: str) -> set:
+        """Return the set of keywords present in text."""
+        return {keyword for _, keyword in self.iter_matches(text.lower())}
+
+
+def extract_text_fields(content: Any, path: str = "") -> List[Tuple[str, str]]:
+    """Flatten the string values of nested content into ``(path, lowercased text)`` pairs."""
+    fields: List[Tuple[str, str]] = []
+    stack = [(path, content)]
+    while stack:
+        current_path, value = stack.pop()
+        if isinstance(value, str):
+            if value:
+                fields.append((current_path, value.lower()))
+        elif isinstance(value, dict):
+            for key, child in reversed(list(value.items())):
+                stack.append((f"{current_path}.{key}" if current_path else str(key), child))
+        elif isinstance(value, (list, tuple)):
+            for index in range(len(value) - 1, -1, -1):
+                stack.append((f"{current_path}[{index}]", value[index]))
+    return fields
+
+
+class ContentScanner:
+    """Scans content for a fixed keyword set and reports hits with field paths."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the scanner for the given keywords."""
+        self.matcher = KeywordMatcher(keywords)
+
+    def scan(self, content: Any) -> Dict[str, List[str]]:
+        """
+        Scan every text field of content in a single pass.
+
+        Returns a mapping of keyword -> list of field paths it was found in,
+        in document order. Keywords without hits are omitted.
+        """
+        fields = extract_text_fields(content)
+        if not fields:
+            return {}
+
+        offsets = []
+        position = 0
+        for _, text in fields:
+            offsets.append(position)
+            position += len(text) + len(FIELD_SEPARATOR)
+        joined = FIELD_SEPARATOR.join(text for _, text in fields)
+
+        hits: Dict[str, List[str]] = {}
+        for start, keyword in self.matcher.iter_matches(joined):
+            field_path = fields[bisect_right(offsets, start) - 1][0]
+            paths = hits.setdefault(keyword, [])
+            if not paths or paths[-1] != field_path:
+                paths.append(field_path)
+        return hits
+
+    def scan_text(self, text: str) -> set:
+        """Return the set of keywords present in a plain string."""
+        return self.matcher.find_all(text)
@@ -15,6 +15,9 @@ from langchain.prompts import StringPromptTemplate
 from langchain_openai import OpenAI
 from langchain.chains import LLMChain
 
+from src.core.save_format import read_save, write_save
+from src.utils.expiry import ExpiryScheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,6 +40,8 @@ class GameStateAgent:
         self.llm = OpenAI(temperature=0.5, api_key=api_key) if api_key else None
         self.memory = ConversationBufferMemory(memory_key="chat_history")
         self.active_sessions = {}
+        # Active sessions ordered by created_at for age-based cleanup
+        self.session_expiry = ExpiryScheduler()
         self.game_rules = self._load_game_rules()
         self.analytics = {
             "sessions_created": 0,
@@ -179,6 +184,7 @@ class GameStateAgent:
         }
         
         self.active_sessions[session_id] = session
+        self.session_expiry.schedule(session_id, session["created_at"])
         self.analytics["sessions_created"] += 1
         
         logger.info(f"Session created: {session_id}")
@@ -207,13 +213,12 @@ class GameStateAgent:
         }
         
         # Save to file
-        filename = f"saves/save_{session_id}_{save_slot}.json"
+        filename = f"saves/save_{session_id}_{save_slot}.sav"
         try:
             import os
             os.makedirs("saves", exist_ok=True)
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            write_save(filename, save_data)
             
             logger.info(f"Game state saved to {filename}")
             return True
@@ -225,11 +230,15 @@ class GameStateAgent:
         """Load game state from save."""
         logger.info(f"Loading game state for session {session_id}")
         
-        filename = f"saves/save_{session_id}_{save_slot}.json"
+        filename = f"saves/save_{session_id}_{save_slot}.sav"
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            import os
+            if not os.path.exists(filename):
+                # Saves written before the binary format
+                filename = f"saves/save_{session_id}_{save_slot}.json"
+            
+            _, save_data = read_save(filename)
             
             # Update active session
             if session_id in self.active_sessions:
@@ -340,6 +349,7 @@ class GameStateAgent:
         
         # Remove from active sessions
         del self.active_sessions[session_id]
+        self.session_expiry.cancel(session_id)
         
         return True
     
@@ -5,18 +5,54 @@ AI Dungeon Master - Basit Flask Uygulaması
 
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
+from flask_socketio import emit, join_room as socket_join_room, leave_room as socket_leave_room
 from datetime import datetime
+import copy
 import json
 import os
 import time
 
+from src.combat.encounter_simulator import (
+    DEFAULT_FIGHTS, DEFAULT_MAX_ROUNDS, MAX_FIGHTS, Combatant, load_level_enemies, simulate_encounter,
+    standard_party
+)
+from src.core.dice_engine import DiceError, compile_dice
+from src.core.dice_probability import attack_odds, check_odds, distribution
+from src.multiplayer.connection_index import ConnectionIndex
+from src.multiplayer.message_bus import create_socketio
+from src.multiplayer.room_store import create_room_store
+from src.multiplayer.state_sync import patches_since, record_patch, snapshot
+from src.utils.player_state import DEFAULT_MAX_BYTES, DEFAULT_MAX_PLAYERS, PlayerStateManager
+from streaming_manager import streaming_manager
+
 app = Flask(__name__)
 CORS(app)
 
+# Socket.IO emits go through SOCKETIO_MESSAGE_QUEUE so rooms span workers
+socketio = create_socketio(app, cors_allowed_origins="*")
+
+# Canlı yayın sohbet/olay yayınları, ilk yayın başladığında tick döngüsüyle gönderilir
+streaming_manager.attach(socketio)
+
+# Multiplayer room state is shared by every worker through ROOM_STORE_URL
+room_store = create_room_store(os.environ.get('ROOM_STORE_URL'))
+
+# Oyuncu başına durum: aktif oyuncular bellekte, soğuk oyuncular diskte
+player_state = PlayerStateManager(
+    max_players=int(os.environ.get('PLAYER_STATE_MAX_PLAYERS', DEFAULT_MAX_PLAYERS)),
+    max_bytes=int(os.environ.get('PLAYER_STATE_MAX_BYTES', DEFAULT_MAX_BYTES))
+)
+
+@app.after_request
+def flush_player_state(response):
+    player_state.flush()
+    return response
+
 # Basit session manager
 class SimpleSessionManager:
     def __init__(self):
         self.sessions = {}
+        self.connections = ConnectionIndex()  # socket sid <-> player / room
     
     def create_session(self, session_id):
         self.sessions[session_id] = {"status": "active", "created": datetime.now()}
@@ -32,6 +68,11 @@ session_manager = SimpleSessionManager()
 def health_check():
     return jsonify({"status": "healthy", "message": "AI Dungeon Master is running!"})
 
+@app.route('/api/player_state/stats')
+def player_state_stats():
+    """Bellekteki ve diske taşınmış oyuncu sayıları"""
+    return jsonify({"success": True, "stats": player_state.stats()})
+
 @app.route('/')
 def index():
     return render_template('game_enhanced.html')
@@ -295,14 +336,20 @@ SCENARIOS = [
 # Hikaye sistemi verileri
 STORY_DATA = {
     "current_scenario": None,
-    "story_progress": {},
-    "npc_interactions": {},
-    "story_branches": {},
-    "story_combats": {},  # Hikaye savaşları için yeni alan
-    "npc_relationships": {},
-    "player_progress": {}
+    "story_progress": player_state.section("story_progress"),
+    "npc_interactions": player_state.section("npc_interactions"),
+    "story_branches": player_state.section("story_branches"),
+    "story_combats": player_state.section("story_combats"),  # Hikaye savaşları için yeni alan
+    "npc_relationships": player_state.section("npc_relationships"),
+    "player_progress": player_state.section("player_progress"),
+    "combat_history": player_state.section("combat_history"),
+    "inventory": player_state.section("inventory"),
+    "active_content": player_state.section("active_content")
 }
 
+# Karakter bilgileri (kullanıcı adına göre)
+CHARACTER_DATA = player_state.section("character")
+
 # NPC verileri
 NPC_DATA = {
     "dragon": {
@@ -371,8 +418,8 @@ NPC_DATA = {
     }
 }
 
-# Oyun kayıtları (gerçek uygulamada veritabanı kullanılır)
-GAME_SAVES = {}
+# Oyun kayıtları (kullanıcı adına göre)
+GAME_SAVES = player_state.section("saves")
 
 @app.route('/')
 def index():
@@ -946,6 +993,9 @@ def interact_with_npc(npc_id):
         interaction_type = data.get('interaction_type', 'greeting')
         username = data.get('username')
         
+        if not username:
+            return jsonify({"success": False, "error": "Kullanıcı adı gerekli"}), 400
+        
         npc = NPC_DATA.get(npc_id)
         if not npc:
             return jsonify({"success": False, "error": "NPC bulunamadı"}), 404
@@ -1317,6 +1367,40 @@ def start_combat():
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+@app.route('/api/combat/simulate', methods=['POST'])
+def simulate_combat():
+    """Monte Carlo karşılaşma dengesi simülasyonu"""
+    try:
+        data = request.get_json() or {}
+        fights = min(int(data.get('fights', DEFAULT_FIGHTS)), MAX_FIGHTS)
+        
+        # Düşmanlar: doğrudan stat listesi ya da senaryo seviyesi
+        if data.get('enemies'):
+            enemies = [Combatant.from_dict(enemy, is_player=False) for enemy in data['enemies']]
+            level = {}
+        elif data.get('scenario_id') and data.get('level_id'):
+            try:
+                enemies, level = load_level_enemies(data['scenario_id'], data['level_id'],
+                                                    include_boss=data.get('include_boss', True))
+            except KeyError as e:
+                return jsonify({"success": False, "error": e.args[0]}), 404
+        else:
+            return jsonify({"success": False, "error": "Düşman listesi ya da senaryo ve seviye ID gerekli"}), 400
+        
+        if data.get('party'):
+            party = [Combatant.from_dict(member, is_player=True) for member in data['party']]
+        else:
+            party = standard_party(int(data.get('party_size', 4)),
+                                   int(data.get('party_level', level.get('min_level', 1))))
+        
+        report = simulate_encounter(party, enemies, fights=fights,
+                                    max_rounds=int(data.get('max_rounds', DEFAULT_MAX_ROUNDS)), seed=data.get('seed'))
+        return jsonify({"success": True, "simulation": report})
+    except (KeyError, ValueError) as e:
+        return jsonify({"success": False, "error": f"Geçersiz simülasyon verisi: {e}"}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
 # Dice endpoints
 @app.route('/api/dice/roll', methods=['POST'])
 def roll_dice():
@@ -1324,25 +1408,50 @@ def roll_dice():
         data = request.get_json()
         dice = data.get('dice', '1d20')
         
-        # Basit zar atma simülasyonu
-        import random
-        if 'd' in dice:
-            num, sides = dice.split('d')
-            num = int(num) if num else 1
-            sides = int(sides)
-            result = sum(random.randint(1, sides) for _ in range(num))
-        else:
-            result = random.randint(1, 20)
+        try:
+            roll = compile_dice(dice).roll()
+        except DiceError:
+            return jsonify({"success": False, "error": f"Geçersiz zar ifadesi: {dice}"}), 400
+        result = roll.total
         
         return jsonify({
             "success": True,
             "dice": dice,
             "result": result,
+            "rolls": roll.rolls,
             "message": f"Zar atıldı: {result}"
         })
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+@app.route('/api/dice/odds', methods=['POST'])
+def dice_odds():
+    """Zar ifadeleri, saldırılar ve kontroller için kesin olasılıklar"""
+    try:
+        data = request.get_json() or {}
+        
+        if 'target_ac' in data:
+            odds = attack_odds(int(data.get('attack_bonus', 0)), int(data['target_ac']),
+                               data.get('damage_dice'), int(data.get('damage_bonus', 0)),
+                               data.get('attack_dice', '1d20'))
+        elif 'difficulty_class' in data:
+            odds = check_odds(int(data.get('bonus', 0)), int(data['difficulty_class']),
+                              data.get('dice', '1d20'))
+        else:
+            dice = data.get('dice', '1d20')
+            roll = distribution(dice)
+            odds = roll.to_dict()
+            if 'target' in data:
+                odds['chance_at_least'] = round(roll.probability_at_least(int(data['target'])), 6)
+        
+        return jsonify({"success": True, "odds": odds})
+    except DiceError as e:
+        return jsonify({"success": False, "error": f"Geçersiz zar ifadesi: {e}"}), 400
+    except (TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": f"Geçersiz veri: {e}"}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
 # Save/Load endpoints
 @app.route('/api/game/save', methods=['POST'])
 def save_game():
@@ -1398,9 +1507,15 @@ def load_game():
 @app.route('/api/game/saves/<username>')
 def get_saves(username):
     try:
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', 0, type=int)
+        
         if username in GAME_SAVES:
+            # En yeni kayıt önce
+            ordered = sorted(GAME_SAVES[username].items(), key=lambda item: item[1]['save_date'], reverse=True)
+            page = ordered[offset:offset + limit] if limit is not None else ordered[offset:]
             saves = []
-            for save_name, save_data in GAME_SAVES[username].items():
+            for save_name, save_data in page:
                 saves.append({
                     'save_name': save_name,
                     'save_date': save_data['save_date'],
@@ -1408,9 +1523,9 @@ def get_saves(username):
                     'level': save_data.get('stats', {}).get('level', 1),
                     'scenario': save_data.get('scenario', {}).get('title', 'Bilinmeyen')
                 })
-            return jsonify({"success": True, "saves": saves})
+            return jsonify({"success": True, "saves": saves, "total": len(ordered)})
         else:
-            return jsonify({"success": True, "saves": []})
+            return jsonify({"success": True, "saves": [], "total": 0})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -1563,26 +1678,31 @@ def create_room():
         if not room_id:
             room_id = f"room_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{creator_username}"
         
-        # Create session with room-specific data
-        session = session_manager.create_session(
-            name=room_name,
-            scenario_id=scenario_id,
-            max_players=max_players,
-            creator_id=creator_username
-        )
-        
-        # Add room-specific game state
-        session.game_state = {
+        # Room metadata and game state live in the shared room store
+        created = room_store.create(room_id, {
             'room_id': room_id,
-            'current_turn': 0,
-            'turn_order': [],
-            'current_player': None,
-            'game_phase': 'lobby',  # lobby, character_creation, in_game, combat
-            'scenario_progress': 0,
-            'shared_inventory': [],
-            'group_decisions': [],
-            'players': []
-        }
+            'room_name': room_name,
+            'scenario_id': scenario_id,
+            'max_players': max_players,
+            'creator': creator_username,
+            'status': 'lobby',
+            'state_version': 0,
+            'patches': [],
+            'game_state': {
+                'room_id': room_id,
+                'current_turn': 0,
+                'turn_order': [],
+                'current_player': None,
+                'game_phase': 'lobby',  # lobby, character_creation, in_game, combat
+                'scenario_progress': 0,
+                'shared_inventory': [],
+                'group_decisions': [],
+                'players': []
+            }
+        })
+        
+        if not created:
+            return jsonify({"success": False, "error": "Oda zaten mevcut"}), 409
         
         return jsonify({
             "success": True,
@@ -1594,6 +1714,59 @@ def create_room():
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+def update_room_state(room_id, mutator):
+    """Mutate a room and log the game_state patch; returns (room, result, patch) or None"""
+    def apply(room):
+        previous_state = copy.deepcopy(room['game_state'])
+        result = mutator(room)
+        return result, record_patch(room, previous_state)
+    
+    updated = room_store.update(room_id, apply)
+    if updated is None:
+        return None
+    room, (result, patch) = updated
+    return room, result, patch
+
+def broadcast_state_patch(room_id, patch):
+    """Send a game_state patch to everyone in the room"""
+    if patch:
+        socketio.emit('state_patch', {'room_id': room_id, **patch}, room=room_id)
+
+def add_room_player(room_id, player_id, player_name):
+    """Add a player to a room (or mark them online again); returns (room, error, patch)"""
+    def add_player(room):
+        players = room['game_state'].setdefault('players', [])
+        for player in players:
+            if player['id'] == player_id:
+                player['status'] = 'online'
+                return None
+        if len(players) >= room['max_players']:
+            return "Oda dolu"
+        players.append({
+            'id': player_id,
+            'name': player_name,
+            'status': 'online'
+        })
+        return None
+    
+    updated = update_room_state(room_id, add_player)
+    if updated is None:
+        return None, "Oda bulunamadı", None
+    return updated
+
+def remove_room_player(room_id, player_id):
+    """Remove a player from a room; returns (room, patch)"""
+    def remove_player(room):
+        room['game_state']['players'] = [
+            p for p in room['game_state'].get('players', [])
+            if p['id'] != player_id
+        ]
+    
+    updated = update_room_state(room_id, remove_player)
+    if updated is None:
+        return None, None
+    return updated[0], updated[2]
+
 @app.route('/api/multiplayer/join_room', methods=['POST'])
 def join_room():
     """Join an existing multiplayer room"""
@@ -1606,58 +1779,53 @@ def join_room():
         if not room_id:
             return jsonify({"success": False, "error": "Oda ID gerekli"}), 400
         
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
-        
-        if not session:
-            return jsonify({"success": False, "error": "Oda bulunamadı"}), 404
-        
-        # Check if room is full
-        if len(session.players) >= session.max_players:
-            return jsonify({"success": False, "error": "Oda dolu"}), 400
+        room, error, patch = add_room_player(room_id, player_id, player_name)
         
-        # Add player to session
-        result = session_manager.join_session(session.id, player_id, player_name)
+        if room is None:
+            return jsonify({"success": False, "error": error}), 404
+        if error:
+            return jsonify({"success": False, "error": error}), 400
         
-        if result['success']:
-            return jsonify({
-                "success": True,
-                "room_id": room_id,
-                "player_id": player_id,
-                "player_name": player_name,
-                "message": f"Odaya katıldınız: {session.name}"
-            })
-        else:
-            return jsonify({"success": False, "error": result['error']}), 400
+        broadcast_state_patch(room_id, patch)
+        return jsonify({
+            "success": True,
+            "room_id": room_id,
+            "player_id": player_id,
+            "player_name": player_name,
+            "message": f"Odaya katıldınız: {room['room_name']}"
+        })
             
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/multiplayer/room/<room_id>/status', methods=['GET'])
 def get_room_status(room_id):
-    """Get the current status of a multiplayer room"""
+    """Get the current status of a multiplayer room (only patches with ?since=<version>)"""
     try:
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
+        room = room_store.get_state(room_id)
         
-        if not session:
+        if not room:
             return jsonify({"success": False, "error": "Oda bulunamadı"}), 404
         
+        since = request.args.get('since', type=int)
+        patches = patches_since(room, since) if since is not None else None
+        if patches is not None:
+            return jsonify({
+                "success": True,
+                "room_id": room_id,
+                "version": room['state_version'],
+                "patches": patches,
+                "status": room['status']
+            })
+        
         return jsonify({
             "success": True,
             "room_id": room_id,
-            "room_name": session.name,
-            "players": session.players,
-            "game_state": session.game_state,
-            "status": session.status.value
+            "room_name": room['room_name'],
+            "version": room['state_version'],
+            "players": room['game_state'].get('players', []),
+            "game_state": room['game_state'],
+            "status": room['status']
         })
         
     except Exception as e:
@@ -1685,7 +1853,17 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection"""
     print(f"Client disconnected: {request.sid}")
-    # Player cleanup logic here
+    streaming_manager.disconnect(request.sid)
+    
+    player_id, room_id = session_manager.connections.remove_connection(request.sid)
+    if room_id and player_id:
+        room, patch = remove_room_player(room_id, player_id)
+        if room:
+            broadcast_state_patch(room_id, patch)
+            emit('player_left', {
+                'player_id': player_id,
+                'message': f'Oyuncu bağlantısı koptu'
+            }, room=room_id)
 
 @socketio.on('join_session')
 def handle_join_session(data):
@@ -1695,7 +1873,7 @@ def handle_join_session(data):
         player_id = data.get('player_id')
         username = data.get('username')
         
-        join_room(session_id)
+        socket_join_room(session_id)
         
         # Update session manager
         result = session_manager.join_session(session_id, player_id, username)
@@ -1733,7 +1911,7 @@ def handle_leave_session(data):
         player_id = data.get('player_id')
         username = data.get('username')
         
-        leave_room(session_id)
+        socket_leave_room(session_id)
         
         result = session_manager.leave_session(player_id)
         
@@ -1821,56 +1999,37 @@ def handle_join_room(data):
             })
             return
         
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
+        # Add player to the shared room state
+        room, error, patch = add_room_player(room_id, player_id, player_name)
         
-        if not session:
+        if error:
             emit('room_joined', {
                 'success': False,
-                'error': 'Oda bulunamadı'
+                'error': error
             })
             return
         
         # Join the room
-        join_room(room_id)
+        socket_join_room(room_id)
+        session_manager.connections.bind_player(request.sid, player_id)
+        session_manager.connections.join_session(request.sid, room_id)
         
-        # Add player to session
-        result = session_manager.join_session(session.id, player_id, player_name)
+        # The joining player gets a full snapshot, everyone else only the patch
+        emit('room_joined', {
+            'success': True,
+            'room_id': room_id,
+            'players': room['game_state']['players'],
+            'snapshot': snapshot(room),
+            'message': f"Odaya katıldınız: {room['room_name']}"
+        })
         
-        if result['success']:
-            # Update session game state
-            if 'players' not in session.game_state:
-                session.game_state['players'] = []
-            
-            session.game_state['players'].append({
-                'id': player_id,
-                'name': player_name,
-                'status': 'online'
-            })
-            
-            emit('room_joined', {
-                'success': True,
-                'room_id': room_id,
-                'players': session.game_state['players'],
-                'message': f'Odaya katıldınız: {session.name}'
-            }, room=room_id)
-            
-            # Broadcast to other players
-            emit('player_joined', {
-                'player_id': player_id,
-                'player_name': player_name,
-                'players': session.game_state['players'],
-                'message': f'{player_name} oyuna katıldı!'
-            }, room=room_id, include_self=False)
-        else:
-            emit('room_joined', {
-                'success': False,
-                'error': result['error']
-            })
+        # Broadcast to other players
+        broadcast_state_patch(room_id, patch)
+        emit('player_joined', {
+            'player_id': player_id,
+            'player_name': player_name,
+            'message': f'{player_name} oyuna katıldı!'
+        }, room=room_id, include_self=False)
     except Exception as e:
         emit('room_joined', {
             'success': False,
@@ -1884,55 +2043,97 @@ def handle_leave_room(data):
         room_id = data.get('room_id')
         player_id = data.get('player_id')
         
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
+        room, patch = remove_room_player(room_id, player_id) if room_id else (None, None)
         
-        if session and 'players' in session.game_state:
-            # Remove player from session
-            session.game_state['players'] = [
-                p for p in session.game_state['players'] 
-                if p['id'] != player_id
-            ]
-            
+        if room:
             # Broadcast to other players
+            broadcast_state_patch(room_id, patch)
             emit('player_left', {
                 'player_id': player_id,
-                'players': session.game_state['players'],
                 'message': f'Oyuncu oyundan ayrıldı'
             }, room=room_id)
         
-        leave_room(room_id)
+        session_manager.connections.leave_session(request.sid)
+        socket_leave_room(room_id)
         
     except Exception as e:
         print(f"Error leaving room: {e}")
 
+# Canlı yayın: izleyicinin soketi yayının odasına girer, 'stream_update' kareleri oraya gider
+@socketio.on('start_stream')
+def handle_start_stream(data):
+    """Start a live stream; the broadcaster's socket joins its room"""
+    broadcaster_id = data.get('broadcaster_id')
+    if not broadcaster_id:
+        emit('stream_started', {'success': False, 'error': 'Yayıncı ID gerekli'})
+        return
+    
+    stream_id = streaming_manager.create_stream(
+        broadcaster_id, data.get('broadcaster_name', broadcaster_id), data.get('title', 'Canlı Yayın'),
+        data.get('description', ''), data.get('game_scenario', ''), int(data.get('max_viewers', 100)))
+    socket_join_room(stream_id)
+    emit('stream_started', {'success': True, 'stream': streaming_manager.get_stream_info(stream_id)})
+
+@socketio.on('end_stream')
+def handle_end_stream(data):
+    """End a live stream (broadcaster only)"""
+    stream = streaming_manager.get_stream_info(data.get('stream_id'))
+    if not stream or stream['broadcaster_id'] != data.get('broadcaster_id'):
+        emit('stream_ended', {'success': False, 'error': 'Yayın bulunamadı'})
+        return
+    
+    emit('stream_ended', {'success': True, 'stream_id': stream['stream_id']}, room=stream['stream_id'])
+    streaming_manager.end_stream(stream['stream_id'])
+
+@socketio.on('join_stream')
+def handle_join_stream(data):
+    """Watch a live stream; frames are sent to this socket from then on"""
+    stream_id = data.get('stream_id')
+    viewer_id = data.get('viewer_id') or request.sid
+    if not streaming_manager.join_stream(stream_id, viewer_id, data.get('viewer_name', 'İzleyici'), request.sid):
+        emit('stream_joined', {'success': False, 'error': 'Yayına katılınamadı'})
+        return
+    
+    emit('stream_joined', {
+        'success': True,
+        'stream': streaming_manager.get_stream_info(stream_id),
+        'chat': streaming_manager.get_stream_chat(stream_id),
+        'events': streaming_manager.get_stream_events(stream_id)
+    })
+
+@socketio.on('leave_stream')
+def handle_leave_stream(data):
+    """Stop watching a stream"""
+    viewer_id = data.get('viewer_id') or request.sid
+    emit('stream_left', {'success': streaming_manager.leave_stream(viewer_id)})
+
+@socketio.on('stream_chat')
+def handle_stream_chat(data):
+    """Chat message to a stream; delivered with the next coalesced frame"""
+    message = str(data.get('message', '')).strip()
+    if message:
+        streaming_manager.add_chat_message(data.get('stream_id'), data.get('viewer_id') or request.sid,
+                                           data.get('viewer_name', 'İzleyici'), message)
+
 @socketio.on('start_game')
 def handle_start_game(data):
     """Handle starting a multiplayer game"""
     try:
         room_id = data.get('room_id')
         
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
+        def start(room):
+            room['status'] = 'in_game'
+            room['game_state']['game_phase'] = 'in_game'
+            room['game_state']['scenario_progress'] = 0
         
-        if not session:
+        updated = update_room_state(room_id, start)
+        if updated is None:
             emit('game_started', {
                 'success': False,
                 'error': 'Oda bulunamadı'
             })
             return
-        
-        # Update game state
-        session.game_state['game_phase'] = 'in_game'
-        session.game_state['scenario_progress'] = 0
+        broadcast_state_patch(room_id, updated[2])
         
         # Get initial scenario content
         from templates.game import advancedScenarios
@@ -1963,18 +2164,16 @@ def handle_make_choice(data):
         player_id = data.get('player_id')
         choice_id = data.get('choice_id')
         
-        # Find the session by room_id
-        session = None
-        for s in session_manager.sessions.values():
-            if s.game_state and s.game_state.get('room_id') == room_id:
-                session = s
-                break
+        # Update story progress (simplified for now)
+        def advance(room):
+            room['game_state']['scenario_progress'] += 1
+            return room['game_state']['scenario_progress']
         
-        if not session:
+        updated = update_room_state(room_id, advance)
+        if updated is None:
             return
-        
-        # Update story progress (simplified for now)
-        session.game_state['scenario_progress'] += 1
+        _, current_progress, patch = updated
+        broadcast_state_patch(room_id, patch)
         
         # Get next story content (simplified)
         from templates.game import advancedScenarios
@@ -1983,7 +2182,6 @@ def handle_make_choice(data):
         
         # Simple story progression
         story_nodes = ['start', 'explore_area', 'village_path', 'village_dialogue']
-        current_progress = session.game_state['scenario_progress']
         
         if current_progress < len(story_nodes):
             current_node = story_nodes[current_progress]
@@ -2001,6 +2199,22 @@ def handle_make_choice(data):
     except Exception as e:
         print(f"Error making choice: {e}")
 
+@socketio.on('sync_state')
+def handle_sync_state(data):
+    """Bring a client up to date: missing patches, or a snapshot if too far behind"""
+    room_id = data.get('room_id')
+    room = room_store.get_state(room_id) if room_id else None
+    if not room:
+        return
+    
+    patches = patches_since(room, data.get('version', -1))
+    if patches is None:
+        emit('state_snapshot', {'room_id': room_id, **snapshot(room)})
+        return
+    
+    for patch in patches:
+        emit('state_patch', {'room_id': room_id, **patch})
+
 @socketio.on('chat_message')
 def handle_chat_message(data):
     """Handle chat messages in room"""
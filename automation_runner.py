@@ -18,6 +18,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from agents.agent_orchestrator import AgentOrchestrator
+from agents.batch_curation import curate_library
 
 # Configure logging
 logging.basicConfig(
@@ -198,6 +199,17 @@ def main():
     print("🤖 AI Dungeon Master - Automation Runner")
     print("=" * 50)
     
+    if len(sys.argv) > 1 and sys.argv[1] == "--curate-library":
+        print("Curating scenario library...")
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        report = curate_library("data", max_workers=workers)
+        summary = report["summary"]
+        print(f"📚 {summary['scenarios']} scenarios in {summary['files']} files: "
+              f"{summary['curated']} curated, {summary['skipped_unchanged']} unchanged "
+              f"({report['duration_ms']} ms)")
+        print("✅ Curation completed!")
+        return
+    
     runner = AutomationRunner()
     
     if len(sys.argv) > 1 and sys.argv[1] == "--continuous":
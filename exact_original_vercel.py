@@ -5,6 +5,11 @@ import os
 import time
 import traceback
 from datetime import datetime
+
+from src.core.intent_classifier import classifier as intent_classifier
+
+# Hikaye seçimlerinde aranan niyetler, öncelik sırasıyla
+STORY_CHOICE_INTENTS = ("combat", "talk", "explore", "magic", "collect", "help")
 # import requests # Removed for Vercel compatibility
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
@@ -5277,41 +5282,42 @@ def make_story_choice(scenario_id):
         update_player_stats(user_id, "total_actions", 1)
         update_player_stats(user_id, "time_spent", 5)  # Her action 5 dakika
         
-        # Seçime göre spesifik action'lar
-        if any(word in choice_id.lower() for word in ["combat", "savaş", "fight", "attack", "battle"]):
+        # Seçime göre spesifik action'lar (seçim id'si tek seferde sınıflandırılır)
+        intent = intent_classifier.first(choice_id, STORY_CHOICE_INTENTS)
+        if intent == "combat":
             action_type = "combat"
             action_value = 3
             update_player_stats(user_id, "combat_skill", action_value)
             update_player_stats(user_id, "damage_dealt", action_value * 15)
             update_player_stats(user_id, "combat_won", 1)
             
-        elif any(word in choice_id.lower() for word in ["talk", "konuş", "negotiate", "speak", "conversation"]):
+        elif intent == "talk":
             action_type = "talk"
             action_value = 2
             update_player_stats(user_id, "charisma_skill", action_value)
-                update_player_stats(user_id, "conversations", 1)
+            update_player_stats(user_id, "conversations", 1)
             update_player_stats(user_id, "npc_interactions", 1)
             
-        elif any(word in choice_id.lower() for word in ["investigate", "araştır", "search", "explore", "look"]):
+        elif intent == "explore":
             action_type = "exploration"
             action_value = 2
             update_player_stats(user_id, "exploration_skill", action_value)
-                update_player_stats(user_id, "search_actions", 1)
+            update_player_stats(user_id, "search_actions", 1)
             update_player_stats(user_id, "locations_visited", 1)
             
-        elif any(word in choice_id.lower() for word in ["magic", "büyü", "spell", "cast"]):
+        elif intent == "magic":
             action_type = "magic"
             action_value = 3
             update_player_stats(user_id, "intelligence_skill", action_value)
-                update_player_stats(user_id, "puzzle_attempts", 1)
+            update_player_stats(user_id, "puzzle_attempts", 1)
             
-        elif any(word in choice_id.lower() for word in ["collect", "topla", "gather", "take", "grab"]):
+        elif intent == "collect":
             action_type = "collect"
             action_value = 1
             update_player_stats(user_id, "exploration_skill", 1)
-                update_player_stats(user_id, "items_collected", 1)
+            update_player_stats(user_id, "items_collected", 1)
             
-        elif any(word in choice_id.lower() for word in ["help", "yardım", "assist", "aid"]):
+        elif intent == "help":
             action_type = "help"
             action_value = 2
             update_player_stats(user_id, "charisma_skill", action_value)
@@ -5323,7 +5329,7 @@ def make_story_choice(scenario_id):
             action_value = 1
             update_player_stats(user_id, "exploration_skill", action_value)
         
-            action_recorded = True
+        action_recorded = True
         
         # Quest progress kontrol et - action'lar otomatik quest completion yapar
         quest_notifications = []
@@ -23,6 +23,7 @@ from core.inventory_system import InventorySystem
 from core.skill_system import SkillSystem
 from multiplayer.session_manager import MultiplayerSessionManager
 from ai.ai_learning_system import AILearningSystem
+from core.intent_classifier import classifier
 
 logger = logging.getLogger(__name__)
 
@@ -997,7 +998,7 @@ Her kararınız önemli, her seçiminiz sonuçları olacak."""
             action_description = action.get("description", "Bilinmeyen aksiyon")
             
             # Check if this is a combat action
-            if action_type == "combat" or "combat" in action_description.lower():
+            if action_type == "combat" or classifier.has(action_description, "combat"):
                 return self._process_combat_action(player, action, dice_result)
             
             # Regular action processing
@@ -12,12 +12,16 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any
 
+from src.utils.expiry import ExpiryScheduler
+
 class UserManager:
     """Manages user authentication and sessions"""
     
     def __init__(self):
         self.users_file = "data/users.json"
         self.sessions_file = "data/sessions.json"
+        # Sessions ordered by expires_at, so expiry only visits due ones
+        self.session_expiry = ExpiryScheduler()
         self._ensure_data_directory()
         self._load_users()
         self._load_sessions()
@@ -59,6 +63,31 @@ class UserManager:
         except Exception as e:
             print(f"Error loading sessions: {e}")
             self.sessions = {}
+        
+        for session_id, session in self.sessions.items():
+            self.session_expiry.schedule(session_id, session["expires_at"])
+    
+    def _add_session(self, session_id: str, session_data: Dict[str, Any]):
+        """Store a session and schedule its expiry"""
+        self.sessions[session_id] = session_data
+        self.session_expiry.schedule(session_id, session_data["expires_at"])
+    
+    def _expire_sessions(self) -> int:
+        """Remove expired sessions and the guest accounts they belonged to"""
+        expired = self.session_expiry.expire_due()
+        if not expired:
+            return 0
+        
+        guests_removed = False
+        for session_id in expired:
+            session = self.sessions.pop(session_id, None)
+            if session and session.get("is_guest"):
+                guests_removed = self.users.pop(session["username"], None) is not None or guests_removed
+        
+        self._save_sessions()
+        if guests_removed:
+            self._save_users()
+        return len(expired)
     
     def _save_sessions(self):
         """Save sessions to file"""
@@ -114,7 +143,7 @@ class UserManager:
                 "expires_at": (datetime.now() + timedelta(hours=24)).isoformat()
             }
             
-            self.sessions[session_id] = session_data
+            self._add_session(session_id, session_data)
             self._save_sessions()
             
             # Update last login
@@ -159,7 +188,7 @@ class UserManager:
                 "is_guest": True
             }
             
-            self.sessions[session_id] = session_data
+            self._add_session(session_id, session_data)
             self._save_sessions()
             
             return {
@@ -174,6 +203,7 @@ class UserManager:
     def verify_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Verify if a session is valid"""
         try:
+            self._expire_sessions()
             if session_id not in self.sessions:
                 return None
             
@@ -183,6 +213,7 @@ class UserManager:
             if datetime.now() > expires_at:
                 # Session expired
                 del self.sessions[session_id]
+                self.session_expiry.cancel(session_id)
                 self._save_sessions()
                 return None
             
@@ -196,6 +227,7 @@ class UserManager:
         try:
             if session_id in self.sessions:
                 del self.sessions[session_id]
+                self.session_expiry.cancel(session_id)
                 self._save_sessions()
                 return True
             return False
@@ -213,7 +245,7 @@ class UserManager:
                 "created_at": datetime.now().isoformat(),
                 "expires_at": (datetime.now() + timedelta(hours=24)).isoformat()
             }
-            self.sessions[session_id] = session_data
+            self._add_session(session_id, session_data)
             self._save_sessions()
             return session_id
         except Exception as e:
@@ -223,6 +255,7 @@ class UserManager:
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify a session token"""
         try:
+            self._expire_sessions()
             if token in self.sessions:
                 session = self.sessions[token]
                 expires_at = datetime.fromisoformat(session["expires_at"])
@@ -231,6 +264,7 @@ class UserManager:
                 else:
                     # Token expired, remove it
                     del self.sessions[token]
+                    self.session_expiry.cancel(token)
                     self._save_sessions()
             return None
         except Exception as e:
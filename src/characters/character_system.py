@@ -9,7 +9,7 @@ Handles character creation, classes, races, and character management.
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 
 @dataclass
@@ -57,6 +57,9 @@ class Character:
     skills: List[str]
     created_at: str
     last_updated: str
+    skill_points: int = 0
+    total_skill_points: int = 0
+    experience_to_next: int = 0
 
 class CharacterSystem:
     """Manages character creation and management"""
@@ -454,6 +457,33 @@ class CharacterSystem:
         self._save_characters()
         return True
     
+    def award_experience(self, awards: Union[int, Dict[str, int]], level_system,
+                         character_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Award XP to several characters through a LevelSystem and save once.
+        
+        awards is {character_id: xp}, or one XP amount for every id in
+        character_ids (e.g. a party's end-of-quest reward).
+        """
+        if not isinstance(awards, dict):
+            awards = dict.fromkeys(character_ids or [], awards)
+        
+        character_data = {character_id: asdict(self.characters[character_id])
+                           for character_id in awards if character_id in self.characters}
+        result = level_system.add_experience_batch(character_data, awards)
+        
+        now = datetime.now().isoformat()
+        for character_id in result["results"]:
+            character = self.characters[character_id]
+            for field, value in character_data[character_id].items():
+                if hasattr(character, field):
+                    setattr(character, field, value)
+            character.last_updated = now
+        
+        if result["results"]:
+            self._save_characters()
+        return result
+    
     def delete_character(self, character_id: str) -> bool:
         """Delete a character"""
         if character_id in self.characters:
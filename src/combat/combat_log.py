@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Combat Event Log
+================
+
+Append-only event stream per combat session (compact JSONL) for replaying
+fights exactly as they happened.
+
+Events:
+- snapshot: {"seq", "type": "snapshot", "seed", "state"} - full session
+  state; seq 0 is written when the fight starts, then every
+  SNAPSHOT_INTERVAL actions
+- action:   {"seq", "type": "action", "action", "actor", "target", "item",
+             "spell", "rolls", "ts"} - one combat action and every die it rolled
+
+All randomness of an action comes from action_rng(seed, seq), so replaying
+the events after a snapshot reproduces the fight without storing RNG state.
+"""
+
+import json
+import os
+import random
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SNAPSHOT_INTERVAL = 20
+_READ_BLOCK = 1 << 16
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class ReplayMismatch(Exception):
+    """Raised when a replayed action rolls different dice than were recorded"""
+
+
+def action_rng(seed: int, seq: int) -> random.Random:
+    """Deterministic RNG for event seq of a session"""
+    return random.Random(f"{seed}:{seq}")
+
+
+class RecordingRandom:
+    """Wraps a Random and records every randint result"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.rolls: List[int] = []
+
+    def randint(self, low: int, high: int) -> int:
+        value = self.rng.randint(low, high)
+        self.rolls.append(value)
+        return value
+
+
+def _reverse_lines(f) -> Iterator[bytes]:
+    """Lines of a binary file from last to first, reading fixed-size blocks backwards"""
+    position = f.seek(0, os.SEEK_END)
+    partial = b""
+    while position > 0:
+        step = min(_READ_BLOCK, position)
+        position -= step
+        f.seek(position)
+        lines = (f.read(step) + partial).split(b"\n")
+        # The first piece may continue in the previous block
+        partial = lines.pop(0)
+        yield from reversed(lines)
+    yield partial
+
+
+class CombatEventLog:
+    """Per-session JSONL event files"""
+
+    def __init__(self, directory: str = "data/combat_logs", snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, session_id: str) -> str:
+        if not _SAFE_ID.match(session_id) or session_id.startswith("."):
+            raise ValueError(f"Invalid session id: {session_id}")
+        return os.path.join(self.directory, f"{session_id}.jsonl")
+
+    def exists(self, session_id: str) -> bool:
+        return os.path.exists(self.path(session_id))
+
+    def _append(self, session_id: str, event: Dict[str, Any]):
+        with open(self.path(session_id), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def write_snapshot(self, session_id: str, seq: int, seed: int, state: Dict[str, Any]):
+        self._append(session_id, {"seq": seq, "type": "snapshot", "seed": seed, "state": state})
+
+    def write_action(self, session_id: str, seq: int, action: Dict[str, Any]):
+        self._append(session_id, {"seq": seq, "type": "action", **action})
+
+    def should_snapshot(self, seq: int) -> bool:
+        return seq % self.snapshot_interval == 0
+
+    def first_snapshot(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """The snapshot a session's log starts with (None if the log starts otherwise)"""
+        with open(self.path(session_id), 'rb') as f:
+            for line in f:
+                if line.strip():
+                    event = json.loads(line)
+                    return event if event["type"] == "snapshot" else None
+        return None
+
+    def read(self, session_id: str) -> List[Dict[str, Any]]:
+        """Every event of a session, in order"""
+        with open(self.path(session_id), 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def replay_window(self, session_id: str, upto_seq: Optional[int] = None, from_start: bool = False
+                      ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Nearest snapshot at or before upto_seq and the actions after it.
+
+        The file is read backwards in blocks and only the tail plus one
+        snapshot is read and parsed, so the cost depends on SNAPSHOT_INTERVAL,
+        not fight length (events after upto_seq are still read to get there).
+        from_start uses the first snapshot instead, to re-check every action.
+        """
+        if from_start:
+            events = self.read(session_id)
+            actions = [event for event in events if event["type"] == "action"
+                       and (upto_seq is None or event["seq"] <= upto_seq)]
+            return events[0], actions
+
+        tail = []
+        with open(self.path(session_id), 'rb') as f:
+            for line in _reverse_lines(f):
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if upto_seq is not None and event["seq"] > upto_seq:
+                    continue
+                if event["type"] == "snapshot":
+                    tail.reverse()
+                    return event, tail
+                tail.append(event)
+        raise ValueError(f"No snapshot found for {session_id}")
@@ -1,10 +1,17 @@
 import random
-import json
 import os
+import secrets
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from src.core.dice_engine import DiceError, compile_dice
+from src.core.dice_probability import attack_odds
+from src.utils.session_store import SessionStore
+
+from .combat_log import CombatEventLog, RecordingRandom, ReplayMismatch, action_rng
+
 class ActionType(Enum):
     ATTACK = "attack"
     DEFEND = "defend"
@@ -56,6 +63,8 @@ class CombatSession:
     round: int
     state: CombatState
     log: List[str] = None
+    seed: int = None
+    event_seq: int = 0
     
     def __post_init__(self):
         if self.log is None:
@@ -65,6 +74,14 @@ class CombatSystem:
     def __init__(self):
         self.combat_sessions_file = "data/combat_sessions.json"
         self._ensure_data_directory()
+        # Her aktif savaş kendi dosyasında; biten savaşlar arşive taşınır
+        self.session_store = SessionStore(
+            "data/combat_sessions",
+            "data/combat_sessions_archive.jsonl.gz",
+            legacy_file=self.combat_sessions_file,
+            legacy_filter=lambda record: "entities" in record
+        )
+        self.event_log = CombatEventLog()
         self._load_combat_sessions()
     
     def _ensure_data_directory(self):
@@ -73,45 +90,91 @@ class CombatSystem:
     
     def _load_combat_sessions(self):
         """Savaş oturumlarını dosyadan yükle"""
-        try:
-            if os.path.exists(self.combat_sessions_file):
-                with open(self.combat_sessions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.combat_sessions = {}
-                    for session_id, session_data in data.items():
-                        # Enum değerlerini geri yükle
-                        session_data['state'] = CombatState(session_data['state'])
-                        for entity_data in session_data['entities'].values():
-                            entity_data['action_type'] = ActionType(entity_data.get('action_type', 'attack'))
-                        self.combat_sessions[session_id] = CombatSession(**session_data)
+        self.combat_sessions = {}
+        for session_id, session_data in self.session_store.load_all().items():
+            try:
+                session = self._session_from_dict(session_data)
+            except Exception as e:
+                print(f"Savaş oturumu yükleme hatası ({session_id}): {e}")
+                continue
+            
+            if self._is_finished(session):
+                # Eski kayıtlardaki bitmiş savaşları arşivle
+                self.session_store.archive(session_id, session_data)
             else:
-                self.combat_sessions = {}
-        except Exception as e:
-            print(f"Savaş oturumu yükleme hatası: {e}")
-            self.combat_sessions = {}
+                self._ensure_event_log(session)
+                self.combat_sessions[session_id] = session
+    
+    @staticmethod
+    def _is_finished(session: CombatSession) -> bool:
+        return session.state in (CombatState.VICTORY, CombatState.DEFEAT)
+    
+    @staticmethod
+    def _session_to_dict(session: CombatSession) -> Dict[str, Any]:
+        session_dict = asdict(session)
+        session_dict['state'] = session.state.value
+        return session_dict
     
-    def _save_combat_sessions(self):
-        """Savaş oturumlarını dosyaya kaydet"""
+    @staticmethod
+    def _session_from_dict(session_data: Dict[str, Any]) -> CombatSession:
+        entity_fields = CombatEntity.__dataclass_fields__
+        entities = {
+            entity_id: CombatEntity(**{key: value for key, value in entity_data.items() if key in entity_fields})
+            for entity_id, entity_data in session_data['entities'].items()
+        }
+        return CombatSession(
+            id=session_data['id'],
+            entities=entities,
+            turn_order=list(session_data['turn_order']),
+            current_turn=session_data['current_turn'],
+            round=session_data['round'],
+            state=CombatState(session_data['state']),
+            log=list(session_data.get('log') or []),
+            seed=session_data.get('seed'),
+            event_seq=session_data.get('event_seq', 0)
+        )
+    
+    def _save_combat_session(self, session: CombatSession):
+        """Sadece değişen savaşı kaydet; biten savaşı arşive taşı"""
         try:
-            with open(self.combat_sessions_file, 'w', encoding='utf-8') as f:
-                data = {}
-                for session_id, session in self.combat_sessions.items():
-                    session_dict = asdict(session)
-                    session_dict['state'] = session.state.value
-                    # Enum değerlerini string'e çevir
-                    for entity_data in session_dict['entities'].values():
-                        if 'action_type' in entity_data and isinstance(entity_data['action_type'], ActionType):
-                            entity_data['action_type'] = entity_data['action_type'].value
-                    data[session_id] = session_dict
-                json.dump(data, f, indent=2)
+            session_dict = self._session_to_dict(session)
+            if self._is_finished(session):
+                self.session_store.archive(session.id, session_dict)
+                self.combat_sessions.pop(session.id, None)
+            else:
+                self.session_store.save(session.id, session_dict)
         except Exception as e:
             print(f"Savaş oturumu kaydetme hatası: {e}")
     
+    def _ensure_event_log(self, session: CombatSession):
+        """Olay kaydı olmayan (eski) savaşlar için başlangıç anlık görüntüsü yaz"""
+        if self.event_log.exists(session.id):
+            if session.seed is None:
+                # Kayıt yazılıp oturum kaydedilmeden önce süreç kapandı: seed kaydın ilk görüntüsünde
+                snapshot = self.event_log.first_snapshot(session.id)
+                session.seed = snapshot["seed"] if snapshot else secrets.randbits(32)
+            return
+        
+        if session.seed is None:
+            session.seed = secrets.randbits(32)
+        self.event_log.write_snapshot(session.id, session.event_seq, session.seed,
+                                      self._session_to_dict(session))
+        # Seed kayıttaki görüntüyle aynı kalsın diye oturumu hemen kaydet
+        self._save_combat_session(session)
+    
+    def _get_session(self, session_id: str) -> Optional[CombatSession]:
+        """Aktif savaş, yoksa arşivdeki son hali"""
+        session = self.combat_sessions.get(session_id)
+        if session:
+            return session
+        archived = self.session_store.load_archived(session_id)
+        return self._session_from_dict(archived) if archived else None
+    
     def start_combat(self, player_character: Dict[str, Any], enemies: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Savaş başlat"""
-        import secrets
-        
         session_id = f"combat_{secrets.token_hex(8)}"
+        seed = secrets.randbits(32)
+        rng = RecordingRandom(action_rng(seed, 0))
         
         # Oyuncu karakterini oluştur
         player_entity = CombatEntity(
@@ -122,7 +185,7 @@ class CombatSystem:
             armor_class=player_character["armor_class"],
             attack_bonus=player_character.get("attack_bonus", 5),
             damage_die=player_character.get("damage_die", "1d8"),
-            initiative=self._roll_initiative(player_character.get("dexterity", 10)),
+            initiative=self._roll_initiative(player_character.get("dexterity", 10), rng),
             is_player=True
         )
         
@@ -138,7 +201,7 @@ class CombatSystem:
                 armor_class=enemy_data["armor_class"],
                 attack_bonus=enemy_data.get("attack_bonus", 3),
                 damage_die=enemy_data.get("damage_die", "1d6"),
-                initiative=self._roll_initiative(enemy_data.get("dexterity", 10)),
+                initiative=self._roll_initiative(enemy_data.get("dexterity", 10), rng),
                 is_player=False
             )
             entities[enemy_id] = enemy_entity
@@ -153,11 +216,13 @@ class CombatSystem:
             turn_order=turn_order,
             current_turn=0,
             round=1,
-            state=CombatState.INITIATIVE
+            state=CombatState.INITIATIVE,
+            seed=seed
         )
         
         self.combat_sessions[session_id] = combat_session
-        self._save_combat_sessions()
+        self.event_log.write_snapshot(session_id, 0, seed, self._session_to_dict(combat_session))
+        self._save_combat_session(combat_session)
         
         return {
             "success": True,
@@ -171,10 +236,10 @@ class CombatSystem:
             "message": "Savaş başladı!"
         }
     
-    def _roll_initiative(self, dexterity: int) -> int:
+    def _roll_initiative(self, dexterity: int, rng=random) -> int:
         """Initiative roll"""
         modifier = (dexterity - 10) // 2
-        return random.randint(1, 20) + modifier
+        return rng.randint(1, 20) + modifier
     
     def _determine_turn_order(self, entities: Dict[str, CombatEntity]) -> List[str]:
         """Turn sırasını belirle"""
@@ -188,7 +253,7 @@ class CombatSystem:
     
     def get_combat_state(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Savaş durumunu getir"""
-        session = self.combat_sessions.get(session_id)
+        session = self._get_session(session_id)
         if not session:
             return None
         
@@ -229,19 +294,44 @@ class CombatSystem:
         if not current_entity.is_alive:
             return {"success": False, "error": "Ölü karakter aksiyon yapamaz"}
         
-        # Aksiyonu gerçekleştir
+        if action_type not in {action.value for action in ActionType}:
+            return {"success": False, "error": "Geçersiz aksiyon türü"}
+        
+        # Aksiyonun tüm zarları (seed, sıra) ile belirlenir ve kaydedilir
+        seq = session.event_seq + 1
+        rng = RecordingRandom(action_rng(session.seed, seq))
+        result = self._apply_action(session, current_entity_id, action_type, target_id, item_name, spell_name, rng)
+        
+        session.event_seq = seq
+        self.event_log.write_action(session_id, seq, {
+            "action": action_type,
+            "actor": current_entity_id,
+            "target": target_id,
+            "item": item_name,
+            "spell": spell_name,
+            "rolls": rng.rolls,
+            "ts": datetime.now().isoformat()
+        })
+        if self.event_log.should_snapshot(seq) or self._is_finished(session):
+            self.event_log.write_snapshot(session_id, seq, session.seed, self._session_to_dict(session))
+        
+        self._save_combat_session(session)
+        
+        return result
+    
+    def _apply_action(self, session: CombatSession, actor_id: str, action_type: str, target_id: str,
+                      item_name: str, spell_name: str, rng=random) -> Dict[str, Any]:
+        """Aksiyonu uygula, turn'ü ilerlet ve savaş sonunu kontrol et"""
         if action_type == ActionType.ATTACK.value:
-            result = self._perform_attack(session, current_entity_id, target_id)
+            result = self._perform_attack(session, actor_id, target_id, rng)
         elif action_type == ActionType.DEFEND.value:
-            result = self._perform_defend(session, current_entity_id)
+            result = self._perform_defend(session, actor_id)
         elif action_type == ActionType.SPELL.value:
-            result = self._perform_spell(session, current_entity_id, target_id, spell_name)
+            result = self._perform_spell(session, actor_id, target_id, spell_name)
         elif action_type == ActionType.ITEM.value:
-            result = self._perform_item(session, current_entity_id, item_name)
-        elif action_type == ActionType.FLEE.value:
-            result = self._perform_flee(session, current_entity_id)
+            result = self._perform_item(session, actor_id, item_name)
         else:
-            return {"success": False, "error": "Geçersiz aksiyon türü"}
+            result = self._perform_flee(session, actor_id, rng)
         
         # Turn'ü ilerlet
         self._advance_turn(session)
@@ -249,11 +339,32 @@ class CombatSystem:
         # Savaş durumunu kontrol et
         self._check_combat_end(session)
         
-        self._save_combat_sessions()
-        
         return result
     
-    def _perform_attack(self, session: CombatSession, attacker_id: str, target_id: str) -> Dict[str, Any]:
+    def replay_combat(self, session_id: str, upto_seq: int = None, verify: bool = True,
+                      from_start: bool = False) -> CombatSession:
+        """
+        Savaşı olay kaydından yeniden oluştur.
+        
+        En yakın anlık görüntüden (from_start ile ilk görüntüden) başlar ve
+        sonraki aksiyonları aynı zarlarla tekrar uygular. verify açıkken
+        kayıtlı zarlar tutmazsa ReplayMismatch.
+        """
+        snapshot, actions = self.event_log.replay_window(session_id, upto_seq, from_start)
+        session = self._session_from_dict(snapshot["state"])
+        session.seed = snapshot["seed"]
+        
+        for event in actions:
+            rng = RecordingRandom(action_rng(session.seed, event["seq"]))
+            self._apply_action(session, event["actor"], event["action"], event.get("target"),
+                               event.get("item"), event.get("spell"), rng)
+            session.event_seq = event["seq"]
+            if verify and rng.rolls != event["rolls"]:
+                raise ReplayMismatch(f"{session_id} olay {event['seq']}: zarlar kayıtla uyuşmuyor")
+        return session
+    
+    def _perform_attack(self, session: CombatSession, attacker_id: str, target_id: str,
+                        rng=random) -> Dict[str, Any]:
         """Saldırı gerçekleştir"""
         attacker = session.entities[attacker_id]
         target = session.entities.get(target_id)
@@ -262,11 +373,11 @@ class CombatSystem:
             return {"success": False, "error": "Geçersiz hedef"}
         
         # Saldırı rollü
-        attack_roll = random.randint(1, 20) + attacker.attack_bonus
+        attack_roll = rng.randint(1, 20) + attacker.attack_bonus
         
         if attack_roll >= target.armor_class:
             # Vuruş başarılı
-            damage = self._roll_damage(attacker.damage_die)
+            damage = self._roll_damage(attacker.damage_die, rng)
             target.health = max(0, target.health - damage)
             
             if target.health <= 0:
@@ -404,12 +515,12 @@ class CombatSystem:
                 "log": log_message
             }
     
-    def _perform_flee(self, session: CombatSession, entity_id: str) -> Dict[str, Any]:
+    def _perform_flee(self, session: CombatSession, entity_id: str, rng=random) -> Dict[str, Any]:
         """Kaçma denemesi"""
         entity = session.entities[entity_id]
         
         # Kaçma başarı şansı
-        flee_roll = random.randint(1, 20)
+        flee_roll = rng.randint(1, 20)
         if flee_roll >= 10:  # %50 şans
             log_message = f"{entity.name} başarıyla kaçtı!"
             session.log.append(log_message)
@@ -435,18 +546,12 @@ class CombatSystem:
                 "log": log_message
             }
     
-    def _roll_damage(self, damage_die: str) -> int:
+    def _roll_damage(self, damage_die: str, rng=random) -> int:
         """Hasar rollü"""
         try:
-            if "d" in damage_die:
-                num_dice, die_size = damage_die.split("d")
-                num_dice = int(num_dice) if num_dice else 1
-                die_size = int(die_size)
-                return sum(random.randint(1, die_size) for _ in range(num_dice))
-            else:
-                return int(damage_die)
-        except:
-            return random.randint(1, 8)
+            return compile_dice(str(damage_die)).roll_total(rng)
+        except DiceError:
+            return rng.randint(1, 8)
     
     def _advance_turn(self, session: CombatSession):
         """Turn'ü ilerlet"""
@@ -489,11 +594,18 @@ class CombatSystem:
         # Saldırı aksiyonları
         for entity_id, entity in session.entities.items():
             if entity_id != current_entity_id and entity.is_alive:
+                # Kesin isabet şansı ve beklenen hasar (simülasyon gerekmez)
+                try:
+                    odds = attack_odds(current_entity.attack_bonus, entity.armor_class, current_entity.damage_die)
+                except DiceError:
+                    odds = attack_odds(current_entity.attack_bonus, entity.armor_class, "1d8")
                 actions.append({
                     "type": "attack",
                     "target": entity_id,
                     "target_name": entity.name,
-                    "description": f"{entity.name}'a saldır"
+                    "description": f"{entity.name}'a saldır",
+                    "hit_chance": odds["hit_chance"],
+                    "expected_damage": odds["expected_damage"]
                 })
         
         # Savunma
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Encounter Simulator
+===================
+
+Headless Monte Carlo simulation of party-vs-enemies fights for encounter
+balancing. Uses the same rules as CombatSystem: initiative is d20 + DEX
+modifier rolled once per fight, every living combatant attacks the first
+living opponent on its turn, an attack hits when d20 + attack_bonus meets the
+target's armor class, and a fight ends as soon as one side is down.
+
+With NumPy installed every simulated fight is an array row: initiative,
+hit rolls, damage and HP updates are done for all fights at once. Without
+NumPy the same rules run fight by fight in pure Python.
+"""
+
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.core.dice_engine import DiceError, DiceExpression, compile_dice
+
+from .combat_system import CombatEntity
+
+SCENARIOS_FILE = "data/enhanced_scenarios.json"
+DEFAULT_FIGHTS = 100_000
+MAX_FIGHTS = 2_000_000
+DEFAULT_MAX_ROUNDS = 50
+# Fights simulated per array batch; bounds memory for very large runs
+CHUNK_SIZE = 100_000
+
+OUTCOME_WIN = 1
+OUTCOME_LOSS = -1
+OUTCOME_TIMEOUT = 0
+
+
+@dataclass
+class Combatant:
+    """Stat block of one simulated combatant"""
+    name: str
+    health: int
+    armor_class: int
+    attack_bonus: int
+    damage_die: str
+    dexterity: int = 10
+    is_player: bool = True
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], is_player: bool) -> "Combatant":
+        """Build from the dicts CombatSystem.start_combat accepts"""
+        return cls(
+            name=data.get("name", "Oyuncu" if is_player else "Düşman"),
+            health=int(data["health"]),
+            armor_class=int(data["armor_class"]),
+            attack_bonus=int(data.get("attack_bonus", 5 if is_player else 3)),
+            damage_die=data.get("damage_die", "1d8" if is_player else "1d6"),
+            dexterity=int(data.get("dexterity", 10)),
+            is_player=is_player
+        )
+
+    @classmethod
+    def from_entity(cls, entity: CombatEntity, dexterity: int = 10) -> "Combatant":
+        """Build from a live CombatEntity (current HP, not max HP)"""
+        return cls(
+            name=entity.name,
+            health=entity.health,
+            armor_class=entity.armor_class,
+            attack_bonus=entity.attack_bonus,
+            damage_die=entity.damage_die,
+            dexterity=dexterity,
+            is_player=entity.is_player
+        )
+
+
+def damage_expression(damage_die: str) -> DiceExpression:
+    """Compiled damage dice; invalid notation falls back to 1d8 like CombatSystem._roll_damage"""
+    try:
+        return compile_dice(str(damage_die))
+    except DiceError:
+        return compile_dice("1d8")
+
+
+def _dexterity_modifier(dexterity: int) -> int:
+    return (dexterity - 10) // 2
+
+
+# Enemy stats by level band; scenario levels only list enemy names
+def enemy_for_level(name: str, level: int, is_boss: bool = False) -> Combatant:
+    """Derive an enemy stat block from the level band it appears in"""
+    tier = max(1, level)
+    if is_boss:
+        return Combatant(
+            name=name,
+            health=20 + 10 * tier,
+            armor_class=13 + tier // 2,
+            attack_bonus=3 + tier // 2,
+            damage_die=f"1d10+{tier // 2 + 1}",
+            dexterity=12,
+            is_player=False
+        )
+    return Combatant(
+        name=name,
+        health=5 + 4 * tier,
+        armor_class=11 + tier // 3,
+        attack_bonus=2 + tier // 3,
+        damage_die=f"1d6+{tier // 3}" if tier >= 3 else "1d6",
+        dexterity=12,
+        is_player=False
+    )
+
+
+def standard_party(size: int = 4, level: int = 1) -> List[Combatant]:
+    """A balanced default party for a given character level"""
+    templates = [
+        ("Savaşçı", 12, 16, 2, "1d10", 12),
+        ("Haydut", 9, 14, 3, "1d8", 16),
+        ("Rahip", 8, 15, 1, "1d6", 10),
+        ("Büyücü", 6, 12, 2, "1d10", 14),
+    ]
+    party = []
+    for index in range(size):
+        name, hit_die, armor_class, attack_extra, damage_die, dexterity = templates[index % len(templates)]
+        if index >= len(templates):
+            name = f"{name} {index // len(templates) + 1}"
+        health = hit_die + 2 + (level - 1) * (hit_die // 2 + 2)
+        damage_bonus = 2 + level // 3
+        party.append(Combatant(
+            name=name,
+            health=health,
+            armor_class=armor_class,
+            attack_bonus=2 + (level - 1) // 4 + attack_extra,
+            damage_die=f"{damage_die}+{damage_bonus}",
+            dexterity=dexterity,
+            is_player=True
+        ))
+    return party
+
+
+def load_level_enemies(scenario_id: str, level_id: str, include_boss: bool = True,
+                       scenarios_file: str = SCENARIOS_FILE) -> Tuple[List[Combatant], Dict[str, Any]]:
+    """
+    Enemy stat blocks for one level of an enhanced scenario.
+
+    Enemies given as dicts use their own stats; enemies given by name get
+    stats derived from the level's min/max level band. Returns the enemies
+    and the level record.
+    """
+    with open(scenarios_file, 'r', encoding='utf-8') as f:
+        scenarios = json.load(f).get("enhanced_scenarios", {})
+
+    scenario = scenarios.get(scenario_id)
+    if not scenario:
+        raise KeyError(f"Senaryo bulunamadı: {scenario_id}")
+    level = scenario.get("levels", {}).get(level_id)
+    if not level:
+        raise KeyError(f"Seviye bulunamadı: {scenario_id}/{level_id}")
+
+    band = (level.get("min_level", 1) + level.get("max_level", level.get("min_level", 1))) // 2
+    enemies = []
+    for enemy in level.get("enemies", []):
+        if isinstance(enemy, dict):
+            enemies.append(Combatant.from_dict(enemy, is_player=False))
+        else:
+            enemies.append(enemy_for_level(enemy, band))
+
+    boss = level.get("boss")
+    if include_boss and boss:
+        if isinstance(boss, dict):
+            enemies.append(Combatant.from_dict(boss, is_player=False))
+        else:
+            enemies.append(enemy_for_level(boss, band, is_boss=True))
+    return enemies, level
+
+
+class _EncounterTotals:
+    """Outcome counters shared by both simulation engines"""
+
+    def __init__(self, party_size: int, max_rounds: int):
+        self.wins = 0
+        self.losses = 0
+        self.timeouts = 0
+        self.victory_rounds = [0] * (max_rounds + 1)
+        self.defeat_rounds = [0] * (max_rounds + 1)
+        self.hp_remaining = [0] * party_size
+        self.hp_remaining_on_win = [0] * party_size
+
+
+def _rounds_summary(histogram: List[int]) -> Dict[str, Any]:
+    total = sum(histogram)
+    if not total:
+        return {"mean": None, "p50": None, "p90": None, "distribution": {}}
+
+    mean = sum(rounds * count for rounds, count in enumerate(histogram)) / total
+    percentiles = {}
+    running = 0
+    for rounds, count in enumerate(histogram):
+        running += count
+        for name, share in (("p50", 0.5), ("p90", 0.9)):
+            if name not in percentiles and running >= share * total:
+                percentiles[name] = rounds
+    return {
+        "mean": round(mean, 3),
+        **percentiles,
+        "distribution": {str(rounds): round(count / total, 5) for rounds, count in enumerate(histogram) if count}
+    }
+
+
+def _simulate_python(combatants: List[Combatant], fights: int, max_rounds: int,
+                     seed: Optional[int]) -> _EncounterTotals:
+    rng = random.Random(seed)
+    randint = rng.randint
+    count = len(combatants)
+    players = [index for index, c in enumerate(combatants) if c.is_player]
+    enemies = [index for index, c in enumerate(combatants) if not c.is_player]
+    opponents = [enemies if c.is_player else players for c in combatants]
+    health = [c.health for c in combatants]
+    armor = [c.armor_class for c in combatants]
+    attack = [c.attack_bonus for c in combatants]
+    damage_dice = [damage_expression(c.damage_die) for c in combatants]
+    dex_mod = [_dexterity_modifier(c.dexterity) for c in combatants]
+    totals = _EncounterTotals(len(players), max_rounds)
+
+    for _ in range(fights):
+        initiative = [randint(1, 20) + dex_mod[index] for index in range(count)]
+        order = sorted(range(count), key=initiative.__getitem__, reverse=True)
+        hp = list(health)
+        outcome = OUTCOME_TIMEOUT
+        rounds = max_rounds
+
+        for current_round in range(1, max_rounds + 1):
+            for actor in order:
+                if hp[actor] <= 0:
+                    continue
+                target = next(index for index in opponents[actor] if hp[index] > 0)
+                if randint(1, 20) + attack[actor] < armor[target]:
+                    continue
+
+                damage = damage_dice[actor].roll_total(rng)
+                hp[target] = max(0, hp[target] - max(0, damage))
+
+                if hp[target] == 0:
+                    if not any(hp[index] > 0 for index in players):
+                        outcome = OUTCOME_LOSS
+                    elif not any(hp[index] > 0 for index in enemies):
+                        outcome = OUTCOME_WIN
+                    if outcome != OUTCOME_TIMEOUT:
+                        break
+            if outcome != OUTCOME_TIMEOUT:
+                rounds = current_round
+                break
+
+        if outcome == OUTCOME_WIN:
+            totals.wins += 1
+            totals.victory_rounds[rounds] += 1
+        elif outcome == OUTCOME_LOSS:
+            totals.losses += 1
+            totals.defeat_rounds[rounds] += 1
+        else:
+            totals.timeouts += 1
+        for slot, index in enumerate(players):
+            totals.hp_remaining[slot] += hp[index]
+            if outcome == OUTCOME_WIN:
+                totals.hp_remaining_on_win[slot] += hp[index]
+    return totals
+
+
+def _simulate_numpy(combatants: List[Combatant], fights: int, max_rounds: int,
+                    seed: Optional[int]) -> _EncounterTotals:
+    rng = np.random.default_rng(seed)
+    count = len(combatants)
+    is_player = np.array([c.is_player for c in combatants])
+    players = np.flatnonzero(is_player)
+    enemies = np.flatnonzero(~is_player)
+    health = np.array([c.health for c in combatants], dtype=np.int64)
+    armor = np.array([c.armor_class for c in combatants], dtype=np.int64)
+    attack = np.array([c.attack_bonus for c in combatants], dtype=np.int64)
+    dex_mod = np.array([_dexterity_modifier(c.dexterity) for c in combatants], dtype=np.int64)
+    damage_dice = [damage_expression(c.damage_die) for c in combatants]
+    # opponent_mask[a, t]: t is on the other side from a
+    opponent_mask = is_player[:, None] != is_player[None, :]
+    totals = _EncounterTotals(len(players), max_rounds)
+
+    for start in range(0, fights, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, fights - start)
+        initiative = rng.integers(1, 21, (size, count)) + dex_mod
+        # Stable sort keeps entity order on ties, like sorted(..., reverse=True)
+        order = np.argsort(-initiative, axis=1, kind="stable")
+        hp = np.tile(health, (size, 1))
+        fight_ids = np.arange(size)
+
+        outcome = np.zeros(size, dtype=np.int8)
+        rounds = np.full(size, max_rounds, dtype=np.int64)
+        final_hp = np.empty((size, count), dtype=np.int64)
+
+        for current_round in range(1, max_rounds + 1):
+            live = len(hp)
+            rows = np.arange(live)
+            finished = np.zeros(live, dtype=bool)
+
+            for slot in range(count):
+                actor = order[:, slot]
+                # First living opponent; argmax returns the first True column
+                targetable = (hp > 0) & opponent_mask[actor]
+                target = targetable.argmax(axis=1)
+                acting = ~finished & (hp[rows, actor] > 0) & targetable[rows, target]
+
+                hit = acting & (rng.integers(1, 21, live) + attack[actor] >= armor[target])
+                hit_rows = np.flatnonzero(hit)
+                if not len(hit_rows):
+                    continue
+
+                damage = np.empty(len(hit_rows), dtype=np.int64)
+                hit_actors = actor[hit_rows]
+                for index, expression in enumerate(damage_dice):
+                    selected = hit_actors == index
+                    selected_count = np.count_nonzero(selected)
+                    if selected_count:
+                        damage[selected] = expression.roll_array(selected_count, rng)
+
+                hit_targets = target[hit_rows]
+                hp[hit_rows, hit_targets] = np.maximum(hp[hit_rows, hit_targets] - np.maximum(damage, 0), 0)
+
+                # Only fights where a target dropped can have ended
+                dropped = hit_rows[hp[hit_rows, hit_targets] == 0]
+                if not len(dropped):
+                    continue
+                party_up = (hp[dropped][:, players] > 0).any(axis=1)
+                enemies_up = (hp[dropped][:, enemies] > 0).any(axis=1)
+                ended = dropped[~(party_up & enemies_up)]
+                if not len(ended):
+                    continue
+                won = ~(hp[ended][:, enemies] > 0).any(axis=1)
+                ids = fight_ids[ended]
+                outcome[ids] = np.where(won, OUTCOME_WIN, OUTCOME_LOSS)
+                rounds[ids] = current_round
+                final_hp[ids] = hp[ended]
+                finished[ended] = True
+
+            # Drop finished fights so later rounds only touch live ones
+            if finished.any():
+                keep = ~finished
+                hp, order, fight_ids = hp[keep], order[keep], fight_ids[keep]
+            if not len(hp):
+                break
+        final_hp[fight_ids] = hp
+
+        wins = outcome == OUTCOME_WIN
+        losses = outcome == OUTCOME_LOSS
+        totals.wins += int(np.count_nonzero(wins))
+        totals.losses += int(np.count_nonzero(losses))
+        totals.timeouts += int(size - np.count_nonzero(wins) - np.count_nonzero(losses))
+        for histogram, mask in ((totals.victory_rounds, wins), (totals.defeat_rounds, losses)):
+            for rounds_taken, rounds_count in enumerate(np.bincount(rounds[mask], minlength=max_rounds + 1)):
+                histogram[rounds_taken] += int(rounds_count)
+        party_hp = final_hp[:, players]
+        for slot in range(len(players)):
+            totals.hp_remaining[slot] += int(party_hp[:, slot].sum())
+            totals.hp_remaining_on_win[slot] += int(party_hp[wins, slot].sum())
+    return totals
+
+
+def simulate_encounter(party: List[Combatant], enemies: List[Combatant], fights: int = DEFAULT_FIGHTS,
+                       max_rounds: int = DEFAULT_MAX_ROUNDS, seed: Optional[int] = None,
+                       use_numpy: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Simulate fights between party and enemies and summarize the outcomes.
+
+    Fights still running after max_rounds count as timeouts. use_numpy=None
+    picks the vectorized engine whenever NumPy is installed.
+    """
+    if not party or not enemies:
+        raise ValueError("Simülasyon için en az bir oyuncu ve bir düşman gerekli")
+    if fights < 1 or max_rounds < 1:
+        raise ValueError("fights ve max_rounds pozitif olmalı")
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy yüklü değil")
+
+    party = [Combatant(**{**c.__dict__, "is_player": True}) for c in party]
+    enemies = [Combatant(**{**c.__dict__, "is_player": False}) for c in enemies]
+    combatants = party + enemies
+    vectorized = np is not None if use_numpy is None else use_numpy
+
+    started = time.perf_counter()
+    engine = _simulate_numpy if vectorized else _simulate_python
+    totals = engine(combatants, fights, max_rounds, seed)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "fights": fights,
+        "engine": "numpy" if vectorized else "python",
+        "elapsed_seconds": round(elapsed, 4),
+        "fights_per_second": round(fights / elapsed) if elapsed > 0 else None,
+        "win_rate": round(totals.wins / fights, 5),
+        "loss_rate": round(totals.losses / fights, 5),
+        "timeout_rate": round(totals.timeouts / fights, 5),
+        "rounds_to_victory": _rounds_summary(totals.victory_rounds),
+        "rounds_to_defeat": _rounds_summary(totals.defeat_rounds),
+        "party": [
+            {
+                "name": member.name,
+                "max_health": member.health,
+                "expected_hp_remaining": round(totals.hp_remaining[slot] / fights, 3),
+                "expected_hp_remaining_on_win": round(totals.hp_remaining_on_win[slot] / totals.wins, 3)
+                if totals.wins else None
+            }
+            for slot, member in enumerate(party)
+        ],
+        "expected_party_hp_ratio": round(sum(totals.hp_remaining) / fights / sum(m.health for m in party), 5),
+        "enemies": [member.__dict__ for member in enemies]
+    }
@@ -4,53 +4,138 @@ Betrayal System
 ==============
 
 Handles betrayal mechanics and plot twists.
+
+Player decisions are appended to one JSONL log per session
+(data/betrayal_decisions/<session>.jsonl) and folded into per-session
+running aggregates (count, sum, max and a recent window of betrayal
+potential), so recording a decision and checking a session's triggers
+cost the same however many sessions and decisions exist.
 """
 
 import json
+import os
 import random
+import re
+import uuid
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from src.core.intent_classifier import classifier
+
+# Betrayal potential added by a decision's intent, checked in this order
+DECISION_INTENT_POTENTIAL = {"kill": 30, "steal": 20, "deceive": 40, "help": -10, "protect": -10}
+
+# Decisions counted in a session's recent-window statistics
+RECENT_WINDOW = 10
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+class SessionBetrayalStats:
+    """Running betrayal-potential aggregates of one session"""
+    
+    __slots__ = ("count", "total", "max_potential", "recent", "recent_total")
+    
+    def __init__(self, window: int = RECENT_WINDOW):
+        self.count = 0
+        self.total = 0
+        self.max_potential: Optional[int] = None  # None until the first decision
+        self.recent = deque(maxlen=window)
+        self.recent_total = 0
+    
+    def add(self, potential: int):
+        self.count += 1
+        self.total += potential
+        self.max_potential = potential if self.max_potential is None else max(self.max_potential, potential)
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_total -= self.recent[0]
+        self.recent.append(potential)
+        self.recent_total += potential
+    
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0
+    
+    @property
+    def recent_average(self) -> float:
+        return self.recent_total / len(self.recent) if self.recent else 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_decisions": self.count,
+            "total_betrayal_potential": self.total,
+            "average_betrayal_potential": self.average,
+            "recent_average_betrayal_potential": self.recent_average,
+            "max_betrayal_potential": self.max_potential
+        }
+
 class BetrayalSystem:
     """Manages betrayal mechanics and plot twists"""
     
     def __init__(self):
-        self.betrayals_file = "data/betrayals.json"
+        self.betrayals_file = "data/betrayals.json"  # Legacy single-file decision store
+        self.decisions_dir = "data/betrayal_decisions"
         self.plot_twists_file = "data/plot_twists.json"
+        self.session_stats: Dict[str, SessionBetrayalStats] = {}
         self._ensure_data_directory()
-        self._load_betrayals()
         self._load_plot_twists()
     
     def _ensure_data_directory(self):
         """Ensure data directory exists"""
-        import os
         os.makedirs("data", exist_ok=True)
+        if not os.path.isdir(self.decisions_dir):
+            os.makedirs(self.decisions_dir, exist_ok=True)
+            self._migrate_betrayals()
     
-    def _load_betrayals(self):
-        """Load betrayals from file"""
+    def _migrate_betrayals(self):
+        """Move decisions from the legacy betrayals.json into per-session logs (first run only)"""
         try:
-            import os
-            if os.path.exists(self.betrayals_file):
-                with open(self.betrayals_file, 'r', encoding='utf-8') as f:
-                    self.betrayals = json.load(f)
-            else:
-                self.betrayals = {}
+            if not os.path.exists(self.betrayals_file):
+                return
+            with open(self.betrayals_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            for decision_data in legacy.values():
+                self._append_decision(decision_data.get("session_id", "unknown"), decision_data)
         except Exception as e:
-            print(f"Error loading betrayals: {e}")
-            self.betrayals = {}
+            print(f"Error migrating betrayals: {e}")
+    
+    def _decision_log(self, session_id: str) -> str:
+        """Log file of a session; unsafe session ids are hex encoded behind '%'"""
+        if _SAFE_ID.match(session_id) and not session_id.startswith("."):
+            name = session_id
+        else:
+            name = "%" + session_id.encode("utf-8").hex()
+        return os.path.join(self.decisions_dir, f"{name}.jsonl")
     
-    def _save_betrayals(self):
-        """Save betrayals to file"""
+    def _append_decision(self, session_id: str, decision_data: Dict[str, Any]):
+        with open(self._decision_log(session_id), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(decision_data, ensure_ascii=False, separators=(",", ":")) + "\n")
+    
+    def get_session_decisions(self, session_id: str) -> List[Dict[str, Any]]:
+        """Every decision recorded for a session, oldest first"""
+        path = self._decision_log(session_id)
+        if not os.path.exists(path):
+            return []
         try:
-            with open(self.betrayals_file, 'w', encoding='utf-8') as f:
-                json.dump(self.betrayals, f, indent=2, ensure_ascii=False)
+            with open(path, 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
         except Exception as e:
-            print(f"Error saving betrayals: {e}")
+            print(f"Error loading betrayal decisions for {session_id}: {e}")
+            return []
+    
+    def get_session_stats(self, session_id: str) -> SessionBetrayalStats:
+        """Running aggregates of a session, built from its log the first time it is used"""
+        stats = self.session_stats.get(session_id)
+        if stats is None:
+            stats = SessionBetrayalStats()
+            for decision_data in self.get_session_decisions(session_id):
+                stats.add(decision_data.get("betrayal_potential", 0))
+            self.session_stats[session_id] = stats
+        return stats
     
     def _load_plot_twists(self):
         """Load plot twists from file"""
         try:
-            import os
             if os.path.exists(self.plot_twists_file):
                 with open(self.plot_twists_file, 'r', encoding='utf-8') as f:
                     self.plot_twists = json.load(f)
@@ -72,7 +157,7 @@ class BetrayalSystem:
                              moral_alignment: str = "neutral") -> Dict[str, Any]:
         """Record a player decision for betrayal analysis"""
         try:
-            decision_id = f"decision_{len(self.betrayals) + 1}"
+            decision_id = f"decision_{uuid.uuid4().hex[:16]}"
             now = datetime.now().isoformat()
             
             decision_data = {
@@ -84,8 +169,9 @@ class BetrayalSystem:
                 "betrayal_potential": self._calculate_betrayal_potential(decision, moral_alignment)
             }
             
-            self.betrayals[decision_id] = decision_data
-            self._save_betrayals()
+            stats = self.get_session_stats(session_id)
+            self._append_decision(session_id, decision_data)
+            stats.add(decision_data["betrayal_potential"])
             
             return {
                 "success": True,
@@ -101,16 +187,9 @@ class BetrayalSystem:
         potential = 0
         
         # Decision-based analysis
-        decision_lower = decision.lower()
-        
-        if any(word in decision_lower for word in ["kill", "murder", "assassinate"]):
-            potential += 30
-        elif any(word in decision_lower for word in ["steal", "rob", "thief"]):
-            potential += 20
-        elif any(word in decision_lower for word in ["betray", "deceive", "lie"]):
-            potential += 40
-        elif any(word in decision_lower for word in ["help", "save", "protect"]):
-            potential -= 10
+        intent = classifier.first(decision, DECISION_INTENT_POTENTIAL)
+        if intent:
+            potential += DECISION_INTENT_POTENTIAL[intent]
         
         # Alignment-based modifiers
         if moral_alignment == "evil":
@@ -125,18 +204,12 @@ class BetrayalSystem:
     def check_plot_twist_triggers(self, session_id: str) -> Dict[str, Any]:
         """Check if any plot twists should be triggered"""
         try:
-            # Get all decisions for this session
-            session_decisions = [
-                decision for decision in self.betrayals.values()
-                if decision.get("session_id") == session_id
-            ]
+            stats = self.get_session_stats(session_id)
             
-            if not session_decisions:
+            if not stats.count:
                 return {"success": True, "plot_twists": []}
             
-            # Calculate total betrayal potential
-            total_potential = sum(d.get("betrayal_potential", 0) for d in session_decisions)
-            average_potential = total_potential / len(session_decisions)
+            average_potential = stats.average
             
             # Check for plot twist triggers
             triggered_twists = []
@@ -151,8 +224,9 @@ class BetrayalSystem:
             return {
                 "success": True,
                 "average_betrayal_potential": average_potential,
+                "recent_average_betrayal_potential": stats.recent_average,
                 "plot_twists": triggered_twists,
-                "total_decisions": len(session_decisions)
+                "total_decisions": stats.count
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -287,25 +361,18 @@ class BetrayalSystem:
     def get_betrayal_summary(self, session_id: str) -> Dict[str, Any]:
         """Get a summary of betrayals for a session"""
         try:
-            session_decisions = [
-                decision for decision in self.betrayals.values()
-                if decision.get("session_id") == session_id
-            ]
+            session_decisions = self.get_session_decisions(session_id)
             
             session_twists = [
                 twist for twist in self.plot_twists.values()
                 if twist.get("session_id") == session_id
             ]
             
-            total_potential = sum(d.get("betrayal_potential", 0) for d in session_decisions)
-            average_potential = total_potential / len(session_decisions) if session_decisions else 0
-            
             return {
                 "success": True,
                 "session_id": session_id,
-                "total_decisions": len(session_decisions),
+                **self.get_session_stats(session_id).to_dict(),
                 "total_plot_twists": len(session_twists),
-                "average_betrayal_potential": average_potential,
                 "decisions": session_decisions,
                 "plot_twists": session_twists
             }
@@ -6,18 +6,26 @@ Combat System
 Handles turn-based combat mechanics.
 """
 
-import json
-import random
 import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from .dice_engine import DiceError, compile_dice
+from src.utils.session_store import SessionStore
+
 class CombatSystem:
     """Manages turn-based combat mechanics"""
     
     def __init__(self):
         self.combats_file = "data/combat_sessions.json"
         self._ensure_data_directory()
+        # One file per active combat; finished combats go to a compressed archive
+        self.combat_store = SessionStore(
+            "data/combats",
+            "data/combats_archive.jsonl.gz",
+            legacy_file=self.combats_file,
+            legacy_filter=lambda record: "participants" in record
+        )
         self._load_combats()
     
     def _ensure_data_directory(self):
@@ -26,25 +34,20 @@ class CombatSystem:
         os.makedirs("data", exist_ok=True)
     
     def _load_combats(self):
-        """Load combat sessions from file"""
-        try:
-            import os
-            if os.path.exists(self.combats_file):
-                with open(self.combats_file, 'r', encoding='utf-8') as f:
-                    self.combats = json.load(f)
+        """Load active combat sessions"""
+        self.combats = {}
+        for combat_id, combat in self.combat_store.load_all().items():
+            if combat.get("status") == "finished":
+                self.combat_store.archive(combat_id, combat)
             else:
-                self.combats = {}
-        except Exception as e:
-            print(f"Error loading combat sessions: {e}")
-            self.combats = {}
+                self.combats[combat_id] = combat
     
-    def _save_combats(self):
-        """Save combat sessions to file"""
+    def _save_combat(self, combat_id: str):
+        """Save a single combat session"""
         try:
-            with open(self.combats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.combats, f, indent=2, ensure_ascii=False)
+            self.combat_store.save(combat_id, self.combats[combat_id])
         except Exception as e:
-            print(f"Error saving combat sessions: {e}")
+            print(f"Error saving combat session: {e}")
     
     def add_participant(self, combat_id: str, participant: Dict[str, Any]) -> Dict[str, Any]:
         """Add a participant to an existing combat"""
@@ -65,7 +68,7 @@ class CombatSystem:
             combat["turn_order"] = [p["id"] for p in combat["participants"]]
             
             combat["last_updated"] = datetime.now().isoformat()
-            self._save_combats()
+            self._save_combat(combat_id)
             
             return {
                 "success": True,
@@ -104,7 +107,7 @@ class CombatSystem:
             }
             
             self.combats[combat_id] = combat_data
-            self._save_combats()
+            self._save_combat(combat_id)
             
             return {
                 "success": True,
@@ -116,8 +119,11 @@ class CombatSystem:
             return {"success": False, "error": str(e)}
     
     def get_combat_state(self, combat_id: str) -> Optional[Dict[str, Any]]:
-        """Get combat state by ID"""
-        return self.combats.get(combat_id)
+        """Get combat state by ID (finished combats come from the archive)"""
+        combat = self.combats.get(combat_id)
+        if combat is None:
+            combat = self.combat_store.load_archived(combat_id)
+        return combat
     
     def perform_combat_action(self, combat_id: str, character_id: str, 
                             action_type: str, target_id: str = None) -> Dict[str, Any]:
@@ -162,7 +168,7 @@ class CombatSystem:
             combat["round"] += 1
         
         combat["last_updated"] = datetime.now().isoformat()
-        self._save_combats()
+        self._save_combat(combat_id)
         
         return {
             "success": True,
@@ -290,22 +296,8 @@ class CombatSystem:
     def roll_dice(self, dice_notation: str) -> int:
         """Roll dice using notation like '2d6', '1d20', etc."""
         try:
-            if "d" not in dice_notation:
-                return int(dice_notation)
-            
-            parts = dice_notation.split("d")
-            if len(parts) != 2:
-                return 0
-            
-            num_dice = int(parts[0])
-            dice_size = int(parts[1])
-            
-            total = 0
-            for _ in range(num_dice):
-                total += random.randint(1, dice_size)
-            
-            return total
-        except:
+            return compile_dice(dice_notation).roll_total()
+        except DiceError:
             return 0
     
     def end_combat(self, combat_id: str) -> bool:
@@ -316,5 +308,9 @@ class CombatSystem:
         
         combat["status"] = "finished"
         combat["ended_at"] = datetime.now().isoformat()
-        self._save_combats()
+        try:
+            self.combat_store.archive(combat_id, combat)
+        except Exception as e:
+            print(f"Error archiving combat session: {e}")
+        del self.combats[combat_id]
         return True 
\ No newline at end of file
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Dice Engine
+===========
+
+Single dice implementation shared by DiceSystem and both combat systems.
+
+Notation is compiled once into a DiceExpression (cached per notation) and
+rolled many times. Supported syntax (case insensitive, spaces allowed
+around + and -):
+- NdS, dS, d%         - N dice with S sides (d% is d100)
+- +K / -K             - flat modifiers, any number of terms: 2d6+1d4+3
+- NdSkhK / NdSkK      - keep the K highest dice (4d6kh3)
+- NdSklK              - keep the K lowest dice (2d20kl1)
+- NdSdlK / NdSdhK     - drop the K lowest / highest dice
+- NdS!                - exploding dice: a die showing its maximum is rolled
+                        again and added to that die (compounding)
+
+roll_array/roll_many/roll_batch roll one expression many times, or many
+expressions at once, with NumPy when it is installed.
+"""
+
+import random
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_DICE = 1000
+MAX_SIDES = 10000
+# Re-rolls per exploding die; keeps a pathological d1-like chain finite
+MAX_EXPLOSIONS = 100
+
+_TERM_PATTERN = re.compile(
+    r"([+-])?(?:(\d*)d(\d+|%)(!)?(?:(kh|kl|k|dh|dl)(\d+))?|(\d+))"
+)
+
+
+class DiceError(ValueError):
+    """Raised for invalid dice notation"""
+
+
+@dataclass(frozen=True)
+class DiceTerm:
+    """A pool of identical dice with optional keep/drop and explode rules"""
+    count: int
+    sides: int
+    sign: int = 1
+    keep: Optional[int] = None
+    keep_highest: bool = True
+    explode: bool = False
+
+    def roll(self, rng=random) -> List[int]:
+        """Roll the pool and return the kept dice"""
+        randint = rng.randint
+        sides = self.sides
+        dice = [randint(1, sides) for _ in range(self.count)]
+        if self.explode:
+            for index, value in enumerate(dice):
+                extra = value
+                rerolls = 0
+                while extra == sides and rerolls < MAX_EXPLOSIONS:
+                    extra = randint(1, sides)
+                    value += extra
+                    rerolls += 1
+                dice[index] = value
+        if self.keep is not None:
+            ordered = sorted(dice, reverse=self.keep_highest)
+            dice = ordered[:self.keep]
+        return dice
+
+    def roll_array(self, times: int, generator) -> Any:
+        """Roll the pool times over; returns the signed term totals as an array"""
+        dice = generator.integers(1, self.sides + 1, (times, self.count))
+        if self.explode:
+            flat = dice.reshape(-1)
+            live = np.flatnonzero(flat == self.sides)
+            rerolls = 0
+            while len(live) and rerolls < MAX_EXPLOSIONS:
+                extra = generator.integers(1, self.sides + 1, len(live))
+                flat[live] += extra
+                live = live[extra == self.sides]
+                rerolls += 1
+        if self.keep is not None and self.keep < self.count:
+            dice = np.sort(dice, axis=1)
+            dice = dice[:, -self.keep:] if self.keep_highest else dice[:, :self.keep]
+        totals = dice.sum(axis=1)
+        return totals if self.sign > 0 else -totals
+
+    @property
+    def min_total(self) -> int:
+        kept = self.count if self.keep is None else self.keep
+        return kept if self.sign > 0 else -kept * self.sides
+
+    @property
+    def max_total(self) -> Optional[int]:
+        kept = self.count if self.keep is None else self.keep
+        if self.explode:
+            return None if self.sign > 0 else -kept
+        return kept * self.sides if self.sign > 0 else -kept
+
+
+@dataclass
+class DiceRoll:
+    """Outcome of rolling a DiceExpression once"""
+    notation: str
+    total: int
+    rolls: List[int] = field(default_factory=list)
+    modifier: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "notation": self.notation,
+            "rolls": self.rolls,
+            "total": self.total,
+            "modifier": self.modifier,
+            "success": True
+        }
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """Compiled dice notation: a sum of dice terms plus a flat modifier"""
+    notation: str
+    terms: Tuple[DiceTerm, ...]
+    modifier: int = 0
+
+    def roll(self, rng=random) -> DiceRoll:
+        """Roll once, keeping the individual dice"""
+        rolls = []
+        total = self.modifier
+        for term in self.terms:
+            kept = term.roll(rng)
+            rolls.extend(kept)
+            total += sum(kept) * term.sign
+        if not self.terms:
+            # A bare number reads as a single fixed "roll", as before
+            return DiceRoll(self.notation, total, [self.modifier], 0)
+        return DiceRoll(self.notation, total, rolls, self.modifier)
+
+    def roll_total(self, rng=random) -> int:
+        """Roll once and return only the total"""
+        total = self.modifier
+        for term in self.terms:
+            total += sum(term.roll(rng)) * term.sign
+        return total
+
+    def roll_array(self, times: int, generator=None) -> Any:
+        """Roll times over with NumPy; returns an integer array of totals"""
+        if np is None:
+            raise RuntimeError("roll_array requires NumPy")
+        generator = generator if generator is not None else np.random.default_rng()
+        totals = np.full(times, self.modifier, dtype=np.int64)
+        for term in self.terms:
+            totals += term.roll_array(times, generator)
+        return totals
+
+    def roll_many(self, times: int, seed: Optional[int] = None) -> List[int]:
+        """Roll times over and return the totals; vectorized when NumPy is available"""
+        if np is not None:
+            return self.roll_array(times, np.random.default_rng(seed)).tolist()
+        rng = random.Random(seed) if seed is not None else random
+        return [self.roll_total(rng) for _ in range(times)]
+
+    @property
+    def min_total(self) -> int:
+        return self.modifier + sum(term.min_total for term in self.terms)
+
+    @property
+    def max_total(self) -> Optional[int]:
+        maxima = [term.max_total for term in self.terms]
+        if any(value is None for value in maxima):
+            return None
+        return self.modifier + sum(maxima)
+
+
+def _parse(notation: str) -> DiceExpression:
+    text = re.sub(r"\s*([+-])\s*", r"\1", notation.strip()).lower()
+    if not text:
+        raise DiceError("Empty dice notation")
+    if re.search(r"\s", text):
+        raise DiceError(f"Invalid dice notation: {notation}")
+
+    terms = []
+    modifier = 0
+    position = 0
+    while position < len(text):
+        match = _TERM_PATTERN.match(text, position)
+        if not match or match.end() == position or (position > 0 and not match.group(1)):
+            raise DiceError(f"Invalid dice notation: {notation}")
+        position = match.end()
+
+        sign = -1 if match.group(1) == "-" else 1
+        if match.group(7) is not None:
+            modifier += sign * int(match.group(7))
+            continue
+
+        count = int(match.group(2)) if match.group(2) else 1
+        sides = 100 if match.group(3) == "%" else int(match.group(3))
+        if not 1 <= count <= MAX_DICE or not 1 <= sides <= MAX_SIDES:
+            raise DiceError(f"Dice out of range: {notation}")
+
+        explode = match.group(4) is not None
+        if explode and sides < 2:
+            raise DiceError(f"Exploding dice need at least 2 sides: {notation}")
+
+        keep = None
+        keep_highest = True
+        if match.group(5):
+            amount = int(match.group(6))
+            rule = match.group(5)
+            if rule in ("dl", "dh"):
+                keep = count - amount
+                keep_highest = rule == "dl"
+            else:
+                keep = amount
+                keep_highest = rule != "kl"
+            if not 1 <= keep <= count:
+                raise DiceError(f"Cannot keep {keep} of {count} dice: {notation}")
+            if keep == count:
+                keep = None
+
+        terms.append(DiceTerm(count, sides, sign, keep, keep_highest, explode))
+
+    return DiceExpression(notation, tuple(terms), modifier)
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(notation: str) -> DiceExpression:
+    """Compile (and cache) dice notation; raises DiceError when invalid"""
+    if not isinstance(notation, str):
+        raise DiceError(f"Dice notation must be a string: {notation!r}")
+    return _parse(notation)
+
+
+def roll(notation: str, rng=random) -> DiceRoll:
+    """Roll notation once"""
+    return compile_dice(notation).roll(rng)
+
+
+def roll_total(notation: str, rng=random) -> int:
+    """Roll notation once and return only the total"""
+    return compile_dice(notation).roll_total(rng)
+
+
+def roll_batch(notations: Sequence[str], seed: Optional[int] = None) -> List[int]:
+    """
+    Roll each notation once and return the totals in order.
+
+    Repeated notations are grouped and rolled as one vectorized call.
+    """
+    groups: Dict[DiceExpression, List[int]] = {}
+    for index, notation in enumerate(notations):
+        groups.setdefault(compile_dice(notation), []).append(index)
+
+    totals = [0] * len(notations)
+    if np is not None:
+        generator = np.random.default_rng(seed)
+        for expression, indexes in groups.items():
+            for index, total in zip(indexes, expression.roll_array(len(indexes), generator).tolist()):
+                totals[index] = total
+    else:
+        rng = random.Random(seed) if seed is not None else random
+        for expression, indexes in groups.items():
+            for index in indexes:
+                totals[index] = expression.roll_total(rng)
+    return totals
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Dice Probability
+================
+
+Exact probability distributions for dice notation compiled by dice_engine.
+
+Each term's PMF is built analytically: plain pools by polynomial
+convolution (NumPy FFT for large pools when available), keep/drop pools by
+counting how many dice land on each face, exploding dice by their geometric
+tail. Term PMFs are convolved into the expression's PMF. Distributions are
+memoized per notation, so repeated odds queries cost a table lookup.
+
+The parser accepts pools far too large to solve exactly in a request, so
+distribution() first estimates the work (and the number of possible
+totals) and raises DiceError when a notation is over MAX_DISTRIBUTION_WORK
+or MAX_SUPPORT.
+
+Attack and check odds follow DiceSystem's rules: success when
+d20 + bonus >= target, natural 20 / natural 1 are reported as criticals.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb, log2
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .dice_engine import DiceError, DiceExpression, DiceTerm, compile_dice
+
+# Pools whose PMF is longer than this use FFT convolution when NumPy is present
+FFT_THRESHOLD = 256
+# Exploding dice tails are cut once the remaining mass is below this
+TAIL_EPSILON = 1e-12
+# Budget of an exact distribution, in rough inner-loop steps (about half a second)
+MAX_DISTRIBUTION_WORK = 20_000_000
+# Most possible totals an exact distribution may have
+MAX_SUPPORT = 100_000
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Discrete distribution over consecutive integers starting at offset"""
+    offset: int
+    probabilities: Tuple[float, ...]
+
+    @property
+    def min_value(self) -> int:
+        return self.offset
+
+    @property
+    def max_value(self) -> int:
+        return self.offset + len(self.probabilities) - 1
+
+    def probability(self, value: int) -> float:
+        """P(total == value)"""
+        index = value - self.offset
+        return self.probabilities[index] if 0 <= index < len(self.probabilities) else 0.0
+
+    def probability_at_least(self, value: int) -> float:
+        """P(total >= value)"""
+        index = max(0, value - self.offset)
+        return _clamp(sum(self.probabilities[index:]))
+
+    def probability_at_most(self, value: int) -> float:
+        """P(total <= value)"""
+        index = value - self.offset + 1
+        return _clamp(sum(self.probabilities[:max(0, index)]))
+
+    def mean(self) -> float:
+        return sum((self.offset + index) * p for index, p in enumerate(self.probabilities))
+
+    def variance(self) -> float:
+        mean = self.mean()
+        return sum((self.offset + index - mean) ** 2 * p for index, p in enumerate(self.probabilities))
+
+    def shifted(self, amount: int) -> "Distribution":
+        return Distribution(self.offset + amount, self.probabilities)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "min": self.min_value,
+            "max": self.max_value,
+            "mean": round(self.mean(), 6),
+            "pmf": {str(self.offset + index): p for index, p in enumerate(self.probabilities) if p > 0}
+        }
+
+
+def _clamp(probability: float) -> float:
+    return min(1.0, max(0.0, probability))
+
+
+def _convolve(left: List[float], right: List[float]) -> List[float]:
+    if np is not None and len(left) + len(right) > FFT_THRESHOLD:
+        size = len(left) + len(right) - 1
+        spectrum = np.fft.rfft(left, size) * np.fft.rfft(right, size)
+        return np.clip(np.fft.irfft(spectrum, size), 0.0, None).tolist()
+
+    result = [0.0] * (len(left) + len(right) - 1)
+    for i, a in enumerate(left):
+        if a:
+            for j, b in enumerate(right):
+                result[i + j] += a * b
+    return result
+
+
+def _power(pmf: List[float], count: int) -> List[float]:
+    """PMF of the sum of count independent copies of pmf"""
+    if np is not None and len(pmf) * count > FFT_THRESHOLD:
+        size = (len(pmf) - 1) * count + 1
+        spectrum = np.fft.rfft(pmf, size) ** count
+        return np.clip(np.fft.irfft(spectrum, size), 0.0, None).tolist()
+
+    result = [1.0]
+    base = pmf
+    while count:
+        if count & 1:
+            result = _convolve(result, base)
+        count >>= 1
+        if count:
+            base = _convolve(base, base)
+    return result
+
+
+def _die_pmf(term: DiceTerm) -> Tuple[int, List[float]]:
+    """(offset, pmf) of a single die of the term, exploding if requested"""
+    sides = term.sides
+    if not term.explode:
+        return 1, [1.0 / sides] * sides
+
+    # Compounding: value k*S + r (1 <= r < S) has probability (1/S)^(k+1)
+    pmf = []
+    level = 1.0 / sides
+    while True:
+        pmf.extend([level] * (sides - 1))
+        remaining = level
+        if remaining < TAIL_EPSILON:
+            # Fold the cut-off tail into the last reachable face
+            pmf.append(remaining)
+            break
+        pmf.append(0.0)
+        level /= sides
+    return 1, pmf
+
+
+def _die_faces(term: DiceTerm) -> int:
+    """Length of _die_pmf(term) without building it"""
+    if not term.explode:
+        return term.sides
+    faces = 0
+    level = 1.0 / term.sides
+    while level >= TAIL_EPSILON:
+        faces += term.sides
+        level /= term.sides
+    return faces + term.sides
+
+
+def _convolve_work(left: int, right: int) -> float:
+    if np is not None and left + right > FFT_THRESHOLD:
+        size = left + right
+        return size * log2(size)
+    return left * right
+
+
+def _term_cost(term: DiceTerm) -> Tuple[int, float]:
+    """(PMF length, estimated work) of term_distribution(term)"""
+    faces = _die_faces(term)
+    if term.keep is not None:
+        # _keep_pmf: faces x (placed, kept) states x dice per face x kept sums
+        return (faces - 1) * term.keep + 1, faces ** 2 * term.count ** 2 * term.keep
+    size = (faces - 1) * term.count + 1
+    if np is not None and faces * term.count > FFT_THRESHOLD:
+        return size, size * log2(size)
+    # Repeated squaring; the last squaring dominates
+    return size, size * size
+
+
+def _check_cost(expression: DiceExpression):
+    """Raise DiceError if the exact distribution of expression is over budget"""
+    length, work = 1, 0.0
+    for term in expression.terms:
+        term_length, term_work = _term_cost(term)
+        work += term_work + _convolve_work(length, term_length)
+        length += term_length - 1
+        if length > MAX_SUPPORT or work > MAX_DISTRIBUTION_WORK:
+            raise DiceError(f"Dice expression too large for exact odds: {expression.notation}")
+
+
+def _keep_pmf(term: DiceTerm, die_offset: int, die_pmf: List[float]) -> Tuple[int, List[float]]:
+    """
+    PMF of the kept dice total for a keep-highest/lowest pool.
+
+    Faces are visited from the kept end; for each face we choose how many of
+    the remaining dice show it (multinomial weight) and add the ones that
+    still fit in the kept count to the running total.
+    """
+    keep = term.keep
+    faces = list(enumerate(die_pmf))
+    if term.keep_highest:
+        faces.reverse()
+
+    # states[(dice placed, dice kept)] -> {kept sum index: probability}
+    states: Dict[Tuple[int, int], Dict[int, float]] = {(0, 0): {0: 1.0}}
+    for index, p in faces:
+        if not p:
+            continue
+        value = index
+        next_states: Dict[Tuple[int, int], Dict[int, float]] = {}
+        for (placed, kept), sums in states.items():
+            remaining = term.count - placed
+            for here in range(remaining + 1):
+                weight = comb(remaining, here) * p ** here
+                if not weight:
+                    continue
+                take = min(here, keep - kept)
+                key = (placed + here, kept + take)
+                target = next_states.setdefault(key, {})
+                for total, q in sums.items():
+                    new_total = total + take * value
+                    target[new_total] = target.get(new_total, 0.0) + q * weight
+        states = next_states
+
+    sums = {}
+    for (placed, kept), totals in states.items():
+        if placed == term.count:
+            for total, q in totals.items():
+                sums[total] = sums.get(total, 0.0) + q
+    low = min(sums)
+    pmf = [0.0] * (max(sums) - low + 1)
+    for total, q in sums.items():
+        pmf[total - low] = q
+    return low + keep * die_offset, pmf
+
+
+@lru_cache(maxsize=512)
+def term_distribution(term: DiceTerm) -> Distribution:
+    """Exact distribution of one dice term (sign included)"""
+    die_offset, die_pmf = _die_pmf(term)
+    if term.keep is not None:
+        offset, pmf = _keep_pmf(term, die_offset, die_pmf)
+    else:
+        offset, pmf = term.count * die_offset, _power(die_pmf, term.count)
+
+    if term.sign < 0:
+        return Distribution(-(offset + len(pmf) - 1), tuple(reversed(pmf)))
+    return Distribution(offset, tuple(pmf))
+
+
+@lru_cache(maxsize=1024)
+def distribution(notation: str) -> Distribution:
+    """Exact distribution of a dice notation's total"""
+    expression = compile_dice(notation)
+    _check_cost(expression)
+    offset = expression.modifier
+    pmf = [1.0]
+    for term in expression.terms:
+        part = term_distribution(term)
+        offset += part.offset
+        pmf = _convolve(pmf, list(part.probabilities))
+    total = sum(pmf)
+    return Distribution(offset, tuple(p / total for p in pmf))
+
+
+def _rounded(odds: Dict[str, float]) -> Dict[str, float]:
+    return {key: round(value, 6) for key, value in odds.items()}
+
+
+def check_odds(bonus: int = 0, difficulty_class: int = 15, dice: str = "1d20") -> Dict[str, Any]:
+    """Odds for a skill check or saving throw (dice + bonus >= DC)"""
+    roll = distribution(dice)
+    return _rounded({
+        "success_chance": roll.probability_at_least(difficulty_class - bonus),
+        "critical_success_chance": roll.probability(roll.max_value),
+        "critical_failure_chance": roll.probability(roll.min_value),
+        "expected_total": roll.mean() + bonus
+    })
+
+
+def attack_odds(attack_bonus: int = 0, target_ac: int = 10, damage_dice: Optional[str] = None,
+                damage_bonus: int = 0, attack_dice: str = "1d20") -> Dict[str, Any]:
+    """Hit/crit chances and expected damage for an attack (attack_dice "2d20kh1" for advantage)"""
+    roll = distribution(attack_dice)
+    hit_chance = roll.probability_at_least(target_ac - attack_bonus)
+    odds = {
+        "hit_chance": hit_chance,
+        "critical_hit_chance": roll.probability(roll.max_value),
+        "critical_miss_chance": roll.probability(roll.min_value)
+    }
+    if damage_dice:
+        damage = distribution(damage_dice)
+        # Damage never goes below zero
+        average = sum(max(0, damage.offset + index + damage_bonus) * p
+                      for index, p in enumerate(damage.probabilities))
+        odds["average_damage"] = average
+        odds["expected_damage"] = hit_chance * average
+    return _rounded(odds)
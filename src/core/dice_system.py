@@ -6,73 +6,44 @@ Dice System
 Handles dice rolling mechanics for the game.
 """
 
-import random
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Optional
 
+from .dice_engine import DiceError, compile_dice
+from .dice_probability import attack_odds, check_odds
+
+# Rolls kept for get_dice_history
+HISTORY_LIMIT = 200
+
 class DiceSystem:
     """Manages dice rolling mechanics"""
     
-    def __init__(self):
-        self.dice_history = []
+    def __init__(self, history_limit: int = HISTORY_LIMIT):
+        self.dice_history = deque(maxlen=history_limit)
     
     def roll_dice(self, dice_notation: str) -> Dict[str, Any]:
-        """Roll dice using notation like '2d6', '1d20', '3d8+5', etc."""
+        """Roll dice using notation like '2d6', '1d20', '3d8+5', '4d6kh3', '1d6!', etc."""
         try:
-            # Handle modifiers (e.g., "3d8+5")
-            modifier = 0
-            base_notation = dice_notation
-            
-            if "+" in dice_notation:
-                parts = dice_notation.split("+")
-                base_notation = parts[0]
-                modifier = int(parts[1])
-            elif "-" in dice_notation:
-                parts = dice_notation.split("-")
-                base_notation = parts[0]
-                modifier = -int(parts[1])
-            
-            if "d" not in base_notation:
-                value = int(base_notation)
-                result = {
-                    "notation": dice_notation,
-                    "rolls": [value],
-                    "total": value + modifier,
-                    "modifier": modifier,
-                    "success": True
-                }
-                self.dice_history.append(result)
-                return result
-            
-            parts = base_notation.split("d")
-            if len(parts) != 2:
-                return {"success": False, "error": "Invalid dice notation"}
-            
-            num_dice = int(parts[0])
-            dice_size = int(parts[1])
-            
-            rolls = []
-            total = 0
-            
-            for _ in range(num_dice):
-                roll = random.randint(1, dice_size)
-                rolls.append(roll)
-                total += roll
-            
-            total += modifier
-            
-            result = {
-                "notation": dice_notation,
-                "rolls": rolls,
-                "total": total,
-                "modifier": modifier,
-                "success": True
-            }
-            
-            self.dice_history.append(result)
-            return result
-            
-        except Exception as e:
+            result = compile_dice(dice_notation).roll().to_dict()
+        except DiceError as e:
             return {"success": False, "error": str(e)}
+        
+        self.dice_history.append(result)
+        return result
+    
+    def roll_many(self, dice_notation: str, times: int, seed: Optional[int] = None) -> Dict[str, Any]:
+        """Roll the same notation many times in one call (not recorded in history)"""
+        try:
+            totals = compile_dice(dice_notation).roll_many(times, seed)
+        except DiceError as e:
+            return {"success": False, "error": str(e)}
+        
+        return {
+            "notation": dice_notation,
+            "totals": totals,
+            "success": True
+        }
     
     def roll_attack(self, attack_bonus: int = 0, target_ac: int = 10) -> Dict[str, Any]:
         """Roll an attack with bonus against target AC"""
@@ -170,9 +141,22 @@ class DiceSystem:
             "critical_failure": critical_failure
         }
     
+    def attack_odds(self, attack_bonus: int = 0, target_ac: int = 10,
+                    damage_dice: str = None, damage_bonus: int = 0) -> Dict[str, Any]:
+        """Exact hit chance and expected damage for roll_attack/roll_damage"""
+        try:
+            return {"success": True, **attack_odds(attack_bonus, target_ac, damage_dice, damage_bonus)}
+        except DiceError as e:
+            return {"success": False, "error": str(e)}
+    
+    def check_odds(self, bonus: int = 0, difficulty_class: int = 15) -> Dict[str, Any]:
+        """Exact success chance for roll_skill_check/roll_saving_throw"""
+        return {"success": True, **check_odds(bonus, difficulty_class)}
+    
     def get_dice_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent dice roll history"""
-        return self.dice_history[-limit:] if self.dice_history else []
+        skip = max(0, len(self.dice_history) - limit)
+        return list(islice(self.dice_history, skip, None))
     
     def clear_history(self):
         """Clear dice roll history"""
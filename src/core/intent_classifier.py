@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Intent Classifier
+=================
+
+One place that turns free-form player text (choice ids, action
+descriptions, decisions) into intent labels such as "combat", "talk" or
+"steal", with English and Turkish vocabularies.
+
+All keywords are compiled into a single regular expression, so a text is
+lowercased and scanned once no matter how many labels exist. A keyword
+matches at the start of a word (letters only; "_", digits and punctuation
+separate words, so "fight_goblin" matches "fight"):
+
+- "attack*" also matches longer words ("attacks", "attacking"); Turkish
+  keywords use this for suffixes ("konuş*" matches "konuşmak")
+- "lie" without "*" only matches the whole word (not "lieutenant")
+
+Prefixes are kept narrow enough not to catch nouns and unrelated words:
+"guard" itself is not a protect keyword (the guard is usually the target,
+as in "kill the guard" or "guard_001"), "tend" does not match "tendril"
+and "vur" does not match "vurgun".
+
+classify() returns every matched label with its weight (the sum of its
+matched keyword weights), and results are memoized because the same
+choice ids are classified over and over.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+# label -> keywords; a keyword is "word", "word*" or ("word*", weight)
+INTENT_VOCABULARY = {
+    "combat": ["combat*", "fight*", "attack*", "battle*", "strike*", "duel*",
+               "savaş*", "saldır*", "dövüş*", "vur", "vurmak", "vurdu*", "vurur*", "vuruyor*", "vuruş*"],
+    "kill": ["kill*", "murder*", "assassinat*", "slay*", "execute*",
+             "öldür*", "katlet*", "suikast*", "infaz*"],
+    "steal": ["steal*", "stole*", "rob", "robs", "robbed", "robbery*", "thief*", "thieves", "pickpocket*",
+              "hırsız*", "soygun*", "çalmak", "çaldı*", "çalar", "yağmala*"],
+    "deceive": ["betray*", "deceiv*", "lie", "lies", "lied", "lying", "trick*", "cheat*",
+                "ihanet*", "kandır*", "aldat*", "yalan*", "hile*"],
+    "threaten": ["threat*", "intimidat*", "tortur*", "blackmail*",
+                 "tehdit*", "işkence*", "gözdağı*", "şantaj*"],
+    "help": ["help*", "assist*", "aid", "aids", "aiding", "support*",
+             "yardım*", "destek*"],
+    "heal": ["heal*", "cure*", "comfort*", "tend", "tends", "tended", "tending",
+             "iyileştir*", "tedavi*", "teselli*"],
+    "protect": ["protect*", "save", "saves", "saving", "rescue*", "defend*", "guarding",
+                "koru*", "kurtar*", "savun*"],
+    "donate": ["donat*", "charity*", "bağış*", "sadaka*"],
+    "talk": ["talk*", "speak*", "negotiat*", "conversation*", "chat*", "persuad*", "greet*",
+             "konuş*", "müzakere*", "ikna*", "sohbet*", "selamla*"],
+    "trade": ["trade*", "buy*", "sell*", "barter*", "bought", "sold",
+              "ticaret*", "satın*", "takas*", "pazarlık*"],
+    "explore": ["explor*", "investigat*", "search*", "look*", "observ*", "examin*", "inspect*",
+                "araştır*", "keşfet*", "incele*", "gözlem*"],
+    "magic": ["magic*", "spell*", "cast", "casts", "casting", "enchant*", "ritual*",
+              "büyü*", "sihir*"],
+    "collect": ["collect*", "gather*", "take", "takes", "taking", "grab*", "loot*", "pick*",
+                "topla*", "ganimet*"],
+}
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class IntentClassifier:
+    """Compiled multi-keyword matcher from text to weighted intent labels"""
+
+    def __init__(self, vocabulary: Optional[Dict[str, Iterable]] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.vocabulary = vocabulary if vocabulary is not None else INTENT_VOCABULARY
+        self.labels = tuple(self.vocabulary)
+
+        hits: Dict[str, list] = {}
+        for label, keywords in self.vocabulary.items():
+            for keyword in keywords:
+                keyword, weight = keyword if isinstance(keyword, tuple) else (keyword, 1.0)
+                hits.setdefault(keyword.casefold(), []).append((label, weight))
+        self._keywords: Dict[str, Tuple[Tuple[str, float], ...]] = {
+            keyword: tuple(labels) for keyword, labels in hits.items()}
+
+        # One alternation; longer keywords first so "attacks" is not cut to "attack"
+        alternatives = []
+        for keyword in sorted(self._keywords, key=len, reverse=True):
+            if keyword.endswith("*"):
+                alternatives.append(re.escape(keyword[:-1]) + r"[^\W\d_]*")
+            else:
+                alternatives.append(re.escape(keyword) + r"(?![^\W\d_])")
+        self._pattern = re.compile(r"(?<![^\W\d_])(?:" + "|".join(alternatives) + ")")
+
+        # Matched text -> keyword, resolved once per distinct word
+        self._word_keyword = lru_cache(maxsize=cache_size)(self._keyword_for)
+        self._cached = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _keyword_for(self, word: str) -> Optional[str]:
+        if word in self._keywords:
+            return word
+        # Longest prefix keyword (the "*" ones) that the matched word starts with
+        for end in range(len(word), 0, -1):
+            keyword = word[:end] + "*"
+            if keyword in self._keywords:
+                return keyword
+        return None
+
+    def _classify(self, text: str) -> Tuple[Tuple[str, float], ...]:
+        scores: Dict[str, float] = {}
+        for match in self._pattern.finditer(text.casefold()):
+            keyword = self._word_keyword(match.group())
+            for label, weight in self._keywords.get(keyword, ()):
+                scores[label] = scores.get(label, 0.0) + weight
+        return tuple(sorted(scores.items(), key=lambda item: (-item[1], self.labels.index(item[0]))))
+
+    def classify(self, text: Optional[str]) -> Dict[str, float]:
+        """All intent labels found in text with their weights, strongest first"""
+        if not text:
+            return {}
+        return dict(self._cached(text))
+
+    def has(self, text: Optional[str], label: str) -> bool:
+        return bool(text) and any(found == label for found, _ in self._cached(text))
+
+    def first(self, text: Optional[str], labels: Iterable[str]) -> Optional[str]:
+        """The first of labels (in priority order) that text expresses"""
+        if not text:
+            return None
+        found = dict(self._cached(text))
+        return next((label for label in labels if label in found), None)
+
+    def best(self, text: Optional[str], labels: Optional[Iterable[str]] = None,
+             default: Optional[str] = None) -> Optional[str]:
+        """The strongest label in text, optionally restricted to labels"""
+        if not text:
+            return default
+        allowed = None if labels is None else set(labels)
+        return next((label for label, _ in self._cached(text) if allowed is None or label in allowed), default)
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+
+# Shared classifier used by the game systems
+classifier = IntentClassifier()
+
+
+def classify_intent(text: Optional[str]) -> Dict[str, float]:
+    """Intent labels and weights for text, using the shared classifier"""
+    return classifier.classify(text)
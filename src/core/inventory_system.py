@@ -5,10 +5,18 @@ Inventory Management System
 
 Comprehensive inventory system with item-based actions, equipment management,
 and contextual item usage.
+
+Each loaded inventory keeps an index of its entries by item id (stacks) and
+by item type, so finding a stack or the consumables of a player does not
+scan the whole item list. Equipment stat totals are cached until the
+player equips or unequips something. Inventories are stored one file per
+player (data/inventories/<player>.json) and only players changed since the
+last save are written.
 """
 
 import json
 import os
+import re
 import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -40,12 +48,43 @@ class ItemSlot(Enum):
     ACCESSORY_1 = "accessory_1"
     ACCESSORY_2 = "accessory_2"
 
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+class _InventoryIndex:
+    """Entries of one inventory by item id and item ids by item type"""
+    
+    __slots__ = ("stacks", "by_type")
+    
+    def __init__(self):
+        self.stacks: Dict[str, List[Dict[str, Any]]] = {}  # item_id -> entries in inventory order
+        self.by_type: Dict[str, Dict[str, None]] = {}  # item type -> item ids (insertion ordered)
+    
+    def add(self, entry: Dict[str, Any], item_type: Optional[str]):
+        entries = self.stacks.setdefault(entry["item_id"], [])
+        if not entries and item_type:
+            self.by_type.setdefault(item_type, {})[entry["item_id"]] = None
+        entries.append(entry)
+    
+    def discard(self, entry: Dict[str, Any], item_type: Optional[str]):
+        entries = self.stacks.get(entry["item_id"], [])
+        for position, candidate in enumerate(entries):
+            if candidate is entry:
+                del entries[position]
+                break
+        if not entries:
+            self.stacks.pop(entry["item_id"], None)
+            self.by_type.get(item_type, {}).pop(entry["item_id"], None)
+
 class InventorySystem:
     """Comprehensive inventory management system"""
     
     def __init__(self):
-        self.inventory_file = "data/inventories.json"
+        self.inventory_file = "data/inventories.json"  # Legacy single-file store
+        self.inventories_dir = "data/inventories"
         self.items_file = "data/items.json"
+        self._indexes: Dict[str, _InventoryIndex] = {}
+        self._equipment_stats: Dict[str, Dict[str, Any]] = {}
+        self._dirty = set()
         self._ensure_data_directory()
         self._load_items()
         self._load_inventories()
@@ -75,25 +114,80 @@ class InventorySystem:
         except Exception as e:
             print(f"Error saving items: {e}")
     
+    def _file_name(self, player_id: str) -> str:
+        """File name stem for a player id; unsafe ids are hex encoded behind '%'"""
+        if _SAFE_ID.match(player_id) and not player_id.startswith("."):
+            return player_id
+        return "%" + player_id.encode("utf-8").hex()
+    
     def _load_inventories(self):
-        """Load player inventories"""
+        """Load player inventories, one file per player"""
+        self.inventories = {}
+        if not os.path.isdir(self.inventories_dir):
+            os.makedirs(self.inventories_dir, exist_ok=True)
+            self._migrate_inventories()
+            return
+        
+        for name in os.listdir(self.inventories_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.inventories_dir, name), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.inventories[data["player_id"]] = data["inventory"]
+            except Exception as e:
+                print(f"Error loading inventory {name}: {e}")
+    
+    def _migrate_inventories(self):
+        """Split the legacy inventories.json into per-player files (first run only)"""
         try:
-            if os.path.exists(self.inventory_file):
-                with open(self.inventory_file, 'r', encoding='utf-8') as f:
-                    self.inventories = json.load(f)
-            else:
-                self.inventories = {}
+            if not os.path.exists(self.inventory_file):
+                return
+            with open(self.inventory_file, 'r', encoding='utf-8') as f:
+                self.inventories = json.load(f)
+            self._dirty.update(self.inventories)
+            self._save_inventories()
         except Exception as e:
-            print(f"Error loading inventories: {e}")
-            self.inventories = {}
+            print(f"Error migrating inventories: {e}")
     
     def _save_inventories(self):
-        """Save player inventories"""
-        try:
-            with open(self.inventory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.inventories, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving inventories: {e}")
+        """Save the inventories changed since the last save, each atomically"""
+        for player_id in list(self._dirty):
+            try:
+                path = os.path.join(self.inventories_dir, f"{self._file_name(player_id)}.json")
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"player_id": player_id, "inventory": self.inventories[player_id]}, f,
+                              ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, path)
+                self._dirty.discard(player_id)
+            except Exception as e:
+                print(f"Error saving inventory {player_id}: {e}")
+    
+    def _changed(self, player_id: str, inventory: Dict[str, Any]):
+        """Mark an inventory as changed and save it"""
+        inventory["last_updated"] = datetime.now().isoformat()
+        self._dirty.add(player_id)
+        self._save_inventories()
+    
+    def _item_type(self, item_id: str) -> Optional[str]:
+        item_def = self.items.get(item_id)
+        return item_def.get("type") if item_def else None
+    
+    def _index(self, player_id: str) -> _InventoryIndex:
+        """Stack/type index of a player's inventory, built on first use"""
+        index = self._indexes.get(player_id)
+        if index is None:
+            index = _InventoryIndex()
+            for entry in self.get_player_inventory(player_id)["items"]:
+                index.add(entry, self._item_type(entry["item_id"]))
+            self._indexes[player_id] = index
+        return index
+    
+    def _remove_entries(self, inventory: Dict[str, Any], entries: List[Dict[str, Any]]):
+        """Drop entries from the item list in one pass"""
+        removed = {id(entry) for entry in entries}
+        inventory["items"][:] = [entry for entry in inventory["items"] if id(entry) not in removed]
     
     def _create_default_items(self) -> Dict[str, Any]:
         """Create default item definitions"""
@@ -225,41 +319,47 @@ class InventorySystem:
                 return {"success": False, "error": f"Item {item_id} not found"}
             
             inventory = self.get_player_inventory(player_id)
+            index = self._index(player_id)
+            item_type = item_def.get("type")
+            acquired_at = datetime.now().isoformat()
             
             # Check if item is stackable
             if item_def.get("stackable", False):
-                # Find existing stack
-                existing_item = None
-                for item in inventory["items"]:
-                    if item["item_id"] == item_id and item.get("quantity", 1) < item_def.get("max_stack", 1):
-                        existing_item = item
+                max_stack = item_def.get("max_stack", 1)
+                remaining = quantity
+                # Top up existing stacks, then open new ones
+                for existing_item in index.stacks.get(item_id, []):
+                    if remaining <= 0:
                         break
-                
-                if existing_item:
-                    max_add = item_def.get("max_stack", 1) - existing_item.get("quantity", 1)
-                    actual_add = min(quantity, max_add)
-                    existing_item["quantity"] = existing_item.get("quantity", 1) + actual_add
-                else:
-                    # Create new stack
-                    actual_add = min(quantity, item_def.get("max_stack", 1))
-                    inventory["items"].append({
+                    room = max_stack - existing_item.get("quantity", 1)
+                    if room > 0:
+                        actual_add = min(remaining, room)
+                        existing_item["quantity"] = existing_item.get("quantity", 1) + actual_add
+                        remaining -= actual_add
+                new_items = []
+                while remaining > 0:
+                    actual_add = min(remaining, max_stack)
+                    new_items.append({
                         "id": str(uuid.uuid4()),
                         "item_id": item_id,
                         "quantity": actual_add,
-                        "acquired_at": datetime.now().isoformat()
+                        "acquired_at": acquired_at
                     })
+                    remaining -= actual_add
             else:
                 # Non-stackable item
-                for _ in range(quantity):
-                    inventory["items"].append({
-                        "id": str(uuid.uuid4()),
-                        "item_id": item_id,
-                        "quantity": 1,
-                        "acquired_at": datetime.now().isoformat()
-                    })
+                new_items = [{
+                    "id": str(uuid.uuid4()),
+                    "item_id": item_id,
+                    "quantity": 1,
+                    "acquired_at": acquired_at
+                } for _ in range(quantity)]
             
-            inventory["last_updated"] = datetime.now().isoformat()
-            self._save_inventories()
+            inventory["items"].extend(new_items)
+            for entry in new_items:
+                index.add(entry, item_type)
+            
+            self._changed(player_id, inventory)
             
             return {
                 "success": True,
@@ -280,32 +380,31 @@ class InventorySystem:
             if not item_def:
                 return {"success": False, "error": f"Item {item_id} not found"}
             
-            # Find items to remove
+            index = self._index(player_id)
+            entries = index.stacks.get(item_id, [])
+            if sum(entry.get("quantity", 1) for entry in entries) < quantity:
+                return {"success": False, "error": f"Insufficient quantity of {item_def['name']}"}
+            
+            # Take from the oldest entries first
             items_to_remove = []
             remaining_quantity = quantity
-            
-            for item in inventory["items"]:
-                if item["item_id"] == item_id and remaining_quantity > 0:
-                    item_qty = item.get("quantity", 1)
-                    remove_qty = min(remaining_quantity, item_qty)
-                    
-                    if remove_qty >= item_qty:
-                        items_to_remove.append(item)
-                        remaining_quantity -= item_qty
-                    else:
-                        item["quantity"] = item_qty - remove_qty
-                        remaining_quantity = 0
-                        break
+            for item in entries:
+                if remaining_quantity <= 0:
+                    break
+                item_qty = item.get("quantity", 1)
+                if remaining_quantity >= item_qty:
+                    items_to_remove.append(item)
+                    remaining_quantity -= item_qty
+                else:
+                    item["quantity"] = item_qty - remaining_quantity
+                    remaining_quantity = 0
             
             # Remove items
             for item in items_to_remove:
-                inventory["items"].remove(item)
+                index.discard(item, item_def.get("type"))
+            self._remove_entries(inventory, items_to_remove)
             
-            if remaining_quantity > 0:
-                return {"success": False, "error": f"Insufficient quantity of {item_def['name']}"}
-            
-            inventory["last_updated"] = datetime.now().isoformat()
-            self._save_inventories()
+            self._changed(player_id, inventory)
             
             return {
                 "success": True,
@@ -327,13 +426,7 @@ class InventorySystem:
                 return {"success": False, "error": f"Item {item_id} not found"}
             
             # Check if player has the item
-            player_has_item = False
-            for item in inventory["items"]:
-                if item["item_id"] == item_id:
-                    player_has_item = True
-                    break
-            
-            if not player_has_item:
+            if item_id not in self._index(player_id).stacks:
                 return {"success": False, "error": f"You don't have {item_def['name']}"}
             
             # Check if item is equippable
@@ -344,7 +437,6 @@ class InventorySystem:
             
             # Unequip existing item in slot
             if slot in inventory["equipped"]:
-                unequipped_item = inventory["equipped"][slot]
                 inventory["equipped"].pop(slot)
             
             # Equip new item
@@ -353,8 +445,8 @@ class InventorySystem:
                 "equipped_at": datetime.now().isoformat()
             }
             
-            inventory["last_updated"] = datetime.now().isoformat()
-            self._save_inventories()
+            self._equipment_stats.pop(player_id, None)
+            self._changed(player_id, inventory)
             
             return {
                 "success": True,
@@ -378,8 +470,8 @@ class InventorySystem:
             item_def = self.get_item(unequipped_item["item_id"])
             
             inventory["equipped"].pop(slot)
-            inventory["last_updated"] = datetime.now().isoformat()
-            self._save_inventories()
+            self._equipment_stats.pop(player_id, None)
+            self._changed(player_id, inventory)
             
             return {
                 "success": True,
@@ -405,26 +497,22 @@ class InventorySystem:
                 return {"success": False, "error": f"{item_def['name']} is not consumable"}
             
             # Check if player has the item
-            item_found = False
-            for item in inventory["items"]:
-                if item["item_id"] == item_id:
-                    if item.get("quantity", 1) > 0:
-                        item_found = True
-                        # Remove one from stack
-                        if item.get("quantity", 1) > 1:
-                            item["quantity"] = item["quantity"] - 1
-                        else:
-                            inventory["items"].remove(item)
-                        break
-            
-            if not item_found:
+            index = self._index(player_id)
+            item = next((entry for entry in index.stacks.get(item_id, []) if entry.get("quantity", 1) > 0), None)
+            if item is None:
                 return {"success": False, "error": f"You don't have {item_def['name']}"}
             
+            # Remove one from stack
+            if item.get("quantity", 1) > 1:
+                item["quantity"] = item["quantity"] - 1
+            else:
+                index.discard(item, item_def["type"])
+                self._remove_entries(inventory, [item])
+            
             # Apply item effects
             effects = self._apply_item_effects(item_def, target)
             
-            inventory["last_updated"] = datetime.now().isoformat()
-            self._save_inventories()
+            self._changed(player_id, inventory)
             
             return {
                 "success": True,
@@ -451,74 +539,78 @@ class InventorySystem:
         return effects
     
     def get_equipment_stats(self, player_id: str) -> Dict[str, Any]:
-        """Get combined stats from equipped items"""
-        inventory = self.get_player_inventory(player_id)
-        total_stats = {
-            "attack": 0,
-            "defense": 0,
-            "armor_class": 0,
-            "critical_chance": 0,
-            "movement_penalty": 0
-        }
-        
-        for slot, equipped_item in inventory["equipped"].items():
-            item_def = self.get_item(equipped_item["item_id"])
-            if item_def and "stats" in item_def:
-                for stat, value in item_def["stats"].items():
-                    if stat in total_stats:
-                        total_stats[stat] += value
+        """Get combined stats from equipped items (cached until equipment changes)"""
+        total_stats = self._equipment_stats.get(player_id)
+        if total_stats is None:
+            inventory = self.get_player_inventory(player_id)
+            total_stats = {
+                "attack": 0,
+                "defense": 0,
+                "armor_class": 0,
+                "critical_chance": 0,
+                "movement_penalty": 0
+            }
+            
+            for slot, equipped_item in inventory["equipped"].items():
+                item_def = self.get_item(equipped_item["item_id"])
+                if item_def and "stats" in item_def:
+                    for stat, value in item_def["stats"].items():
+                        if stat in total_stats:
+                            total_stats[stat] += value
+            self._equipment_stats[player_id] = total_stats
         
-        return total_stats
+        return dict(total_stats)
+    
+    def _items_of_type(self, player_id: str, item_type: ItemType):
+        """(item definition, inventory entry) for every entry of a type, via the type index"""
+        index = self._index(player_id)
+        for item_id in index.by_type.get(item_type.value, {}):
+            item_def = self.get_item(item_id)
+            for item in index.stacks[item_id]:
+                yield item_def, item
     
     def get_contextual_actions(self, player_id: str, scenario_type: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get contextual inventory actions based on scenario and context"""
-        inventory = self.get_player_inventory(player_id)
         contextual_actions = []
         
         # Check for healing items in combat
         if context.get("situation") == "combat":
-            for item in inventory["items"]:
-                item_def = self.get_item(item["item_id"])
-                if item_def and item_def["type"] == ItemType.CONSUMABLE.value:
-                    if "heal" in item_def.get("effects", []):
-                        contextual_actions.append({
-                            "type": "inventory",
-                            "description": f"💊 {item_def['name']} kullan",
-                            "action": "use_item",
-                            "item_id": item["item_id"],
-                            "context": "healing",
-                            "dice": "1d20",
-                            "skill": "medicine"
-                        })
-        
-        # Check for magic items in magical scenarios
-        if scenario_type == "fantasy" and context.get("situation") == "magical":
-            for item in inventory["items"]:
-                item_def = self.get_item(item["item_id"])
-                if item_def and item_def["type"] == ItemType.MAGIC.value:
+            for item_def, item in self._items_of_type(player_id, ItemType.CONSUMABLE):
+                if "heal" in item_def.get("effects", []):
                     contextual_actions.append({
                         "type": "inventory",
-                        "description": f"🔮 {item_def['name']} kullan",
+                        "description": f"💊 {item_def['name']} kullan",
                         "action": "use_item",
                         "item_id": item["item_id"],
-                        "context": "magical",
+                        "context": "healing",
                         "dice": "1d20",
-                        "skill": "arcana"
+                        "skill": "medicine"
                     })
         
+        # Check for magic items in magical scenarios
+        if scenario_type == "fantasy" and context.get("situation") == "magical":
+            for item_def, item in self._items_of_type(player_id, ItemType.MAGIC):
+                contextual_actions.append({
+                    "type": "inventory",
+                    "description": f"🔮 {item_def['name']} kullan",
+                    "action": "use_item",
+                    "item_id": item["item_id"],
+                    "context": "magical",
+                    "dice": "1d20",
+                    "skill": "arcana"
+                })
+        
         # Check for tools in exploration
         if context.get("situation") == "exploration":
-            for item in inventory["items"]:
-                item_def = self.get_item(item["item_id"])
-                if item_def and item_def["type"] == ItemType.TOOL.value:
-                    contextual_actions.append({
-                        "type": "inventory",
-                        "description": f"🔧 {item_def['name']} kullan",
-                        "action": "use_item",
-                        "item_id": item["item_id"],
-                        "context": "exploration",
-                        "dice": "1d20",
-                        "skill": "tool_proficiency"
-                    })
+            for item_def, item in self._items_of_type(player_id, ItemType.TOOL):
+                contextual_actions.append({
+                    "type": "inventory",
+                    "description": f"🔧 {item_def['name']} kullan",
+                    "action": "use_item",
+                    "item_id": item["item_id"],
+                    "context": "exploration",
+                    "dice": "1d20",
+                    "skill": "tool_proficiency"
+                })
         
         return contextual_actions
@@ -2,16 +2,29 @@
 """
 Karma System for AI Dungeon Master
 Handles moral choices, karma points, and NPC relationship tracking
+
+Each NPC relationship keeps only its last HISTORY_WINDOW interactions plus
+rolled-up counters; older interactions are appended to a per-NPC archive
+(data/karma_archive/<npc>.jsonl). Relationships are stored one file per
+NPC (data/karma_npcs/<npc>.json) and only the NPC touched by an action is
+written, so recording karma costs the same at any campaign length.
 """
 
 import json
 import logging
+import os
+import re
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Interactions kept on each NPCRelationship; older ones go to the archive
+HISTORY_WINDOW = 50
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
 @dataclass
 class KarmaAction:
     action_id: str
@@ -27,8 +40,14 @@ class NPCRelationship:
     relationship_level: int  # -10 to 10
     trust_level: int  # 0 to 100
     last_interaction: str
-    interaction_history: List[Dict[str, Any]]
+    interaction_history: List[Dict[str, Any]]  # Most recent HISTORY_WINDOW interactions
     special_events: List[str]
+    # Rolled-up counters over every interaction, including archived ones
+    total_interactions: int = 0
+    positive_interactions: int = 0
+    negative_interactions: int = 0
+    total_karma: int = 0
+    archived_interactions: int = 0
 
 @dataclass
 class KarmaState:
@@ -43,7 +62,9 @@ class KarmaSystem:
     
     def __init__(self):
         self.karma_file = "data/karma_data.json"
-        self.npc_relationships_file = "data/npc_relationships.json"
+        self.npc_relationships_file = "data/npc_relationships.json"  # Legacy single-file store
+        self.npc_relationships_dir = "data/karma_npcs"
+        self.archive_dir = "data/karma_archive"
         self._ensure_data_directory()
         self._load_karma_actions()
         self._load_npc_relationships()
@@ -51,13 +72,12 @@ class KarmaSystem:
     
     def _ensure_data_directory(self):
         """Ensure data directory exists"""
-        import os
         os.makedirs("data", exist_ok=True)
+        os.makedirs(self.archive_dir, exist_ok=True)
     
     def _load_karma_actions(self):
         """Load karma actions from file"""
         try:
-            import os
             if os.path.exists(self.karma_file):
                 with open(self.karma_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -79,30 +99,94 @@ class KarmaSystem:
         except Exception as e:
             print(f"Error saving karma actions: {e}")
     
+    def _file_name(self, npc_id: str) -> str:
+        """File name stem for an NPC id; unsafe ids are hex encoded behind '%'"""
+        if _SAFE_ID.match(npc_id) and not npc_id.startswith("."):
+            return npc_id
+        return "%" + npc_id.encode("utf-8").hex()
+    
     def _load_npc_relationships(self):
-        """Load NPC relationships from file"""
+        """Load NPC relationships, one file per NPC"""
+        self.npc_relationships = {}
+        if not os.path.isdir(self.npc_relationships_dir):
+            os.makedirs(self.npc_relationships_dir, exist_ok=True)
+            self._migrate_npc_relationships()
+            return
+        
+        for name in os.listdir(self.npc_relationships_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.npc_relationships_dir, name), 'r', encoding='utf-8') as f:
+                    relationship = NPCRelationship(**json.load(f))
+                self.npc_relationships[relationship.npc_id] = relationship
+            except Exception as e:
+                print(f"Error loading NPC relationship {name}: {e}")
+    
+    def _migrate_npc_relationships(self):
+        """Split the legacy npc_relationships.json into per-NPC files (first run only)"""
         try:
-            import os
-            if os.path.exists(self.npc_relationships_file):
-                with open(self.npc_relationships_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.npc_relationships = {}
-                    for npc_id, npc_data in data.items():
-                        self.npc_relationships[npc_id] = NPCRelationship(**npc_data)
-            else:
-                self.npc_relationships = {}
+            if not os.path.exists(self.npc_relationships_file):
+                return
+            with open(self.npc_relationships_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for npc_id, npc_data in data.items():
+                relationship = NPCRelationship(**npc_data)
+                if not relationship.total_interactions:
+                    # Counters start from the full legacy history
+                    for interaction in relationship.interaction_history:
+                        self._count_interaction(relationship, interaction)
+                self.npc_relationships[npc_id] = relationship
+                self._compact_history(relationship)
+                self._save_npc_relationship(relationship)
         except Exception as e:
-            print(f"Error loading NPC relationships: {e}")
-            self.npc_relationships = {}
+            print(f"Error migrating NPC relationships: {e}")
     
-    def _save_npc_relationships(self):
-        """Save NPC relationships to file"""
+    def _save_npc_relationship(self, relationship: NPCRelationship):
+        """Write one NPC relationship atomically"""
         try:
-            with open(self.npc_relationships_file, 'w', encoding='utf-8') as f:
-                data = {npc_id: asdict(relationship) for npc_id, relationship in self.npc_relationships.items()}
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            path = os.path.join(self.npc_relationships_dir, f"{self._file_name(relationship.npc_id)}.json")
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(relationship), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error saving NPC relationship {relationship.npc_id}: {e}")
+    
+    def _count_interaction(self, relationship: NPCRelationship, interaction: Dict[str, Any]):
+        karma_value = interaction.get("karma_value", 0)
+        relationship.total_interactions += 1
+        relationship.total_karma += karma_value
+        if karma_value > 0:
+            relationship.positive_interactions += 1
+        elif karma_value < 0:
+            relationship.negative_interactions += 1
+    
+    def _compact_history(self, relationship: NPCRelationship):
+        """Move interactions beyond HISTORY_WINDOW to the NPC's append-only archive"""
+        overflow = len(relationship.interaction_history) - HISTORY_WINDOW
+        if overflow <= 0:
+            return
+        archived = relationship.interaction_history[:overflow]
+        path = os.path.join(self.archive_dir, f"{self._file_name(relationship.npc_id)}.jsonl")
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                for interaction in archived:
+                    f.write(json.dumps(interaction, ensure_ascii=False, separators=(",", ":")) + "\n")
         except Exception as e:
-            print(f"Error saving NPC relationships: {e}")
+            # Keep the interactions in memory rather than lose them
+            print(f"Error archiving interactions of {relationship.npc_id}: {e}")
+            return
+        del relationship.interaction_history[:overflow]
+        relationship.archived_interactions += overflow
+    
+    def get_interaction_archive(self, npc_id: str) -> List[Dict[str, Any]]:
+        """Archived (older than the recent window) interactions with an NPC, oldest first"""
+        path = os.path.join(self.archive_dir, f"{self._file_name(npc_id)}.jsonl")
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
     
     def _initialize_default_actions(self):
         """Initialize default karma actions if none exist"""
@@ -207,6 +291,8 @@ class KarmaSystem:
         
         npc.interaction_history.append(interaction)
         npc.last_interaction = now
+        self._count_interaction(npc, interaction)
+        self._compact_history(npc)
         
         # Check for special events based on relationship level
         if npc.relationship_level >= 8 and "trusted_friend" not in npc.special_events:
@@ -214,7 +300,7 @@ class KarmaSystem:
         elif npc.relationship_level <= -8 and "sworn_enemy" not in npc.special_events:
             npc.special_events.append("sworn_enemy")
         
-        self._save_npc_relationships()
+        self._save_npc_relationship(npc)
     
     def get_npc_relationship(self, npc_id: str) -> Optional[NPCRelationship]:
         """Get NPC relationship data"""
@@ -301,7 +387,10 @@ class KarmaSystem:
             npc_relationships[npc_id] = {
                 "relationship_level": relationship.relationship_level,
                 "trust_level": relationship.trust_level,
-                "special_events": relationship.special_events
+                "special_events": relationship.special_events,
+                "total_interactions": relationship.total_interactions,
+                "positive_interactions": relationship.positive_interactions,
+                "negative_interactions": relationship.negative_interactions
             }
             # Estimate karma from relationship level
             total_karma += relationship.relationship_level * 2
@@ -2,15 +2,37 @@
 """
 Level System for AI Dungeon Master
 Handles character progression, experience points, and level-based unlocks
+
+Level requirements are compiled into a LevelTable (prefix sums), so an XP
+award resolves its new level with one bisect and its skill points and stat
+bonuses with two lookups, however many levels it jumps.
 """
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 
+from .progression import LevelTable
+
 logger = logging.getLogger(__name__)
 
+# Base XP per action type and difficulty
+BASE_XP = {
+    "combat": {"easy": 10, "medium": 25, "hard": 50, "epic": 100},
+    "exploration": {"easy": 5, "medium": 15, "hard": 30, "epic": 60},
+    "social": {"easy": 3, "medium": 10, "hard": 20, "epic": 40},
+    "quest": {"easy": 20, "medium": 50, "hard": 100, "epic": 200},
+    "skill_check": {"easy": 2, "medium": 5, "hard": 10, "epic": 20}
+}
+
+# Character fields raised by each level stat bonus, with their defaults
+STAT_FIELDS = {
+    "hp": (("max_health", 100), ("health", 100)),
+    "attack": (("attack", 10),),
+    "defense": (("defense", 5),)
+}
+
 @dataclass
 class LevelRequirement:
     level: int
@@ -37,6 +59,7 @@ class LevelSystem:
         self._ensure_data_directory()
         self._load_level_requirements()
         self._initialize_default_requirements()
+        self.level_table = LevelTable(self.level_requirements.values())
     
     def _ensure_data_directory(self):
         """Ensure data directory exists"""
@@ -88,15 +111,7 @@ class LevelSystem:
     def calculate_experience_gain(self, action_type: str, difficulty: str, 
                                 success: bool, bonus_multiplier: float = 1.0) -> int:
         """Calculate experience gain for an action"""
-        base_xp = {
-            "combat": {"easy": 10, "medium": 25, "hard": 50, "epic": 100},
-            "exploration": {"easy": 5, "medium": 15, "hard": 30, "epic": 60},
-            "social": {"easy": 3, "medium": 10, "hard": 20, "epic": 40},
-            "quest": {"easy": 20, "medium": 50, "hard": 100, "epic": 200},
-            "skill_check": {"easy": 2, "medium": 5, "hard": 10, "epic": 20}
-        }
-        
-        base = base_xp.get(action_type, {}).get(difficulty, 10)
+        base = BASE_XP.get(action_type, {}).get(difficulty, 10)
         
         # Success bonus
         if success:
@@ -111,27 +126,19 @@ class LevelSystem:
     
     def add_experience(self, character_data: Dict[str, Any], xp_gained: int) -> Dict[str, Any]:
         """Add experience to character and check for level up"""
+        table = self.level_table
         current_level = character_data.get("level", 1)
         current_xp = character_data.get("experience", 0)
         
         new_xp = current_xp + xp_gained
-        new_level = current_level
-        
-        # Check for level ups
-        while new_level < 10 and new_xp >= self.level_requirements[new_level + 1].experience_required:
-            new_level += 1
+        new_level = table.level_for(new_xp, current_level)
         
         # Calculate experience to next level
-        if new_level < 10:
-            xp_to_next = self.level_requirements[new_level + 1].experience_required - new_xp
-        else:
-            xp_to_next = 0
+        next_threshold = table.next_threshold(new_level)
+        xp_to_next = next_threshold - new_xp if next_threshold is not None else 0
         
-        # Calculate skill points gained
-        skill_points_gained = 0
-        for level in range(current_level + 1, new_level + 1):
-            if level in self.level_requirements:
-                skill_points_gained += self.level_requirements[level].skill_points_gained
+        # Skill points and stat bonuses of every level gained
+        skill_points_gained = table.skill_points_between(current_level, new_level)
         
         # Update character data
         character_data["level"] = new_level
@@ -140,18 +147,10 @@ class LevelSystem:
         character_data["skill_points"] = character_data.get("skill_points", 0) + skill_points_gained
         character_data["total_skill_points"] = character_data.get("total_skill_points", 0) + skill_points_gained
         
-        # Add stat bonuses for new levels
-        for level in range(current_level + 1, new_level + 1):
-            if level in self.level_requirements:
-                req = self.level_requirements[level]
-                for stat, bonus in req.stat_bonuses.items():
-                    if stat == "hp":
-                        character_data["max_health"] = character_data.get("max_health", 100) + bonus
-                        character_data["health"] = character_data.get("health", 100) + bonus
-                    elif stat == "attack":
-                        character_data["attack"] = character_data.get("attack", 10) + bonus
-                    elif stat == "defense":
-                        character_data["defense"] = character_data.get("defense", 5) + bonus
+        if new_level > current_level:
+            for stat, bonus in table.stat_bonuses_between(current_level, new_level).items():
+                for field, default in STAT_FIELDS.get(stat, ()):
+                    character_data[field] = character_data.get(field, default) + bonus
         
         return {
             "success": True,
@@ -163,12 +162,43 @@ class LevelSystem:
             "message": f"Gained {xp_gained} XP. Level: {current_level} → {new_level}"
         }
     
+    def add_experience_batch(self, characters: Dict[str, Dict[str, Any]],
+                             awards: Union[int, Dict[str, int]]) -> Dict[str, Any]:
+        """
+        Add experience to many characters in one call (e.g. a party's quest reward).
+        
+        awards is one XP amount for everyone or {character_id: xp}; ids
+        without character data are reported in "missing". Nothing is saved
+        here: the caller persists the characters once for the whole batch.
+        """
+        if isinstance(awards, dict):
+            amounts = awards
+        else:
+            amounts = dict.fromkeys(characters, awards)
+        
+        results = {}
+        missing = []
+        for character_id, xp_gained in amounts.items():
+            character_data = characters.get(character_id)
+            if character_data is None:
+                missing.append(character_id)
+                continue
+            results[character_id] = self.add_experience(character_data, xp_gained)
+        
+        return {
+            "success": bool(results),
+            "results": results,
+            "missing": missing,
+            "level_ups": sum(1 for result in results.values() if result["level_up"]),
+            "xp_awarded": sum(amounts[character_id] for character_id in results)
+        }
+    
     def get_level_progression(self, character_data: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed level progression information"""
         level = character_data.get("level", 1)
         experience = character_data.get("experience", 0)
         
-        if level >= 10:
+        if level >= self.level_table.max_level:
             return {
                 "level": level,
                 "experience": experience,
@@ -210,33 +240,16 @@ class LevelSystem:
     def can_unlock_feature(self, character_data: Dict[str, Any], feature: str) -> bool:
         """Check if character can unlock a feature based on level"""
         level = character_data.get("level", 1)
-        
-        for req_level, req in self.level_requirements.items():
-            if req_level <= level and feature in req.unlocks:
-                return True
-        
-        return False
+        unlock_level = self.level_table.unlock_levels.get(feature)
+        return unlock_level is not None and unlock_level <= level
     
     def get_available_unlocks(self, character_data: Dict[str, Any]) -> List[str]:
         """Get all available unlocks for character level"""
         level = character_data.get("level", 1)
-        unlocks = []
-        
-        for req_level, req in self.level_requirements.items():
-            if req_level <= level:
-                unlocks.extend(req.unlocks)
-        
-        return list(set(unlocks))  # Remove duplicates
+        return list(self.level_table.unlocks_up_to(level))
     
     def get_level_bonuses(self, character_data: Dict[str, Any]) -> Dict[str, int]:
         """Get total stat bonuses from all levels"""
         level = character_data.get("level", 1)
-        total_bonuses = {"hp": 0, "attack": 0, "defense": 0}
-        
-        for req_level, req in self.level_requirements.items():
-            if req_level <= level:
-                for stat, bonus in req.stat_bonuses.items():
-                    if stat in total_bonuses:
-                        total_bonuses[stat] += bonus
-        
-        return total_bonuses 
\ No newline at end of file
+        bonuses = self.level_table.stat_bonuses_between(0, level)
+        return {stat: bonuses.get(stat, 0) for stat in ("hp", "attack", "defense")}
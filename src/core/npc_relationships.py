@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+NPC Relationship Matrix
+=======================
+
+Per-(player, NPC) relationship state: relationship, trust, fear, respect
+and mood.
+
+Player and NPC ids are interned to small integers. Every pair a player has
+actually interacted with gets one row in compact typed columns
+(array.array: int8 relationship, uint8 trust/fear/respect/mood). Pairs
+without a row read the NPC's baseline disposition, so a player who has
+met 5 of 200 NPCs costs 5 rows, not 200.
+
+Each player keeps a sorted array of the NPCs they have met plus the
+matching row numbers, so point lookups are a binary search. Bulk queries
+("NPCs who trust player X above 50", "players NPC Y hates") run as NumPy
+vector operations over zero-copy views of the columns when NumPy is
+installed, and as plain loops otherwise.
+"""
+
+import operator
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FIELDS = ("relationship_level", "trust_level", "fear_level", "respect_level")
+_TYPECODES = {"relationship_level": "b", "trust_level": "B", "fear_level": "B", "respect_level": "B"}
+_LIMITS = {"relationship_level": (-100, 100), "trust_level": (0, 100), "fear_level": (0, 100),
+           "respect_level": (0, 100)}
+
+_OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+              "==": operator.eq, "!=": operator.ne}
+
+
+@dataclass
+class RelationshipState:
+    """One player's standing with one NPC"""
+    relationship_level: int  # -100 to 100
+    trust_level: int  # 0 to 100
+    fear_level: int  # 0 to 100
+    respect_level: int  # 0 to 100
+    current_mood: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _clamp(field: str, value: int) -> int:
+    low, high = _LIMITS[field]
+    return max(low, min(high, int(value)))
+
+
+class RelationshipMatrix:
+    """Sparse columnar store of relationship state per (player, NPC)"""
+
+    def __init__(self):
+        self.player_ids: Dict[str, int] = {}
+        self.players: List[str] = []
+        self.npc_ids: Dict[str, int] = {}
+        self.npcs: List[str] = []
+
+        self.mood_ids: Dict[str, int] = {}
+        self.moods: List[str] = []
+
+        # Baseline disposition per NPC (used for pairs without a row)
+        self._defaults = {field: array(_TYPECODES[field]) for field in FIELDS}
+        self._default_mood = array('B')
+
+        # One row per (player, NPC) pair that has diverged from the baseline
+        self._player = array('i')
+        self._npc = array('i')
+        self._columns = {field: array(_TYPECODES[field]) for field in FIELDS}
+        self._mood = array('B')
+
+        # Per player: sorted NPC indexes met and the row of each
+        self._met_npcs: List[array] = []
+        self._met_rows: List[array] = []
+
+    # Interning
+
+    def _mood_id(self, mood: str) -> int:
+        mood_id = self.mood_ids.get(mood)
+        if mood_id is None:
+            if len(self.moods) >= 255:
+                raise ValueError("Too many distinct moods")
+            mood_id = len(self.moods)
+            self.mood_ids[mood] = mood_id
+            self.moods.append(mood)
+        return mood_id
+
+    def _player_index(self, player_id: str, create: bool = False) -> Optional[int]:
+        index = self.player_ids.get(player_id)
+        if index is None and create:
+            index = len(self.players)
+            self.player_ids[player_id] = index
+            self.players.append(player_id)
+            self._met_npcs.append(array('i'))
+            self._met_rows.append(array('i'))
+        return index
+
+    def _npc_index(self, npc_id: str) -> int:
+        try:
+            return self.npc_ids[npc_id]
+        except KeyError:
+            raise KeyError(f"Unknown NPC: {npc_id}")
+
+    def add_npc(self, npc_id: str, relationship_level: int = 0, trust_level: int = 50, fear_level: int = 0,
+                respect_level: int = 50, current_mood: str = "neutral"):
+        """Register an NPC (or update its baseline) for players who have not met it yet"""
+        values = {"relationship_level": relationship_level, "trust_level": trust_level,
+                  "fear_level": fear_level, "respect_level": respect_level}
+        index = self.npc_ids.get(npc_id)
+        if index is None:
+            self.npc_ids[npc_id] = len(self.npcs)
+            self.npcs.append(npc_id)
+            for field in FIELDS:
+                self._defaults[field].append(_clamp(field, values[field]))
+            self._default_mood.append(self._mood_id(current_mood))
+        else:
+            for field in FIELDS:
+                self._defaults[field][index] = _clamp(field, values[field])
+            self._default_mood[index] = self._mood_id(current_mood)
+
+    # Rows
+
+    def _find_row(self, player: Optional[int], npc: int) -> Optional[int]:
+        if player is None:
+            return None
+        met = self._met_npcs[player]
+        position = bisect_left(met, npc)
+        if position < len(met) and met[position] == npc:
+            return self._met_rows[player][position]
+        return None
+
+    def _ensure_row(self, player: int, npc: int) -> int:
+        met = self._met_npcs[player]
+        position = bisect_left(met, npc)
+        if position < len(met) and met[position] == npc:
+            return self._met_rows[player][position]
+
+        row = len(self._player)
+        self._player.append(player)
+        self._npc.append(npc)
+        for field in FIELDS:
+            self._columns[field].append(self._defaults[field][npc])
+        self._mood.append(self._default_mood[npc])
+        met.insert(position, npc)
+        self._met_rows[player].insert(position, row)
+        return row
+
+    def _state(self, row: Optional[int], npc: int) -> RelationshipState:
+        if row is None:
+            return RelationshipState(*(self._defaults[field][npc] for field in FIELDS),
+                                     self.moods[self._default_mood[npc]])
+        return RelationshipState(*(self._columns[field][row] for field in FIELDS), self.moods[self._mood[row]])
+
+    # Point access
+
+    def get(self, player_id: str, npc_id: str) -> RelationshipState:
+        """State of a player with an NPC (the NPC's baseline if they never interacted)"""
+        npc = self._npc_index(npc_id)
+        return self._state(self._find_row(self.player_ids.get(player_id), npc), npc)
+
+    def has_met(self, player_id: str, npc_id: str) -> bool:
+        return self._find_row(self.player_ids.get(player_id), self._npc_index(npc_id)) is not None
+
+    def update(self, player_id: str, npc_id: str, **values) -> RelationshipState:
+        """Set fields (clamped to their ranges) and/or current_mood for a pair"""
+        npc = self._npc_index(npc_id)
+        row = self._ensure_row(self._player_index(player_id, create=True), npc)
+        for field, value in values.items():
+            if field == "current_mood":
+                self._mood[row] = self._mood_id(value)
+            elif field in self._columns:
+                self._columns[field][row] = _clamp(field, value)
+            else:
+                raise KeyError(f"Unknown relationship field: {field}")
+        return self._state(row, npc)
+
+    def adjust(self, player_id: str, npc_id: str, field: str, change: int) -> RelationshipState:
+        """Add change to a field, clamped"""
+        current = getattr(self.get(player_id, npc_id), field)
+        return self.update(player_id, npc_id, **{field: current + change})
+
+    def for_player(self, player_id: str, npc_ids: Optional[List[str]] = None) -> Dict[str, RelationshipState]:
+        """State with every NPC (or the given ones) for a player"""
+        player = self.player_ids.get(player_id)
+        indexes = range(len(self.npcs)) if npc_ids is None else [self._npc_index(npc_id) for npc_id in npc_ids]
+        return {self.npcs[npc]: self._state(self._find_row(player, npc), npc) for npc in indexes}
+
+    def met_npcs(self, player_id: str) -> List[str]:
+        player = self.player_ids.get(player_id)
+        return [] if player is None else [self.npcs[npc] for npc in self._met_npcs[player]]
+
+    # Vectorized queries
+
+    def player_column(self, player_id: str, field: str):
+        """
+        One field for every NPC from a player's point of view, indexed like self.npcs.
+
+        A NumPy array when NumPy is installed, a list otherwise.
+        """
+        player = self.player_ids.get(player_id)
+        if np is not None:
+            values = np.array(self._defaults[field], dtype=np.int16)
+            if player is not None and len(self._met_npcs[player]):
+                rows = np.frombuffer(self._met_rows[player], dtype=np.int32)
+                npcs = np.frombuffer(self._met_npcs[player], dtype=np.int32)
+                column = np.frombuffer(self._columns[field], dtype=np.dtype(_TYPECODES[field]))
+                values[npcs] = column[rows]
+            return values
+
+        values = list(self._defaults[field])
+        if player is not None:
+            column = self._columns[field]
+            for npc, row in zip(self._met_npcs[player], self._met_rows[player]):
+                values[npc] = column[row]
+        return values
+
+    def npcs_where(self, player_id: str, field: str, op: str, threshold: int) -> List[str]:
+        """NPC ids whose field compares to threshold for a player, e.g. ("trust_level", ">", 50)"""
+        compare = _OPERATORS[op]
+        values = self.player_column(player_id, field)
+        if np is not None:
+            return [self.npcs[npc] for npc in np.flatnonzero(compare(values, threshold)).tolist()]
+        return [self.npcs[npc] for npc, value in enumerate(values) if compare(value, threshold)]
+
+    def players_where(self, npc_id: str, field: str, op: str, threshold: int) -> List[str]:
+        """Known player ids whose standing with an NPC compares to threshold"""
+        compare = _OPERATORS[op]
+        npc = self._npc_index(npc_id)
+        default = self._defaults[field][npc]
+
+        if np is not None:
+            values = np.full(len(self.players), default, dtype=np.int16)
+            if len(self._npc):
+                pair_npcs = np.frombuffer(self._npc, dtype=np.int32)
+                rows = np.flatnonzero(pair_npcs == npc)
+                column = np.frombuffer(self._columns[field], dtype=np.dtype(_TYPECODES[field]))
+                values[np.frombuffer(self._player, dtype=np.int32)[rows]] = column[rows]
+            return [self.players[player] for player in np.flatnonzero(compare(values, threshold)).tolist()]
+
+        values = [default] * len(self.players)
+        column = self._columns[field]
+        for row, pair_npc in enumerate(self._npc):
+            if pair_npc == npc:
+                values[self._player[row]] = column[row]
+        return [self.players[player] for player, value in enumerate(values) if compare(value, threshold)]
+
+    # Persistence and accounting
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{player_id: {npc_id: state}} for the pairs that have rows"""
+        return {
+            player_id: {self.npcs[npc]: self._state(row, npc).to_dict()
+                        for npc, row in zip(self._met_npcs[player], self._met_rows[player])}
+            for player, player_id in enumerate(self.players) if len(self._met_npcs[player])
+        }
+
+    def load_dict(self, data: Dict[str, Dict[str, Dict[str, Any]]]):
+        for player_id, states in data.items():
+            for npc_id, state in states.items():
+                if npc_id in self.npc_ids:
+                    self.update(player_id, npc_id, **state)
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by the columns, per-player indexes and intern tables"""
+        total = sum(sys.getsizeof(column) for column in self._columns.values())
+        total += sys.getsizeof(self._player) + sys.getsizeof(self._npc) + sys.getsizeof(self._mood)
+        total += sum(sys.getsizeof(column) for column in self._defaults.values()) + sys.getsizeof(self._default_mood)
+        total += sum(sys.getsizeof(met) for met in self._met_npcs) + sum(sys.getsizeof(rows) for rows in self._met_rows)
+        total += sys.getsizeof(self.player_ids) + sum(sys.getsizeof(player_id) for player_id in self.players)
+        total += sys.getsizeof(self.players) + sys.getsizeof(self._met_npcs) + sys.getsizeof(self._met_rows)
+        total += sys.getsizeof(self.npc_ids) + sum(sys.getsizeof(npc_id) for npc_id in self.npcs)
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        return {"players": len(self.players), "npcs": len(self.npcs), "rows": len(self._player),
+                "memory_bytes": self.memory_bytes()}
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+NPC Social Graph
+================
+
+How NPCs relate to each other, kept as indexes that are updated when NPCs
+are added or their relationships change instead of being recomputed per
+request.
+
+Two kinds of information are held:
+
+- Compatibility: an NPC's temperament is one of a small, fixed set of
+  types (personality x moral alignment). Compatibility between two types
+  is precomputed into a table, and NPCs are bucketed by type, so "who gets
+  along with X" is one table row walked bucket by bucket.
+- Explicit relationships (relationships_with_others): a directed weighted
+  edge per pair. Edges at or above ALLY_THRESHOLD are ally edges, edges
+  below RIVAL_THRESHOLD are rival edges; both are kept as adjacency sets
+  in each direction.
+
+Graph queries (allies of allies, factions, betrayal chains) walk these
+adjacency sets, so their cost follows the size of the neighborhood they
+return, not the number of NPCs.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Set
+
+# Relationship levels with the same meaning as NPCRelationshipSystem._get_relationship_status
+ALLY_THRESHOLD = 60  # "Friendly" or better
+RIVAL_THRESHOLD = 20  # "Hostile" or worse
+
+# Compatibility bands used by get_social_dynamics
+ALLY_COMPATIBILITY = 0.7
+RIVAL_COMPATIBILITY = 0.3
+
+
+class NPCSocialGraph:
+    """Type buckets, compatibility table and ally/rival adjacency for NPCs"""
+
+    def __init__(self, compatibility: Sequence[Sequence[float]]):
+        # compatibility[type_a][type_b], precomputed by the caller
+        self.compatibility = [list(row) for row in compatibility]
+        self.types: Dict[str, int] = {}
+        self.members: Dict[int, Set[str]] = {}
+
+        self.edges: Dict[str, Dict[str, int]] = {}  # npc -> {other: level}
+        self.allies: Dict[str, Set[str]] = {}
+        self.rivals: Dict[str, Set[str]] = {}
+        self.allied_by: Dict[str, Set[str]] = {}
+        self.rivaled_by: Dict[str, Set[str]] = {}
+
+    # Maintenance
+
+    def add_npc(self, npc_id: str, type_id: int, relationships: Optional[Dict[str, int]] = None):
+        """Add an NPC, or replace its type and outgoing relationships (edges towards it are kept)"""
+        if npc_id in self.types:
+            self.members[self.types[npc_id]].discard(npc_id)
+            for other_id in list(self.edges[npc_id]):
+                self.remove_relationship(npc_id, other_id)
+        self.types[npc_id] = type_id
+        self.members.setdefault(type_id, set()).add(npc_id)
+        for index in (self.edges, self.allies, self.rivals, self.allied_by, self.rivaled_by):
+            index.setdefault(npc_id, {} if index is self.edges else set())
+        for other_id, level in (relationships or {}).items():
+            self.set_relationship(npc_id, other_id, level)
+
+    def remove_npc(self, npc_id: str):
+        type_id = self.types.pop(npc_id, None)
+        if type_id is None:
+            return
+        self.members[type_id].discard(npc_id)
+        for other_id in list(self.edges.get(npc_id, {})):
+            self.remove_relationship(npc_id, other_id)
+        for other_id in list(self.allied_by.get(npc_id, set()) | self.rivaled_by.get(npc_id, set())):
+            self.remove_relationship(other_id, npc_id)
+        for index in (self.edges, self.allies, self.rivals, self.allied_by, self.rivaled_by):
+            index.pop(npc_id, None)
+
+    def set_relationship(self, npc_id: str, other_id: str, level: int):
+        """Record how npc_id feels about other_id, moving the edge between ally/rival/neutral"""
+        if npc_id == other_id:
+            return
+        self.remove_relationship(npc_id, other_id)
+        self.edges.setdefault(npc_id, {})[other_id] = level
+        if level >= ALLY_THRESHOLD:
+            self.allies.setdefault(npc_id, set()).add(other_id)
+            self.allied_by.setdefault(other_id, set()).add(npc_id)
+        elif level < RIVAL_THRESHOLD:
+            self.rivals.setdefault(npc_id, set()).add(other_id)
+            self.rivaled_by.setdefault(other_id, set()).add(npc_id)
+
+    def remove_relationship(self, npc_id: str, other_id: str):
+        if self.edges.get(npc_id, {}).pop(other_id, None) is None:
+            return
+        self.allies.get(npc_id, set()).discard(other_id)
+        self.rivals.get(npc_id, set()).discard(other_id)
+        self.allied_by.get(other_id, set()).discard(npc_id)
+        self.rivaled_by.get(other_id, set()).discard(npc_id)
+
+    # Compatibility
+
+    def compatibility_between(self, npc_id: str, other_id: str) -> float:
+        return self.compatibility[self.types[npc_id]][self.types[other_id]]
+
+    def compatibility_groups(self, npc_id: str) -> Dict[str, List[str]]:
+        """Other NPCs split into allies/rivals/neutral by temperament, one table lookup per type"""
+        groups = {"allies": [], "rivals": [], "neutral": []}
+        row = self.compatibility[self.types[npc_id]]
+        for type_id, members in self.members.items():
+            if not members:
+                continue
+            compatibility = row[type_id]
+            if compatibility > ALLY_COMPATIBILITY:
+                group = groups["allies"]
+            elif compatibility < RIVAL_COMPATIBILITY:
+                group = groups["rivals"]
+            else:
+                group = groups["neutral"]
+            group.extend(member for member in members if member != npc_id)
+        return groups
+
+    # Graph queries
+
+    def allies_of_allies(self, npc_id: str) -> Set[str]:
+        """NPCs an ally of npc_id counts as an ally, excluding npc_id and its direct allies"""
+        direct = self.allies.get(npc_id, set())
+        found = set()
+        for ally in direct:
+            found |= self.allies.get(ally, set())
+        return found - direct - {npc_id}
+
+    def faction(self, npc_id: str) -> Set[str]:
+        """NPCs connected to npc_id through ally edges in either direction"""
+        if npc_id not in self.types:
+            return set()
+        seen = {npc_id}
+        queue = deque([npc_id])
+        while queue:
+            current = queue.popleft()
+            for other in self.allies.get(current, set()) | self.allied_by.get(current, set()):
+                if other not in seen and other in self.types:
+                    seen.add(other)
+                    queue.append(other)
+        return seen
+
+    def factions(self, min_size: int = 2) -> List[Set[str]]:
+        """Every faction of at least min_size NPCs (visits each NPC and edge once)"""
+        seen: Set[str] = set()
+        clusters = []
+        for npc_id in self.types:
+            if npc_id in seen:
+                continue
+            cluster = self.faction(npc_id)
+            seen |= cluster
+            if len(cluster) >= min_size:
+                clusters.append(cluster)
+        return clusters
+
+    def betrayal_chains(self, npc_id: str, max_depth: int = 3) -> List[List[str]]:
+        """
+        Paths of trust from npc_id ending at an NPC who is hostile to npc_id.
+
+        Each chain is [npc_id, ally, ..., betrayer] following ally edges, where
+        the betrayer holds a rival edge towards npc_id.
+        """
+        enemies = self.rivaled_by.get(npc_id, set())
+        if not enemies:
+            return []
+        chains = []
+        seen = {npc_id}
+        queue = deque([[npc_id]])
+        while queue:
+            path = queue.popleft()
+            if len(path) > max_depth:
+                continue
+            for ally in self.allies.get(path[-1], set()):
+                if ally in seen:
+                    continue
+                seen.add(ally)
+                next_path = path + [ally]
+                if ally in enemies:
+                    chains.append(next_path)
+                queue.append(next_path)
+        return chains
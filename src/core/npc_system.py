@@ -2,16 +2,35 @@
 """
 Advanced NPC Relationship and Moral System
 Handles NPC interactions, moral consequences, and relationship dynamics
+
+Relationship, trust, fear, respect and mood are tracked per player in
+NPCRelationshipSystem.relationships (see npc_relationships); the matching
+NPC fields only hold the baseline a player starts from.
 """
 
 import random
 import logging
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields, replace
 from enum import Enum
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from src.core.betrayal_system import BetrayalSystem
+from src.core.intent_classifier import classify_intent
+from src.core.npc_relationships import RelationshipMatrix
+from src.core.npc_social_graph import NPCSocialGraph
+
+# Player used when a caller does not say whose relationships to use
+DEFAULT_PLAYER_ID = "player_001"
+
+# Intent labels (see intent_classifier) that make an action good or bad
+GOOD_INTENTS = ("help", "heal", "protect", "donate")
+BAD_INTENTS = ("combat", "kill", "steal", "threaten", "deceive")
 
 # Define missing classes as simple dataclasses
 @dataclass
@@ -81,6 +100,44 @@ class NPCPersonality(Enum):
     AMBITIOUS = "ambitious"
     CONTENT = "content"
 
+# Stable personality order for per-NPC code arrays
+PERSONALITIES = list(NPCPersonality)
+ALIGNMENTS = list(MoralAlignment)
+
+def _temperament_compatibility(personality1: NPCPersonality, alignment1: MoralAlignment,
+                               personality2: NPCPersonality, alignment2: MoralAlignment) -> float:
+    """Compatibility between two NPC temperaments (personality and moral alignment)"""
+    compatibility = 0.5
+    
+    # Personality compatibility
+    if personality1 == personality2:
+        compatibility += 0.2
+    elif (personality1 == NPCPersonality.FRIENDLY and personality2 == NPCPersonality.TRUSTING):
+        compatibility += 0.3
+    elif (personality1 == NPCPersonality.PARANOID and personality2 == NPCPersonality.CUNNING):
+        compatibility -= 0.3
+    elif (personality1 == NPCPersonality.NAIVE and personality2 == NPCPersonality.CUNNING):
+        compatibility -= 0.4
+    
+    # Moral alignment compatibility
+    if alignment1 == alignment2:
+        compatibility += 0.2
+    elif (alignment1 in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and 
+          alignment2 in [MoralAlignment.BAD, MoralAlignment.VERY_BAD]):
+        compatibility -= 0.3
+    
+    return max(0.0, min(1.0, compatibility))
+
+def temperament_id(personality: NPCPersonality, alignment: MoralAlignment) -> int:
+    """Index of a (personality, alignment) pair in COMPATIBILITY_TABLE"""
+    return PERSONALITIES.index(personality) * len(ALIGNMENTS) + ALIGNMENTS.index(alignment)
+
+# Compatibility of every temperament pair, indexed by temperament_id
+COMPATIBILITY_TABLE = [
+    [_temperament_compatibility(p1, a1, p2, a2) for p2 in PERSONALITIES for a2 in ALIGNMENTS]
+    for p1 in PERSONALITIES for a1 in ALIGNMENTS
+]
+
 class NPCRole(Enum):
     """NPC roles in the game world"""
     QUEST_GIVER = "quest_giver"
@@ -100,22 +157,27 @@ class NPCRole(Enum):
     NOBLE = "noble"
     PEASANT = "peasant"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NPCPersonalityTraits:
-    """Detailed personality traits for NPCs"""
+    """
+    Detailed personality traits for NPCs.
+    
+    Immutable and shared: NPCs with the same personality reference one
+    interned template (see TRAIT_TEMPLATES), phrase lists are stored as tuples.
+    """
     personality_type: NPCPersonality
     speech_style: str
-    greeting_phrases: List[str]
-    farewell_phrases: List[str]
-    positive_reactions: List[str]
-    negative_reactions: List[str]
-    neutral_reactions: List[str]
-    threat_responses: List[str]
-    help_responses: List[str]
-    trade_responses: List[str]
-    quest_responses: List[str]
-    combat_responses: List[str]
-    fear_responses: List[str]
+    greeting_phrases: Tuple[str, ...]
+    farewell_phrases: Tuple[str, ...]
+    positive_reactions: Tuple[str, ...]
+    negative_reactions: Tuple[str, ...]
+    neutral_reactions: Tuple[str, ...]
+    threat_responses: Tuple[str, ...]
+    help_responses: Tuple[str, ...]
+    trade_responses: Tuple[str, ...]
+    quest_responses: Tuple[str, ...]
+    combat_responses: Tuple[str, ...]
+    fear_responses: Tuple[str, ...]
     trust_threshold: int
     anger_threshold: int
     generosity_level: int
@@ -133,6 +195,81 @@ class NPCPersonalityTraits:
     influence_susceptibility: int  # 1-10, how easily they can be influenced
     conflict_resolution: int  # 1-10, how they handle conflicts
     leadership_tendency: int  # 1-10, how likely they are to take charge
+    # Template this set of traits is (derived from); defaults to the personality name
+    template_id: str = ""
+    
+    def __post_init__(self):
+        for trait in fields(self):
+            value = getattr(self, trait.name)
+            if isinstance(value, list):
+                object.__setattr__(self, trait.name, tuple(value))
+        object.__setattr__(self, "personality_type", NPCPersonality(self.personality_type))
+        if not self.template_id:
+            object.__setattr__(self, "template_id", self.personality_type.value)
+
+# Interned trait templates shared by every NPC, keyed by template id
+TRAIT_TEMPLATES: Dict[str, NPCPersonalityTraits] = {}
+# Templates with per-NPC overrides applied, keyed by (template id, overrides)
+_DERIVED_TRAITS: Dict[Tuple, NPCPersonalityTraits] = {}
+DEFAULT_TEMPLATE_SUFFIX = "_default"
+
+def intern_trait_template(traits: NPCPersonalityTraits) -> NPCPersonalityTraits:
+    """The shared template for traits.template_id, registering traits if it is new"""
+    return TRAIT_TEMPLATES.setdefault(traits.template_id, traits)
+
+def default_trait_template(personality: NPCPersonality) -> NPCPersonalityTraits:
+    """Plain "<personality>_default" template for personalities without hand-written traits"""
+    return intern_trait_template(NPCPersonalityTraits(
+        personality_type=personality,
+        speech_style="neutral",
+        greeting_phrases=["Hello."],
+        farewell_phrases=["Goodbye."],
+        positive_reactions=["Good."],
+        negative_reactions=["Bad."],
+        neutral_reactions=["Okay."],
+        threat_responses=["No."],
+        help_responses=["Maybe."],
+        trade_responses=["Trade."],
+        quest_responses=["Quest."],
+        combat_responses=["Fight."],
+        fear_responses=["Scared."],
+        trust_threshold=50,
+        anger_threshold=50,
+        generosity_level=5,
+        intelligence_level=5,
+        bravery_level=5,
+        loyalty_level=5,
+        curiosity_level=5,
+        suspiciousness_level=5,
+        emotional_stability=5,
+        social_preference=5,
+        risk_tolerance=5,
+        adaptability=5,
+        memory_retention=5,
+        influence_susceptibility=5,
+        conflict_resolution=5,
+        leadership_tendency=5,
+        template_id=f"{personality.value}{DEFAULT_TEMPLATE_SUFFIX}"
+    ))
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+def resolve_traits(template_id: str, overrides: Optional[Dict[str, Any]] = None) -> NPCPersonalityTraits:
+    """Template traits with per-NPC overrides applied; equal combinations share one instance"""
+    template = TRAIT_TEMPLATES.get(template_id)
+    if template is None:
+        # Default templates can always be rebuilt; any other id must have been registered
+        if not template_id.endswith(DEFAULT_TEMPLATE_SUFFIX):
+            raise KeyError(template_id)
+        template = default_trait_template(NPCPersonality(template_id[:-len(DEFAULT_TEMPLATE_SUFFIX)]))
+    if not overrides:
+        return template
+    key = (template_id, tuple(sorted((name, _hashable(value)) for name, value in overrides.items())))
+    traits = _DERIVED_TRAITS.get(key)
+    if traits is None:
+        traits = _DERIVED_TRAITS[key] = replace(template, **overrides)
+    return traits
 
 @dataclass
 class NPC:
@@ -145,6 +282,7 @@ class NPC:
     description: str
     location: str
     moral_alignment: MoralAlignment
+    # Baseline disposition; per-player values live in NPCRelationshipSystem.relationships
     relationship_level: int  # -100 to 100
     trust_level: int  # 0 to 100
     fear_level: int  # 0 to 100
@@ -159,6 +297,47 @@ class NPC:
     current_mood: str
     secrets_known: List[str]
     relationships_with_others: Dict[str, int]
+    # Trait values that differ from the personality_traits template
+    trait_overrides: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form; traits are written as their template id plus trait_overrides"""
+        data = {}
+        for npc_field in fields(self):
+            value = getattr(self, npc_field.name)
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, (list, dict)):
+                value = value.copy()
+            data[npc_field.name] = value
+        data["personality_traits"] = self.personality_traits.template_id
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NPC":
+        """Rebuild an NPC from to_dict() output (or an older snapshot with the full traits inlined)"""
+        data = dict(data)
+        data["role"] = NPCRole(data["role"])
+        data["personality"] = NPCPersonality(data["personality"])
+        data["moral_alignment"] = MoralAlignment(data["moral_alignment"])
+        overrides = dict(data.get("trait_overrides") or {})
+        
+        traits = data["personality_traits"]
+        if isinstance(traits, dict):
+            # Older snapshots: keep whatever differs from the personality's template
+            personality = data["personality"].value
+            template = (TRAIT_TEMPLATES.get(traits.get("template_id") or personality)
+                        or TRAIT_TEMPLATES.get(f"{personality}{DEFAULT_TEMPLATE_SUFFIX}"))
+            traits = {name: value for name, value in traits.items() if name != "template_id"}
+            if template is None:
+                template = intern_trait_template(NPCPersonalityTraits(**traits))
+            overrides.update({name: value for name, value in traits.items()
+                              if name != "personality_type" and _hashable(value) != getattr(template, name)})
+            traits = template.template_id
+        
+        data["trait_overrides"] = overrides
+        data["personality_traits"] = resolve_traits(traits, overrides)
+        return cls(**data)
 
 @dataclass
 class PlayerMoral:
@@ -180,6 +359,9 @@ class NPCRelationshipSystem:
         self.npcs: Dict[str, NPC] = {}
         self.player_morals: Dict[str, PlayerMoral] = {}
         self.betrayal_system = BetrayalSystem()  # Add betrayal system
+        self.relationships = RelationshipMatrix()  # Per-player relationship state
+        self._personality_codes: List[int] = []  # Personality per matrix NPC index
+        self.social_graph = NPCSocialGraph(COMPATIBILITY_TABLE)  # NPC-to-NPC relationships
         
         # Initialize personality traits first
         self.personality_traits = self._initialize_personality_traits()
@@ -192,11 +374,13 @@ class NPCRelationshipSystem:
         # Record the decision
         decision = self.betrayal_system.record_player_decision(decision_data)
         
+        player_id = decision_data.get("player_id", DEFAULT_PLAYER_ID)
+        
         # Update NPC relationships based on decision
-        self._update_npc_relationships_from_decision(decision)
+        self._update_npc_relationships_from_decision(decision, player_id)
         
         # Check for betrayal triggers
-        betrayal_result = self._check_betrayal_triggers(decision)
+        betrayal_result = self._check_betrayal_triggers(decision, player_id)
         
         return {
             "decision": {
@@ -210,7 +394,7 @@ class NPCRelationshipSystem:
             "betrayal_details": betrayal_result
         }
     
-    def _update_npc_relationships_from_decision(self, decision: PlayerDecision):
+    def _update_npc_relationships_from_decision(self, decision: PlayerDecision, player_id: str = DEFAULT_PLAYER_ID):
         """Update NPC relationships based on player decision"""
         for npc_id in decision.affected_npcs:
             if npc_id in self.npcs:
@@ -218,10 +402,10 @@ class NPCRelationshipSystem:
                 
                 # Calculate relationship change based on decision
                 change = self._calculate_decision_impact(decision, npc)
-                npc.relationship_level = max(-100, min(100, npc.relationship_level + change))
+                self.relationships.adjust(player_id, npc_id, "relationship_level", change)
                 
                 # Update mood based on relationship change
-                self._update_npc_mood(npc, change)
+                self._update_npc_mood(npc, change, player_id)
     
     def _calculate_decision_impact(self, decision: PlayerDecision, npc: NPC) -> int:
         """Calculate how a decision affects an NPC's relationship"""
@@ -257,28 +441,31 @@ class NPCRelationshipSystem:
         
         return base_change
     
-    def _check_betrayal_triggers(self, decision: PlayerDecision) -> Optional[Dict[str, Any]]:
+    def _check_betrayal_triggers(self, decision: PlayerDecision,
+                                 player_id: str = DEFAULT_PLAYER_ID) -> Optional[Dict[str, Any]]:
         """Check if a decision triggers any betrayal events"""
         # Get current player state for betrayal system
-        player_state = self._get_current_player_state()
+        player_state = self._get_current_player_state(player_id)
         
         # Check for betrayal triggers
         betrayal_result = self.betrayal_system._check_betrayal_triggers(decision)
         
         if betrayal_result:
             # Update affected NPCs
-            self._handle_betrayal_consequences(betrayal_result)
+            self._handle_betrayal_consequences(betrayal_result, player_id)
             return betrayal_result
         
         return None
     
-    def _get_current_player_state(self) -> Dict[str, Any]:
+    def _get_current_player_state(self, player_id: Optional[str] = None) -> Dict[str, Any]:
         """Get current player state for betrayal system"""
         if not self.player_morals:
             return {}
         
-        # Get the first player moral (assuming single player for now)
-        player_moral = list(self.player_morals.values())[0]
+        # Default to the first player moral (single player)
+        if player_id not in self.player_morals:
+            player_id = next(iter(self.player_morals))
+        player_moral = self.player_morals[player_id]
         
         return {
             "reputation": player_moral.reputation,
@@ -286,23 +473,25 @@ class NPCRelationshipSystem:
             "good_actions": player_moral.good_actions,
             "bad_actions": player_moral.bad_actions,
             "npc_relationships": {
-                npc_id: npc.relationship_level 
-                for npc_id, npc in self.npcs.items()
+                npc_id: state.relationship_level
+                for npc_id, state in self.relationships.for_player(player_id, list(self.npcs)).items()
             },
-            "suspicion_level": self._calculate_suspicion_level(),
+            "suspicion_level": self._calculate_suspicion_level(player_id),
             "knowledge": self._calculate_player_knowledge(),
             "wisdom": self._calculate_player_wisdom()
         }
     
-    def _calculate_suspicion_level(self) -> int:
+    def _calculate_suspicion_level(self, player_id: str = DEFAULT_PLAYER_ID) -> int:
         """Calculate player's current suspicion level"""
         suspicion = 0
         
         # Check for suspicious NPC behaviors
-        for npc in self.npcs.values():
-            if npc.relationship_level < 0:
+        states = self.relationships.for_player(player_id, list(self.npcs))
+        for npc_id, npc in self.npcs.items():
+            state = states[npc_id]
+            if state.relationship_level < 0:
                 suspicion += 2
-            if npc.current_mood in ["suspicious", "angry", "fearful"]:
+            if state.current_mood in ["suspicious", "angry", "fearful"]:
                 suspicion += 1
             if npc.personality_traits.personality_type.value == "paranoid":
                 suspicion += 1
@@ -319,33 +508,34 @@ class NPCRelationshipSystem:
         # This would be based on moral choices, experience, etc.
         return 6  # Default value
     
-    def _handle_betrayal_consequences(self, betrayal_result: Dict[str, Any]):
+    def _handle_betrayal_consequences(self, betrayal_result: Dict[str, Any], player_id: str = DEFAULT_PLAYER_ID):
         """Handle the consequences of a betrayal"""
         betrayer_id = betrayal_result["betrayer"]
         
         if betrayer_id in self.npcs:
             npc = self.npcs[betrayer_id]
             
-            # Update NPC to reflect betrayal
-            npc.relationship_level = -50  # Significant negative change
-            npc.current_mood = "hostile"
-            npc.trust_level = 0
-            npc.fear_level = 0
-            npc.respect_level = 0
+            # Update the betrayed player's standing with the NPC
+            self.relationships.update(player_id, betrayer_id,
+                                      relationship_level=-50,  # Significant negative change
+                                      current_mood="hostile",
+                                      trust_level=0,
+                                      fear_level=0,
+                                      respect_level=0)
             
             # Add betrayal consequences to NPC
             if "consequences" not in npc.__dict__:
                 npc.consequences = []
             npc.consequences.extend(betrayal_result["consequences"])
     
-    def get_betrayal_warnings(self) -> List[Dict[str, Any]]:
+    def get_betrayal_warnings(self, player_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get warnings about potential betrayals"""
-        player_state = self._get_current_player_state()
+        player_state = self._get_current_player_state(player_id)
         return self.betrayal_system.predict_potential_betrayals(player_state)
     
-    def get_plot_twist_hints(self) -> List[Dict[str, Any]]:
+    def get_plot_twist_hints(self, player_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get hints about potential plot twists"""
-        player_state = self._get_current_player_state()
+        player_state = self._get_current_player_state(player_id)
         return self.betrayal_system.check_plot_twist_triggers(player_state)
     
     def get_betrayal_summary(self) -> Dict[str, Any]:
@@ -422,8 +612,8 @@ class NPCRelationshipSystem:
         }
     
     def _initialize_personality_traits(self):
-        """Initialize personality traits for all personality types"""
-        return {
+        """Initialize personality traits for all personality types (interned templates)"""
+        templates = {
             NPCPersonality.FRIENDLY: NPCPersonalityTraits(
                 personality_type=NPCPersonality.FRIENDLY,
                 speech_style="warm and welcoming",
@@ -1642,52 +1832,24 @@ class NPCRelationshipSystem:
                 leadership_tendency=5
             )
         }
+        templates = {personality: intern_trait_template(traits) for personality, traits in templates.items()}
+        for personality in NPCPersonality:
+            if personality not in templates:
+                templates[personality] = default_trait_template(personality)
+        return templates
     
     def create_npc(self, npc_data: Dict[str, Any]) -> NPC:
         """Create an NPC with detailed personality"""
         personality_type = NPCPersonality(npc_data.get("personality", "neutral"))
-        personality_traits = self.personality_traits.get(personality_type)
-        
-        if not personality_traits:
-            # Create default traits if not found
-            personality_traits = NPCPersonalityTraits(
-                personality_type=personality_type,
-                speech_style="neutral",
-                greeting_phrases=["Hello."],
-                farewell_phrases=["Goodbye."],
-                positive_reactions=["Good."],
-                negative_reactions=["Bad."],
-                neutral_reactions=["Okay."],
-                threat_responses=["No."],
-                help_responses=["Maybe."],
-                trade_responses=["Trade."],
-                quest_responses=["Quest."],
-                combat_responses=["Fight."],
-                fear_responses=["Scared."],
-                trust_threshold=50,
-                anger_threshold=50,
-                generosity_level=5,
-                intelligence_level=5,
-                bravery_level=5,
-                loyalty_level=5,
-                curiosity_level=5,
-                suspiciousness_level=5,
-                emotional_stability=5,
-                social_preference=5,
-                risk_tolerance=5,
-                adaptability=5,
-                memory_retention=5,
-                influence_susceptibility=5,
-                conflict_resolution=5,
-                leadership_tendency=5
-            )
+        personality_traits = self.personality_traits[personality_type]
+        trait_overrides = npc_data.get("trait_overrides", {})
         
         npc = NPC(
             id=npc_data["id"],
             name=npc_data["name"],
             role=NPCRole(npc_data.get("role", "villager")),
             personality=personality_type,
-            personality_traits=personality_traits,
+            personality_traits=resolve_traits(personality_traits.template_id, trait_overrides),
             description=npc_data.get("description", ""),
             location=npc_data.get("location", "unknown"),
             moral_alignment=MoralAlignment(npc_data.get("moral_alignment", "neutral")),
@@ -1704,12 +1866,37 @@ class NPCRelationshipSystem:
             background_story=npc_data.get("background_story", ""),
             current_mood="neutral",
             secrets_known=npc_data.get("secrets_known", []),
-            relationships_with_others=npc_data.get("relationships_with_others", {})
+            relationships_with_others=npc_data.get("relationships_with_others", {}),
+            trait_overrides=trait_overrides
         )
         
         self.npcs[npc.id] = npc
+        self._register_npc(npc)
         return npc
     
+    def _register_npc(self, npc: NPC):
+        """Add an NPC's baseline disposition and personality to the relationship matrix"""
+        self.relationships.add_npc(npc.id, npc.relationship_level, npc.trust_level, npc.fear_level,
+                                   npc.respect_level, npc.current_mood)
+        code = PERSONALITIES.index(NPCPersonality(npc.personality))
+        index = self.relationships.npc_ids[npc.id]
+        if index == len(self._personality_codes):
+            self._personality_codes.append(code)
+        else:
+            self._personality_codes[index] = code
+        self.social_graph.add_npc(npc.id, temperament_id(NPCPersonality(npc.personality),
+                                                         MoralAlignment(npc.moral_alignment)),
+                                  npc.relationships_with_others)
+    
+    def set_npc_relationship(self, npc_id: str, other_npc_id: str, relationship_level: int) -> bool:
+        """Change how one NPC feels about another, keeping the social graph in step"""
+        if npc_id not in self.npcs:
+            return False
+        relationship_level = max(-100, min(100, relationship_level))
+        self.npcs[npc_id].relationships_with_others[other_npc_id] = relationship_level
+        self.social_graph.set_relationship(npc_id, other_npc_id, relationship_level)
+        return True
+    
     def _set_initial_relationship(self, personality: NPCPersonality, moral_alignment: str) -> int:
         """Set initial relationship based on personality and moral alignment"""
         base_relationship = 0
@@ -1752,7 +1939,8 @@ class NPCRelationshipSystem:
         
         return max(-100, min(100, base_relationship))
     
-    def interact_with_npc(self, npc_id: str, action: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def interact_with_npc(self, npc_id: str, action: str, player_moral: PlayerMoral,
+                          player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Interact with an NPC using detailed personality system"""
         if npc_id not in self.npcs:
             return {"success": False, "error": "NPC not found"}
@@ -1766,21 +1954,22 @@ class NPCRelationshipSystem:
         # Calculate relationship change based on personality
         relationship_change = self._calculate_relationship_change(action, npc, action_morality)
         
-        # Update NPC relationship
-        old_relationship = npc.relationship_level
-        npc.relationship_level = max(-100, min(100, npc.relationship_level + relationship_change))
+        # Update this player's relationship with the NPC
+        old_relationship = self.relationships.get(player_id, npc_id).relationship_level
+        new_relationship = self.relationships.adjust(player_id, npc_id, "relationship_level",
+                                                     relationship_change).relationship_level
         
         # Generate NPC response based on personality
         npc_response = self._generate_npc_response(npc, action, action_morality, relationship_change)
         
         # Check for special consequences
-        consequences = self._check_special_consequences(npc, old_relationship, npc.relationship_level)
+        consequences = self._check_special_consequences(npc, old_relationship, new_relationship)
         
         # Update player moral
         self._update_player_moral(player_moral, action_morality)
         
         # Update NPC mood based on interaction
-        self._update_npc_mood(npc, relationship_change)
+        self._update_npc_mood(npc, relationship_change, player_id)
         
         return {
             "success": True,
@@ -1788,7 +1977,7 @@ class NPCRelationshipSystem:
             "npc_personality": npc.personality.value,
             "action": action,
             "relationship_change": relationship_change,
-            "new_relationship_level": npc.relationship_level,
+            "new_relationship_level": new_relationship,
             "npc_response": npc_response,
             "consequences": consequences,
             "player_moral": self._get_player_moral_summary(player_moral)
@@ -1796,15 +1985,14 @@ class NPCRelationshipSystem:
     
     def _get_action_morality(self, action: str) -> str:
         """Determine the moral alignment of an action"""
-        good_actions = ["help", "heal", "donate", "protect", "save", "rescue", "comfort"]
-        bad_actions = ["attack", "steal", "threaten", "kill", "betray", "torture", "deceive"]
-        neutral_actions = ["talk", "trade", "explore", "investigate", "observe"]
+        intents = classify_intent(action)
+        good = sum(intents.get(label, 0) for label in GOOD_INTENTS)
+        bad = sum(intents.get(label, 0) for label in BAD_INTENTS)
         
-        action_lower = action.lower()
-        
-        if any(good in action_lower for good in good_actions):
+        # Mixed actions count as bad unless the good side clearly outweighs them
+        if good > bad:
             return "good"
-        elif any(bad in action_lower for bad in bad_actions):
+        elif bad:
             return "bad"
         else:
             return "neutral"
@@ -1903,22 +2091,24 @@ class NPCRelationshipSystem:
         else:
             return random.choice(traits.neutral_reactions)
     
-    def _update_npc_mood(self, npc: NPC, relationship_change: int):
-        """Update NPC mood based on interaction"""
+    def _update_npc_mood(self, npc: NPC, relationship_change: int, player_id: str = DEFAULT_PLAYER_ID):
+        """Update NPC mood towards a player based on interaction"""
         if relationship_change > 10:
-            npc.current_mood = "happy"
+            mood = "happy"
         elif relationship_change > 5:
-            npc.current_mood = "pleased"
+            mood = "pleased"
         elif relationship_change < -10:
-            npc.current_mood = "angry"
+            mood = "angry"
         elif relationship_change < -5:
-            npc.current_mood = "disappointed"
+            mood = "disappointed"
         else:
-            npc.current_mood = "neutral"
+            mood = "neutral"
+        self.relationships.update(player_id, npc.id, current_mood=mood)
     
-    def get_npc_mood_response(self, npc: NPC, situation: str) -> str:
+    def get_npc_mood_response(self, npc: NPC, situation: str, player_id: str = DEFAULT_PLAYER_ID) -> str:
         """Get NPC response based on current mood and personality"""
         traits = npc.personality_traits
+        current_mood = self.relationships.get(player_id, npc.id).current_mood
         
         # Base response based on situation
         if situation == "greeting":
@@ -1950,12 +2140,12 @@ class NPCRelationshipSystem:
         base_response = random.choice(responses)
         
         # Add mood-based modifiers
-        if npc.current_mood == "happy":
+        if current_mood == "happy":
             if npc.personality == NPCPersonality.GRUMPY:
                 base_response = base_response.replace("Hmph", "Hmph... fine")
             elif npc.personality == NPCPersonality.PARANOID:
                 base_response = base_response.replace("I'm watching you", "I'm... I'm watching you, but maybe not as closely")
-        elif npc.current_mood == "angry":
+        elif current_mood == "angry":
             if npc.personality == NPCPersonality.FRIENDLY:
                 base_response = base_response.replace("Hello", "Hello... *sigh*")
             elif npc.personality == NPCPersonality.NAIVE:
@@ -1963,7 +2153,8 @@ class NPCRelationshipSystem:
         
         return base_response
     
-    def get_personality_based_dialogue(self, npc: NPC, context: str, player_moral: PlayerMoral) -> str:
+    def get_personality_based_dialogue(self, npc: NPC, context: str, player_moral: PlayerMoral,
+                                       player_id: str = DEFAULT_PLAYER_ID) -> str:
         """Generate personality-specific dialogue based on context and player moral"""
         traits = npc.personality_traits
         
@@ -2000,7 +2191,7 @@ class NPCRelationshipSystem:
                 return "I have simple goods. They serve me well. Take what you need."
         
         # Default response
-        return self.get_npc_mood_response(npc, context)
+        return self.get_npc_mood_response(npc, context, player_id)
     
     def calculate_personality_compatibility(self, npc: NPC, player_moral: PlayerMoral) -> float:
         """Calculate how compatible the NPC is with the player's moral alignment"""
@@ -2061,37 +2252,44 @@ class NPCRelationshipSystem:
         
         return ""  # No special memory response
     
-    def get_personality_development(self, npc: NPC, interaction_count: int) -> Dict[str, Any]:
+    def get_personality_development(self, npc: NPC, interaction_count: int,
+                                    player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Simulate personality development based on interactions"""
         traits = npc.personality_traits
+        relationship_level = self.relationships.get(player_id, npc.id).relationship_level
         development = {}
         
         # Personality can evolve based on interactions
         if interaction_count > 10:
             if npc.personality == NPCPersonality.PARANOID:
-                if npc.relationship_level > 50:
+                if relationship_level > 50:
                     development["trust_increase"] = True
                     development["suspiciousness_decrease"] = True
             elif npc.personality == NPCPersonality.NAIVE:
-                if npc.relationship_level < -30:
+                if relationship_level < -30:
                     development["trust_decrease"] = True
                     development["suspiciousness_increase"] = True
             elif npc.personality == NPCPersonality.COWARDLY:
-                if npc.relationship_level > 70:
+                if relationship_level > 70:
                     development["bravery_increase"] = True
                     development["fear_decrease"] = True
         
         return development
     
-    def get_social_dynamics(self, npc: NPC, other_npcs: List[NPC]) -> Dict[str, Any]:
-        """Calculate how this NPC interacts with other NPCs"""
+    def get_social_dynamics(self, npc: NPC, other_npcs: Optional[List[NPC]] = None) -> Dict[str, Any]:
+        """Calculate how this NPC interacts with other NPCs (all registered NPCs by default)"""
+        if other_npcs is None and npc.id in self.social_graph.types:
+            groups = self.social_graph.compatibility_groups(npc.id)
+            return {group: [self.npcs[other_id].name for other_id in members if other_id in self.npcs]
+                    for group, members in groups.items()}
+        
         dynamics = {
             "allies": [],
             "rivals": [],
             "neutral": []
         }
         
-        for other_npc in other_npcs:
+        for other_npc in other_npcs or []:
             if other_npc.id == npc.id:
                 continue
             
@@ -2108,113 +2306,139 @@ class NPCRelationshipSystem:
     
     def _calculate_npc_compatibility(self, npc1: NPC, npc2: NPC) -> float:
         """Calculate compatibility between two NPCs"""
-        compatibility = 0.5
-        
-        # Personality compatibility
-        if npc1.personality == npc2.personality:
-            compatibility += 0.2
-        elif (npc1.personality == NPCPersonality.FRIENDLY and npc2.personality == NPCPersonality.TRUSTING):
-            compatibility += 0.3
-        elif (npc1.personality == NPCPersonality.PARANOID and npc2.personality == NPCPersonality.CUNNING):
-            compatibility -= 0.3
-        elif (npc1.personality == NPCPersonality.NAIVE and npc2.personality == NPCPersonality.CUNNING):
-            compatibility -= 0.4
-        
-        # Moral alignment compatibility
-        if npc1.moral_alignment == npc2.moral_alignment:
-            compatibility += 0.2
-        elif (npc1.moral_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and 
-              npc2.moral_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD]):
-            compatibility -= 0.3
-        
-        return max(0.0, min(1.0, compatibility))
+        return COMPATIBILITY_TABLE[temperament_id(npc1.personality, npc1.moral_alignment)][
+            temperament_id(npc2.personality, npc2.moral_alignment)]
     
-    def get_npc_help_in_boss_fight(self, npc_id: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_help_in_boss_fight(self, npc_id: str, player_moral: PlayerMoral,
+                                   player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Determine if NPC will help in boss fight based on personality and relationship"""
         if npc_id not in self.npcs:
             return {"will_help": False, "reason": "NPC not found"}
         
         npc = self.npcs[npc_id]
-        traits = npc.personality_traits
+        relationship_level = self.relationships.get(player_id, npc_id).relationship_level
         
-        # Base chance based on relationship
-        base_chance = (npc.relationship_level + 100) / 200  # 0 to 1
+        # Base chance based on relationship, plus personality modifiers
+        base_chance = (relationship_level + 100) / 200  # 0 to 1
+        base_chance += self._boss_fight_modifier(npc.personality, player_moral)
         
-        # Personality modifiers
-        if npc.personality == NPCPersonality.GRUMPY:
+        will_help = random.random() < base_chance
+        
+        if will_help:
+            assistance_power = self._calculate_assistance_power(npc, player_moral, player_id)
+            return {
+                "will_help": True,
+                "assistance_power": assistance_power,
+                "reason": f"{npc.name} decides to help you in the boss fight!",
+                "personality_influence": npc.personality.value
+            }
+        else:
+            return {
+                "will_help": False,
+                "reason": f"{npc.name} chooses not to help you.",
+                "personality_influence": npc.personality.value
+            }
+    
+    def _boss_fight_modifier(self, personality: NPCPersonality, player_moral: PlayerMoral) -> float:
+        """Personality adjustment to an NPC's chance of helping in a boss fight"""
+        modifier = 0.0
+        if personality == NPCPersonality.GRUMPY:
             # Grumpy NPCs might help bad players more
             if player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD]:
-                base_chance += 0.2
-        elif npc.personality == NPCPersonality.HONORABLE:
+                modifier += 0.2
+        elif personality == NPCPersonality.HONORABLE:
             # Honorable NPCs help good players
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD]:
-                base_chance += 0.3
-        elif npc.personality == NPCPersonality.GREEDY:
+                modifier += 0.3
+        elif personality == NPCPersonality.GREEDY:
             # Greedy NPCs need payment
-            base_chance -= 0.2
-        elif npc.personality == NPCPersonality.BRAVE:
+            modifier -= 0.2
+        elif personality == NPCPersonality.BRAVE:
             # Brave NPCs are more likely to help
-            base_chance += 0.2
-        elif npc.personality == NPCPersonality.COWARDLY:
+            modifier += 0.2
+        elif personality == NPCPersonality.COWARDLY:
             # Cowardly NPCs are less likely to help
-            base_chance -= 0.3
-        elif npc.personality == NPCPersonality.CUNNING:
+            modifier -= 0.3
+        elif personality == NPCPersonality.CUNNING:
             # Cunning NPCs might help if they perceive the player as trustworthy
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 50:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -50:
-                base_chance -= 0.1
-        elif npc.personality == NPCPersonality.NAIVE:
+                modifier -= 0.1
+        elif personality == NPCPersonality.NAIVE:
             # Naive NPCs might help if they perceive the player as friendly
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 30:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -30:
-                base_chance -= 0.1
-        elif npc.personality == NPCPersonality.PARANOID:
+                modifier -= 0.1
+        elif personality == NPCPersonality.PARANOID:
             # Paranoid NPCs might help if they perceive the player as trustworthy
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 70:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -70:
-                base_chance -= 0.1
-        elif npc.personality == NPCPersonality.TRUSTING:
+                modifier -= 0.1
+        elif personality == NPCPersonality.TRUSTING:
             # Trusting NPCs might help if they perceive the player as trustworthy
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 40:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -40:
-                base_chance -= 0.1
-        elif npc.personality == NPCPersonality.AMBITIOUS:
+                modifier -= 0.1
+        elif personality == NPCPersonality.AMBITIOUS:
             # Ambitious NPCs might help if they perceive the player as ambitious
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 60:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -60:
-                base_chance -= 0.1
-        elif npc.personality == NPCPersonality.CONTENT:
+                modifier -= 0.1
+        elif personality == NPCPersonality.CONTENT:
             # Content NPCs might help if they perceive the player as content
             if player_moral.overall_alignment in [MoralAlignment.GOOD, MoralAlignment.VERY_GOOD] and player_moral.karma_points > 50:
-                base_chance += 0.1
+                modifier += 0.1
             elif player_moral.overall_alignment in [MoralAlignment.BAD, MoralAlignment.VERY_BAD] and player_moral.karma_points < -50:
-                base_chance -= 0.1
+                modifier -= 0.1
         
-        will_help = random.random() < base_chance
-        
-        if will_help:
-            assistance_power = self._calculate_assistance_power(npc, player_moral)
-            return {
-                "will_help": True,
-                "assistance_power": assistance_power,
-                "reason": f"{npc.name} decides to help you in the boss fight!",
-                "personality_influence": npc.personality.value
-            }
+        return modifier
+    
+    def get_boss_fight_helpers(self, player_moral: PlayerMoral, player_id: str = DEFAULT_PLAYER_ID,
+                               candidates: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Roll every boss-fight NPC (or the given candidates) at once.
+        
+        The help chance of all NPCs is computed from the player's relationship
+        column and a per-personality modifier table in one vector pass.
+        """
+        modifiers = [self._boss_fight_modifier(personality, player_moral) for personality in PERSONALITIES]
+        relationship = self.relationships.player_column(player_id, "relationship_level")
+        npc_ids = self.relationships.npcs
+        
+        if np is not None:
+            chances = (relationship + 100) / 200 + np.array(modifiers)[np.array(self._personality_codes, dtype=np.intp)]
+            rolls = np.random.random(len(npc_ids)) < chances
+            chances, rolls = chances.tolist(), rolls.tolist()
         else:
-            return {
-                "will_help": False,
-                "reason": f"{npc.name} chooses not to help you.",
-                "personality_influence": npc.personality.value
-            }
+            chances = [(level + 100) / 200 + modifiers[code]
+                       for level, code in zip(relationship, self._personality_codes)]
+            rolls = [random.random() < chance for chance in chances]
+        
+        wanted = None if candidates is None else set(candidates)
+        helpers = []
+        for index, npc_id in enumerate(npc_ids):
+            npc = self.npcs.get(npc_id)
+            if npc is None or not rolls[index] or (wanted is not None and npc_id not in wanted):
+                continue
+            if wanted is None and not npc.boss_fight_help:
+                continue
+            helpers.append({
+                "npc_id": npc_id,
+                "npc_name": npc.name,
+                "chance": round(max(0.0, min(1.0, chances[index])), 3),
+                "assistance_power": self._calculate_assistance_power(npc, player_moral, player_id)
+            })
+        return helpers
     
-    def _calculate_assistance_power(self, npc: NPC, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def _calculate_assistance_power(self, npc: NPC, player_moral: PlayerMoral,
+                                    player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Calculate the power of NPC assistance in boss fight"""
-        base_power = 10 + (npc.relationship_level / 10)
+        base_power = 10 + (self.relationships.get(player_id, npc.id).relationship_level / 10)
         
         # Personality-based assistance
         if npc.personality == NPCPersonality.WISE:
@@ -2247,41 +2471,42 @@ class NPCRelationshipSystem:
             "special_ability": npc.special_abilities[0] if npc.special_abilities else "none"
         }
     
-    def get_npc_items(self, npc_id: str) -> List[str]:
+    def get_npc_items(self, npc_id: str, player_id: str = DEFAULT_PLAYER_ID) -> List[str]:
         """Get items NPC is willing to offer based on personality and relationship"""
         if npc_id not in self.npcs:
             return []
         
         npc = self.npcs[npc_id]
+        relationship_level = self.relationships.get(player_id, npc_id).relationship_level
         
-        if npc.relationship_level < 20:
+        if relationship_level < 20:
             return []
         
         # Personality-based item offerings
         if npc.personality == NPCPersonality.GREEDY:
-            return npc.items_offered if npc.relationship_level > 50 else []
+            return npc.items_offered if relationship_level > 50 else []
         elif npc.personality == NPCPersonality.FRIENDLY:
-            return npc.items_offered if npc.relationship_level > 30 else []
+            return npc.items_offered if relationship_level > 30 else []
         elif npc.personality == NPCPersonality.HONORABLE:
-            return npc.items_offered if npc.relationship_level > 40 else []
+            return npc.items_offered if relationship_level > 40 else []
         elif npc.personality == NPCPersonality.COWARDLY:
-            return npc.items_offered if npc.relationship_level > 60 else []
+            return npc.items_offered if relationship_level > 60 else []
         elif npc.personality == NPCPersonality.BRAVE:
-            return npc.items_offered if npc.relationship_level > 70 else []
+            return npc.items_offered if relationship_level > 70 else []
         elif npc.personality == NPCPersonality.CUNNING:
-            return npc.items_offered if npc.relationship_level > 80 else []
+            return npc.items_offered if relationship_level > 80 else []
         elif npc.personality == NPCPersonality.NAIVE:
-            return npc.items_offered if npc.relationship_level > 90 else []
+            return npc.items_offered if relationship_level > 90 else []
         elif npc.personality == NPCPersonality.PARANOID:
-            return npc.items_offered if npc.relationship_level > 95 else []
+            return npc.items_offered if relationship_level > 95 else []
         elif npc.personality == NPCPersonality.TRUSTING:
-            return npc.items_offered if npc.relationship_level > 5 else []
+            return npc.items_offered if relationship_level > 5 else []
         elif npc.personality == NPCPersonality.AMBITIOUS:
-            return npc.items_offered if npc.relationship_level > 60 else []
+            return npc.items_offered if relationship_level > 60 else []
         elif npc.personality == NPCPersonality.CONTENT:
-            return npc.items_offered if npc.relationship_level > 50 else []
+            return npc.items_offered if relationship_level > 50 else []
         else:
-            return npc.items_offered if npc.relationship_level > 60 else []
+            return npc.items_offered if relationship_level > 60 else []
     
     def _check_special_consequences(self, npc: NPC, old_relationship: int, new_relationship: int) -> Dict[str, Any]:
         """Check for special consequences based on relationship change"""
@@ -2346,18 +2571,20 @@ class NPCRelationshipSystem:
     def get_all_npc_relationships(self, character_id: str) -> Dict[str, Any]:
         """Get all NPC relationships for a character"""
         relationships = {}
+        states = self.relationships.for_player(character_id, list(self.npcs))
         for npc_id, npc in self.npcs.items():
             relationships[npc_id] = {
                 "name": npc.name,
                 "personality": npc.personality.value,
-                "relationship_level": npc.relationship_level,
-                "trust_level": npc.trust_level,
-                "fear_level": npc.fear_level,
-                "respect_level": npc.respect_level,
-                "current_mood": npc.current_mood
+                **states[npc_id].to_dict()
             }
         return relationships
     
+    def get_trusting_npcs(self, player_id: str, threshold: int = 50) -> List[str]:
+        """NPCs whose trust in the player is above threshold"""
+        return [npc_id for npc_id in self.relationships.npcs_where(player_id, "trust_level", ">", threshold)
+                if npc_id in self.npcs]
+    
     def get_player_moral_status(self, character_id: str) -> Dict[str, Any]:
         """Get player's moral status"""
         if character_id not in self.player_morals:
@@ -2366,12 +2593,14 @@ class NPCRelationshipSystem:
         player_moral = self.player_morals[character_id]
         return self._get_player_moral_summary(player_moral)
     
-    def get_npc_public_info(self, npc_id: str, player_moral: PlayerMoral = None) -> Dict[str, Any]:
+    def get_npc_public_info(self, npc_id: str, player_moral: PlayerMoral = None,
+                            player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC information that should be visible to players (hides sensitive data)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        state = self.relationships.get(player_id, npc_id)
         
         # Get player's known secrets
         known_secrets = []
@@ -2396,21 +2625,22 @@ class NPCRelationshipSystem:
             "personality": npc.personality_traits.personality_type.value,
             "speech_style": npc.personality_traits.speech_style,
             # Relationship level (simplified)
-            "relationship_status": self._get_relationship_status(npc.relationship_level),
+            "relationship_status": self._get_relationship_status(state.relationship_level),
             # Current mood (simplified)
-            "current_disposition": self._get_disposition(npc.current_mood),
+            "current_disposition": self._get_disposition(state.current_mood),
             # Secrets (only if player knows them)
             "known_secrets": known_secrets
         }
         
         return public_info
     
-    def get_npc_private_info(self, npc_id: str) -> Dict[str, Any]:
+    def get_npc_private_info(self, npc_id: str, player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get complete NPC information including sensitive data (for internal use only)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        state = self.relationships.get(player_id, npc_id)
         
         # Complete information including sensitive data
         private_info = {
@@ -2428,11 +2658,11 @@ class NPCRelationshipSystem:
             "boss_fight_help": npc.boss_fight_help,
             # Sensitive information (internal use only)
             "moral_alignment": npc.moral_alignment.value,
-            "relationship_level": npc.relationship_level,
-            "trust_level": npc.trust_level,
-            "fear_level": npc.fear_level,
-            "respect_level": npc.respect_level,
-            "current_mood": npc.current_mood,
+            "relationship_level": state.relationship_level,
+            "trust_level": state.trust_level,
+            "fear_level": state.fear_level,
+            "respect_level": state.respect_level,
+            "current_mood": state.current_mood,
             "secrets_known": npc.secrets_known,
             "relationships_with_others": npc.relationships_with_others,
             # Complete personality traits
@@ -2492,38 +2722,41 @@ class NPCRelationshipSystem:
         }
         return mood_mapping.get(mood, "Neutral")
     
-    def get_npc_dialogue_response(self, npc_id: str, context: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_dialogue_response(self, npc_id: str, context: str, player_moral: PlayerMoral,
+                                  player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC dialogue response (public version - hides internal calculations)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        state = self.relationships.get(player_id, npc_id)
         
         # Get internal response
-        internal_response = self.get_personality_based_dialogue(npc, context, player_moral)
+        internal_response = self.get_personality_based_dialogue(npc, context, player_moral, player_id)
         
         # Return public version
         return {
             "npc_name": npc.name,
             "response": internal_response,
-            "disposition": self._get_disposition(npc.current_mood),
-            "relationship_status": self._get_relationship_status(npc.relationship_level)
+            "disposition": self._get_disposition(state.current_mood),
+            "relationship_status": self._get_relationship_status(state.relationship_level)
         }
     
-    def get_npc_interaction_result(self, npc_id: str, action: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_interaction_result(self, npc_id: str, action: str, player_moral: PlayerMoral,
+                                   player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC interaction result (public version - hides sensitive calculations)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         # Perform internal interaction
-        internal_result = self.interact_with_npc(npc_id, action, player_moral)
+        internal_result = self.interact_with_npc(npc_id, action, player_moral, player_id)
         
         # Return public version
         public_result = {
             "npc_name": internal_result["npc_name"],
-            "response": internal_result["response"],
-            "relationship_status": self._get_relationship_status(internal_result["new_relationship"]),
-            "disposition": self._get_disposition(internal_result["new_mood"]),
+            "response": internal_result["npc_response"],
+            "relationship_status": self._get_relationship_status(internal_result["new_relationship_level"]),
+            "disposition": self._get_disposition(self.relationships.get(player_id, npc_id).current_mood),
             "consequences": internal_result.get("consequences", {}),
             "quest_offered": internal_result.get("quest_offered", False),
             "item_offered": internal_result.get("item_offered", False),
@@ -2532,42 +2765,46 @@ class NPCRelationshipSystem:
         
         return public_result
     
-    def get_npc_quest_offer(self, npc_id: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_quest_offer(self, npc_id: str, player_moral: PlayerMoral,
+                            player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC quest offer (public version)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        relationship_level = self.relationships.get(player_id, npc_id).relationship_level
         
         # Internal calculation
         compatibility = self.calculate_personality_compatibility(npc, player_moral)
-        will_offer = compatibility > 0.5 and npc.relationship_level > 30
+        will_offer = compatibility > 0.5 and relationship_level > 30
         
         if will_offer:
             return {
                 "npc_name": npc.name,
                 "quest_available": True,
                 "quest_description": f"{npc.name} has a task for you.",
-                "relationship_status": self._get_relationship_status(npc.relationship_level)
+                "relationship_status": self._get_relationship_status(relationship_level)
             }
         else:
             return {
                 "npc_name": npc.name,
                 "quest_available": False,
                 "response": f"{npc.name} doesn't seem interested in giving you a quest right now.",
-                "relationship_status": self._get_relationship_status(npc.relationship_level)
+                "relationship_status": self._get_relationship_status(relationship_level)
             }
     
-    def get_npc_trade_offer(self, npc_id: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_trade_offer(self, npc_id: str, player_moral: PlayerMoral,
+                            player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC trade offer (public version)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        relationship_level = self.relationships.get(player_id, npc_id).relationship_level
         
         # Internal calculation
         generosity = npc.personality_traits.generosity_level
-        relationship_bonus = max(0, npc.relationship_level / 100)
+        relationship_bonus = max(0, relationship_level / 100)
         will_trade = generosity > 5 or relationship_bonus > 0.3
         
         if will_trade:
@@ -2575,39 +2812,41 @@ class NPCRelationshipSystem:
                 "npc_name": npc.name,
                 "trade_available": True,
                 "items": npc.items_offered[:3],  # Show only first 3 items
-                "relationship_status": self._get_relationship_status(npc.relationship_level)
+                "relationship_status": self._get_relationship_status(relationship_level)
             }
         else:
             return {
                 "npc_name": npc.name,
                 "trade_available": False,
                 "response": f"{npc.name} doesn't seem interested in trading right now.",
-                "relationship_status": self._get_relationship_status(npc.relationship_level)
+                "relationship_status": self._get_relationship_status(relationship_level)
             }
     
-    def get_npc_combat_assistance(self, npc_id: str, player_moral: PlayerMoral) -> Dict[str, Any]:
+    def get_npc_combat_assistance(self, npc_id: str, player_moral: PlayerMoral,
+                                  player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get NPC combat assistance offer (public version)"""
         if npc_id not in self.npcs:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        relationship_level = self.relationships.get(player_id, npc_id).relationship_level
         
         # Internal calculation
-        assistance_result = self.get_npc_help_in_boss_fight(npc_id, player_moral)
+        assistance_result = self.get_npc_help_in_boss_fight(npc_id, player_moral, player_id)
         
         # Return public version
         return {
             "npc_name": npc.name,
             "will_help": assistance_result["will_help"],
             "assistance_type": assistance_result.get("assistance_type", "none"),
-            "relationship_status": self._get_relationship_status(npc.relationship_level)
+            "relationship_status": self._get_relationship_status(relationship_level)
         }
     
-    def get_all_npcs_public_info(self) -> Dict[str, Any]:
+    def get_all_npcs_public_info(self, player_id: str = DEFAULT_PLAYER_ID) -> Dict[str, Any]:
         """Get public information for all NPCs"""
         public_npcs = {}
         for npc_id, npc in self.npcs.items():
-            public_npcs[npc_id] = self.get_npc_public_info(npc_id)
+            public_npcs[npc_id] = self.get_npc_public_info(npc_id, player_id=player_id)
         
         return {
             "total_npcs": len(public_npcs),
@@ -2620,10 +2859,11 @@ class NPCRelationshipSystem:
             return {"error": "NPC not found"}
         
         npc = self.npcs[npc_id]
+        graph = self.social_graph
         
         # Convert internal relationships to public descriptions
         public_relationships = {}
-        for other_npc_id, relationship_level in npc.relationships_with_others.items():
+        for other_npc_id, relationship_level in graph.edges.get(npc_id, {}).items():
             if other_npc_id in self.npcs:
                 other_npc = self.npcs[other_npc_id]
                 public_relationships[other_npc.name] = self._get_relationship_status(relationship_level)
@@ -2631,21 +2871,52 @@ class NPCRelationshipSystem:
         return {
             "npc_name": npc.name,
             "relationships": public_relationships,
-            "total_connections": len(public_relationships)
+            "total_connections": len(public_relationships),
+            "allies": self._npc_names(graph.allies.get(npc_id, set())),
+            "rivals": self._npc_names(graph.rivals.get(npc_id, set())),
+            "friends_of_friends": self._npc_names(graph.allies_of_allies(npc_id))
         }
     
+    def _npc_names(self, npc_ids) -> List[str]:
+        return sorted(self.npcs[npc_id].name for npc_id in npc_ids if npc_id in self.npcs)
+    
+    def get_npc_faction(self, npc_id: str) -> List[str]:
+        """Names of the NPCs tied to this one through ally relationships"""
+        return self._npc_names(self.social_graph.faction(npc_id))
+    
+    def get_npc_factions(self, min_size: int = 2) -> List[List[str]]:
+        """Every group of NPCs tied together through ally relationships"""
+        return [self._npc_names(cluster) for cluster in self.social_graph.factions(min_size)]
+    
+    def get_npc_betrayal_chains(self, npc_id: str, max_depth: int = 3) -> List[List[str]]:
+        """Chains of trust from an NPC that end at someone hostile to it"""
+        return [[self.npcs[link].name if link in self.npcs else link for link in chain]
+                for chain in self.social_graph.betrayal_chains(npc_id, max_depth)]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
-            "npcs": {npc_id: asdict(npc) for npc_id, npc in self.npcs.items()},
-            "player_moral": asdict(self.player_moral)
+            "npcs": {npc_id: npc.to_dict() for npc_id, npc in self.npcs.items()},
+            "player_morals": {player_id: {**asdict(moral), "overall_alignment": moral.overall_alignment.value}
+                              for player_id, moral in self.player_morals.items()},
+            "relationships": self.relationships.to_dict()
         }
     
     def from_dict(self, data: Dict[str, Any]):
         """Load from dictionary"""
         self.npcs = {}
+        self.relationships = RelationshipMatrix()
+        self._personality_codes = []
+        self.social_graph = NPCSocialGraph(COMPATIBILITY_TABLE)
         for npc_id, npc_data in data.get("npcs", {}).items():
-            self.npcs[npc_id] = NPC(**npc_data) 
+            self.npcs[npc_id] = NPC.from_dict(npc_data)
+            self._register_npc(self.npcs[npc_id])
+        self.relationships.load_dict(data.get("relationships", {}))
+        if "player_morals" in data:
+            self.player_morals = {
+                player_id: PlayerMoral(**{**moral, "overall_alignment": MoralAlignment(moral["overall_alignment"])})
+                for player_id, moral in data["player_morals"].items()
+            }
     
     def _create_test_npcs(self):
         """Create some test NPCs for demonstration"""
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Progression Tables
+==================
+
+Level requirements compiled into prefix-summed tables, so resolving an XP
+award never walks levels one by one:
+
+- XP thresholds in level order: the level reached with some XP is one
+  bisect (O(log L))
+- cumulative skill points and cumulative stat bonuses per level: what a
+  jump from level a to level b grants is a difference of two entries
+- the level each feature unlocks at, and the unlocks accumulated per level
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class LevelTable:
+    """Immutable prefix-summed view of level requirements"""
+
+    __slots__ = ("levels", "thresholds", "skill_points", "stat_bonuses", "unlock_levels", "_unlocks", "_positions")
+
+    def __init__(self, requirements: Iterable):
+        """requirements: objects with level, experience_required, skill_points_gained, stat_bonuses and unlocks"""
+        rows = sorted(requirements, key=lambda req: req.level)
+        if not rows:
+            raise ValueError("Level table needs at least one level")
+
+        self.levels: Tuple[int, ...] = tuple(req.level for req in rows)
+        self.thresholds: Tuple[int, ...] = tuple(req.experience_required for req in rows)
+        if any(later < earlier for earlier, later in zip(self.thresholds, self.thresholds[1:])):
+            raise ValueError("Level XP thresholds must not decrease")
+        self._positions = {level: position for position, level in enumerate(self.levels)}
+
+        # Entry i holds the total granted by levels[0..i]
+        skill_points, total = [], 0
+        stats = sorted({stat for req in rows for stat in req.stat_bonuses})
+        stat_bonuses: Dict[str, List[int]] = {stat: [] for stat in stats}
+        running = dict.fromkeys(stats, 0)
+        unlock_levels: Dict[str, int] = {}
+        unlocks, unlocked = [], []
+        for req in rows:
+            total += req.skill_points_gained
+            skill_points.append(total)
+            for stat in stats:
+                running[stat] += req.stat_bonuses.get(stat, 0)
+                stat_bonuses[stat].append(running[stat])
+            for feature in req.unlocks:
+                if feature not in unlock_levels:
+                    unlock_levels[feature] = req.level
+                    unlocked.append(feature)
+            unlocks.append(tuple(unlocked))
+
+        self.skill_points: Tuple[int, ...] = tuple(skill_points)
+        self.stat_bonuses: Dict[str, Tuple[int, ...]] = {stat: tuple(values) for stat, values in stat_bonuses.items()}
+        self.unlock_levels = unlock_levels
+        self._unlocks: Tuple[Tuple[str, ...], ...] = tuple(unlocks)
+
+    @property
+    def max_level(self) -> int:
+        return self.levels[-1]
+
+    def _position(self, level: int) -> int:
+        """Index of the highest table level at or below level (-1 if below the table)"""
+        position = self._positions.get(level)
+        return position if position is not None else bisect_right(self.levels, level) - 1
+
+    # Levels and XP
+
+    def level_for(self, experience: int, current_level: Optional[int] = None) -> int:
+        """Level reached with experience; never below current_level"""
+        position = bisect_right(self.thresholds, experience) - 1
+        level = self.levels[max(position, 0)]
+        return level if current_level is None else max(level, current_level)
+
+    def next_threshold(self, level: int) -> Optional[int]:
+        """XP needed for the level after level, None at the top of the table"""
+        position = self._position(level) + 1
+        return self.thresholds[position] if position < len(self.levels) else None
+
+    # Cumulative rewards
+
+    def _total(self, column, level: int) -> int:
+        position = self._position(level)
+        return column[position] if position >= 0 else 0
+
+    def skill_points_between(self, from_level: int, to_level: int) -> int:
+        """Skill points granted by the levels after from_level up to to_level"""
+        return self._total(self.skill_points, to_level) - self._total(self.skill_points, from_level)
+
+    def stat_bonuses_between(self, from_level: int, to_level: int) -> Dict[str, int]:
+        """Stat bonuses granted by the levels after from_level up to to_level (zero totals left out)"""
+        bonuses = {}
+        for stat, column in self.stat_bonuses.items():
+            bonus = self._total(column, to_level) - self._total(column, from_level)
+            if bonus:
+                bonuses[stat] = bonus
+        return bonuses
+
+    def unlocks_up_to(self, level: int) -> Tuple[str, ...]:
+        """Every feature unlocked at or below level, in unlock order"""
+        position = self._position(level)
+        return self._unlocks[position] if position >= 0 else ()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Save Format
+===========
+
+Versioned, compressed binary format for save files, plus delta records.
+
+File layout: an 8 byte header followed by the compressed payload.
+
+    b"AIDM" | version | kind | serializer | compressor
+
+- kind:       F = full snapshot, D = delta against a full snapshot
+- serializer: M = msgpack (when installed), J = compact JSON
+- compressor: S = zstd (when the zstandard package is installed), Z = zlib
+
+The header records what was used, so a file written with msgpack/zstd can
+be read anywhere those packages exist and JSON/zlib files can be read
+everywhere. read_save() also accepts the old pretty-printed JSON saves.
+
+Deltas (diff/apply_delta) describe nested dict changes as
+{"set": [[path, value], ...], "del": [path, ...]}; lists and scalars are
+replaced whole.
+"""
+
+import json
+import os
+import zlib
+from typing import Any, Dict, List, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"AIDM"
+FORMAT_VERSION = 1
+HEADER_SIZE = 8
+
+FULL = b"F"
+DELTA = b"D"
+
+COMPRESSION_LEVEL = 6
+
+
+class SaveFormatError(ValueError):
+    """Raised for unreadable or unsupported save files"""
+
+
+def _serialize(data: Any) -> Tuple[bytes, bytes]:
+    if msgpack is not None:
+        return b"M", msgpack.packb(data, default=str, use_bin_type=True)
+    return b"J", json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _deserialize(serializer: bytes, payload: bytes) -> Any:
+    if serializer == b"J":
+        return json.loads(payload.decode("utf-8"))
+    if serializer == b"M":
+        if msgpack is None:
+            raise SaveFormatError("Save file needs the msgpack package")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    raise SaveFormatError(f"Unknown serializer: {serializer!r}")
+
+
+def _compress(payload: bytes) -> Tuple[bytes, bytes]:
+    if zstandard is not None:
+        return b"S", zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(payload)
+    return b"Z", zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def _decompress(compressor: bytes, payload: bytes) -> bytes:
+    if compressor == b"Z":
+        return zlib.decompress(payload)
+    if compressor == b"S":
+        if zstandard is None:
+            raise SaveFormatError("Save file needs the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise SaveFormatError(f"Unknown compressor: {compressor!r}")
+
+
+def encode(data: Any, kind: bytes = FULL) -> bytes:
+    """Encode a record into the binary save format"""
+    serializer, payload = _serialize(data)
+    compressor, payload = _compress(payload)
+    return MAGIC + bytes([FORMAT_VERSION]) + kind + serializer + compressor + payload
+
+
+def decode(blob: bytes) -> Tuple[bytes, Any]:
+    """Decode a save file's bytes; returns (kind, record). Legacy JSON reads as a full save"""
+    if not blob.startswith(MAGIC):
+        try:
+            return FULL, json.loads(blob.decode("utf-8"))
+        except ValueError as e:
+            raise SaveFormatError(f"Not a save file: {e}")
+
+    if len(blob) < HEADER_SIZE:
+        raise SaveFormatError("Truncated save file")
+    version = blob[4]
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Save format version {version} is newer than supported {FORMAT_VERSION}")
+    kind, serializer, compressor = blob[5:6], blob[6:7], blob[7:8]
+    return kind, _deserialize(serializer, _decompress(compressor, blob[HEADER_SIZE:]))
+
+
+def write_save(path: str, data: Any, kind: bytes = FULL) -> int:
+    """Write a record atomically; returns the number of bytes written"""
+    blob = encode(data, kind)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(temp_path, path)
+    return len(blob)
+
+
+def read_save(path: str) -> Tuple[bytes, Any]:
+    """Read a save file in either the binary or the old JSON format"""
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List]:
+    """Changes turning old into new"""
+    changes = {"set": [], "del": []}
+    _diff(old, new, [], changes)
+    return changes
+
+
+def _diff(old: Dict[str, Any], new: Dict[str, Any], path: List[str], changes: Dict[str, List]):
+    for key, value in new.items():
+        if key not in old:
+            changes["set"].append([path + [key], value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            _diff(old[key], value, path + [key], changes)
+        elif value != old[key]:
+            changes["set"].append([path + [key], value])
+    for key in old:
+        if key not in new:
+            changes["del"].append(path + [key])
+
+
+def apply_delta(base: Dict[str, Any], changes: Dict[str, List]) -> Dict[str, Any]:
+    """Apply changes to base in place and return it"""
+    record = base
+    for path in changes.get("del", []):
+        parent = _parent(record, path)
+        parent.pop(path[-1], None)
+    for path, value in changes.get("set", []):
+        _parent(record, path)[path[-1]] = value
+    return record
+
+
+def _parent(record: Dict[str, Any], path: List[str]) -> Dict[str, Any]:
+    node = record
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    return node
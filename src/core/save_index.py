@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Save Index
+==========
+
+SQLite sidecar holding the metadata of every save file (character, level,
+class, timestamp, size, delta base), so listing saves is an indexed query
+instead of opening and parsing every file in the save directory.
+
+SaveSystem keeps the index in step on save, auto-save, delete and import;
+rebuild() replaces it from a fresh scan of the files on disk.
+"""
+
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional
+
+COLUMNS = ("save_id", "character_id", "username", "character_name", "character_level",
+           "character_class", "timestamp", "file_size", "auto_save", "base_id")
+
+
+class SaveIndex:
+    """Save metadata table, queryable per character or user"""
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        self.created = self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_database(self) -> bool:
+        """Create the table; True when it did not exist yet"""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='saves'")
+            created = cursor.fetchone() is None
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS saves (
+                    save_id TEXT PRIMARY KEY,
+                    character_id TEXT,
+                    username TEXT,
+                    character_name TEXT,
+                    character_level INTEGER,
+                    character_class TEXT,
+                    timestamp TEXT,
+                    file_size INTEGER,
+                    auto_save INTEGER DEFAULT 0,
+                    base_id TEXT
+                )
+            ''')
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(saves)")}
+            if "base_id" not in columns:
+                cursor.execute("ALTER TABLE saves ADD COLUMN base_id TEXT")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_saves_character ON saves (character_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_saves_username ON saves (username, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_saves_timestamp ON saves (timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_saves_base ON saves (base_id)")
+            conn.commit()
+            return created
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> tuple:
+        return tuple(int(bool(entry.get(column))) if column == "auto_save" else entry.get(column)
+                     for column in COLUMNS)
+
+    def upsert(self, entry: Dict[str, Any]):
+        """Insert or replace one save's metadata"""
+        conn = self._connect()
+        try:
+            conn.execute(f"INSERT OR REPLACE INTO saves ({', '.join(COLUMNS)}) "
+                         f"VALUES ({', '.join('?' * len(COLUMNS))})", self._row(entry))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def remove(self, save_id: str) -> bool:
+        conn = self._connect()
+        try:
+            cursor = conn.execute("DELETE FROM saves WHERE save_id = ?", (save_id,))
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Replace the whole index in one transaction; returns the number of saves"""
+        rows = [self._row(entry) for entry in entries]
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM saves")
+            conn.executemany(f"INSERT OR REPLACE INTO saves ({', '.join(COLUMNS)}) "
+                             f"VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+            conn.commit()
+            return len(rows)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _filters(character_id: Optional[str], username: Optional[str]):
+        clauses, params = [], []
+        if character_id:
+            clauses.append("character_id = ?")
+            params.append(character_id)
+        if username:
+            clauses.append("username = ?")
+            params.append(username)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, character_id: Optional[str] = None, username: Optional[str] = None,
+              limit: Optional[int] = None, offset: int = 0, newest_first: bool = True) -> List[Dict[str, Any]]:
+        """Saves of a character/user ordered by timestamp, one page at a time"""
+        where, params = self._filters(character_id, username)
+        sql = (f"SELECT {', '.join(COLUMNS)} FROM saves{where} "
+               f"ORDER BY timestamp {'DESC' if newest_first else 'ASC'}, save_id")
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit if limit is not None else -1, offset]
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [dict(zip(COLUMNS, row), auto_save=bool(row[COLUMNS.index("auto_save")])) for row in rows]
+
+    def dependents(self, save_id: str) -> List[str]:
+        """Delta saves that were written against save_id"""
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute("SELECT save_id FROM saves WHERE base_id = ?", (save_id,))]
+        finally:
+            conn.close()
+
+    def latest_full_auto_save(self, character_id: str) -> Optional[str]:
+        """Newest auto-save of a character stored as a full snapshot"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT save_id FROM saves WHERE character_id = ? AND auto_save = 1 "
+                               "AND base_id IS NULL ORDER BY timestamp DESC, save_id DESC LIMIT 1",
+                               (character_id,)).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def count(self, character_id: Optional[str] = None, username: Optional[str] = None) -> int:
+        where, params = self._filters(character_id, username)
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM saves{where}", params).fetchone()[0]
+        finally:
+            conn.close()
@@ -2,9 +2,15 @@
 """
 Advanced Save/Load System
 Handles game state persistence, character saves, and campaign progress
+
+Saves are written in the compact binary format of save_format (.sav);
+old pretty-printed JSON saves (.json) are still read. Auto-saves are
+deltas against the character's last full auto-save, with a new full
+snapshot every AUTO_SAVE_COMPACT_EVERY auto-saves. That base is kept in
+memory and otherwise found through the save index, so a fresh SaveSystem
+(or a restarted server) keeps writing deltas.
 """
 
-import json
 import os
 import logging
 from datetime import datetime
@@ -12,8 +18,16 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+from .save_format import DELTA, FULL, SaveFormatError, apply_delta, diff, encode, read_save, write_save
+from .save_index import SaveIndex
+
 logger = logging.getLogger(__name__)
 
+SAVE_EXTENSION = ".sav"
+LEGACY_EXTENSION = ".json"
+# Full auto-save snapshot after this many delta auto-saves
+AUTO_SAVE_COMPACT_EVERY = 10
+
 @dataclass
 class SaveGameData:
     """Complete save game data structure"""
@@ -38,6 +52,51 @@ class SaveSystem:
         self.save_directory = Path(save_directory)
         self.save_directory.mkdir(exist_ok=True)
         self.game_version = "1.0.0"
+        self.index = SaveIndex(self.save_directory / "save_index.db")
+        # character_id -> {"save_id", "record", "size", "deltas"} of the last full auto-save
+        self.auto_save_bases: Dict[str, Dict[str, Any]] = {}
+        if self.index.created:
+            self.rebuild_index()
+        
+    def _save_file(self, save_id: str) -> Optional[Path]:
+        """Existing file of a save, binary format first"""
+        for extension in (SAVE_EXTENSION, LEGACY_EXTENSION):
+            save_file = self.save_directory / f"{save_id}{extension}"
+            if save_file.exists():
+                return save_file
+        return None
+    
+    def _read_record(self, save_id: str) -> Optional[Dict[str, Any]]:
+        """Full save record, resolving delta auto-saves against their base"""
+        save_file = self._save_file(save_id)
+        if save_file is None:
+            return None
+        kind, record = read_save(save_file)
+        if kind == DELTA:
+            base = self._read_record(record["base_id"])
+            if base is None:
+                raise SaveFormatError(f"Base save {record['base_id']} of {save_id} is missing")
+            return apply_delta(base, record["changes"])
+        return record
+    
+    def _build_save_record(self, save_id: str, character: Any, character_id: str, game_engine: Any,
+                           campaign_manager: Any, session_data: Optional[Dict]) -> Dict[str, Any]:
+        save_data = SaveGameData(
+            save_id=save_id,
+            timestamp=datetime.now(),
+            game_version=self.game_version,
+            character_data=character,
+            game_state=self._get_game_state(game_engine, character_id),
+            campaign_progress=self._get_campaign_progress(campaign_manager, character_id),
+            npc_relationships=self._get_npc_relationships(game_engine, character_id),
+            skill_progress=self._get_skill_progress(game_engine, character_id),
+            moral_alignment=self._get_moral_alignment(game_engine, character_id),
+            inventory=character.get("inventory", []),
+            quest_progress=self._get_quest_progress(campaign_manager, character_id),
+            combat_state=self._get_combat_state(game_engine, character_id),
+            session_data=session_data
+        )
+        return asdict(save_data)
         
     def save_game(self, 
                   character_id: str,
@@ -52,32 +111,20 @@ class SaveSystem:
                 return {"success": False, "error": "Character not found"}
             
             # Create save data
-            save_data = SaveGameData(
-                save_id=f"save_{character_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                timestamp=datetime.now(),
-                game_version=self.game_version,
-                character_data=character,
-                game_state=self._get_game_state(game_engine, character_id),
-                campaign_progress=self._get_campaign_progress(campaign_manager, character_id),
-                npc_relationships=self._get_npc_relationships(game_engine, character_id),
-                skill_progress=self._get_skill_progress(game_engine, character_id),
-                moral_alignment=self._get_moral_alignment(game_engine, character_id),
-                inventory=character.get("inventory", []),
-                quest_progress=self._get_quest_progress(campaign_manager, character_id),
-                combat_state=self._get_combat_state(game_engine, character_id),
-                session_data=session_data
-            )
+            save_id = f"save_{character_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            record = self._build_save_record(save_id, character, character_id, game_engine,
+                                             campaign_manager, session_data)
             
             # Save to file
-            save_file = self.save_directory / f"{save_data.save_id}.json"
-            with open(save_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(save_data), f, indent=2, default=str)
+            save_file = self.save_directory / f"{save_id}{SAVE_EXTENSION}"
+            write_save(save_file, record)
+            self.index.upsert(self._index_entry(save_file, record))
             
-            logger.info(f"Game saved successfully: {save_data.save_id}")
+            logger.info(f"Game saved successfully: {save_id}")
             return {
                 "success": True,
-                "save_id": save_data.save_id,
-                "timestamp": save_data.timestamp.isoformat(),
+                "save_id": save_id,
+                "timestamp": record["timestamp"].isoformat(),
                 "character_name": character.name
             }
             
@@ -89,13 +136,10 @@ class SaveSystem:
         """Load complete game state"""
         try:
             # Load save file
-            save_file = self.save_directory / f"{save_id}.json"
-            if not save_file.exists():
+            save_data = self._read_record(save_id)
+            if save_data is None:
                 return {"success": False, "error": "Save file not found"}
             
-            with open(save_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
             # Restore character
             character_data = save_data["character_data"]
             character = game_engine.get_character(character_data["id"])
@@ -138,41 +182,78 @@ class SaveSystem:
             logger.error(f"Error loading game: {e}")
             return {"success": False, "error": str(e)}
     
-    def get_save_files(self, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get list of available save files"""
-        saves = []
+    def get_save_files(self, character_id: Optional[str] = None, username: Optional[str] = None,
+                       limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get list of available save files (newest first) from the save index"""
+        return self.index.query(character_id=character_id, username=username, limit=limit, offset=offset)
+    
+    def count_save_files(self, character_id: Optional[str] = None, username: Optional[str] = None) -> int:
+        """Number of save files for a character/user"""
+        return self.index.count(character_id=character_id, username=username)
+    
+    def rebuild_index(self) -> Dict[str, Any]:
+        """
+        Rebuild the save index by reading every save file on disk.
         
-        for save_file in self.save_directory.glob("*.json"):
+        Other writers share the directory (GameStateAgent's session saves are
+        save_<session>_<slot>.sav too), so only records with character data,
+        i.e. written by this class, are indexed.
+        """
+        entries = {}
+        save_files = list(self.save_directory.glob(f"*{LEGACY_EXTENSION}"))
+        # Binary saves come last so they win over a legacy file with the same id
+        save_files += list(self.save_directory.glob(f"*{SAVE_EXTENSION}"))
+        for save_file in save_files:
             try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    save_data = json.load(f)
-                
-                # Filter by character if specified
-                if character_id and save_data["character_data"]["id"] != character_id:
+                kind, record = read_save(save_file)
+                base_id = None
+                if kind == DELTA:
+                    base_id = record["base_id"]
+                    record = self._read_record(save_file.stem)
+                if not isinstance(record, dict) or not isinstance(record.get("character_data"), dict):
                     continue
-                
-                saves.append({
-                    "save_id": save_data["save_id"],
-                    "timestamp": save_data["timestamp"],
-                    "character_name": save_data["character_data"]["name"],
-                    "character_level": save_data["character_data"]["level"],
-                    "character_class": save_data["character_data"]["character_class"],
-                    "file_size": save_file.stat().st_size
-                })
-                
+                entries[save_file.stem] = self._index_entry(save_file, record, base_id)
             except Exception as e:
                 logger.warning(f"Error reading save file {save_file}: {e}")
+        entries = entries.values()
         
-        # Sort by timestamp (newest first)
-        saves.sort(key=lambda x: x["timestamp"], reverse=True)
-        return saves
+        indexed = self.index.rebuild(entries)
+        logger.info(f"Save index rebuilt: {indexed} saves")
+        return {"success": True, "indexed": indexed}
+    
+    def _index_entry(self, save_file: Path, save_data: Dict[str, Any], base_id: Optional[str] = None) -> Dict[str, Any]:
+        """Index metadata of a save; the file name is the id load_game uses"""
+        character_data = save_data.get("character_data") or {}
+        session_data = save_data.get("session_data") or {}
+        save_id = save_file.stem
+        return {
+            "save_id": save_id,
+            "character_id": character_data.get("id"),
+            "username": session_data.get("username") or character_data.get("username"),
+            "character_name": character_data.get("name"),
+            "character_level": character_data.get("level"),
+            "character_class": str(character_data["character_class"]) if character_data.get("character_class") is not None else None,
+            "timestamp": str(save_data.get("timestamp")),
+            "file_size": save_file.stat().st_size,
+            "auto_save": save_id.startswith("autosave_"),
+            "base_id": base_id
+        }
     
     def delete_save(self, save_id: str) -> Dict[str, Any]:
         """Delete a save file"""
         try:
-            save_file = self.save_directory / f"{save_id}.json"
-            if save_file.exists():
+            save_file = self._save_file(save_id)
+            if save_file is not None:
+                # Delta auto-saves built on this save become full saves first
+                for dependent in self.index.dependents(save_id):
+                    dependent_file = self.save_directory / f"{dependent}{SAVE_EXTENSION}"
+                    record = self._read_record(dependent)
+                    write_save(dependent_file, record)
+                    self.index.upsert(self._index_entry(dependent_file, record))
+                self.auto_save_bases = {character: base for character, base in self.auto_save_bases.items()
+                                        if base["save_id"] != save_id}
                 save_file.unlink()
+                self.index.remove(save_id)
                 logger.info(f"Save file deleted: {save_id}")
                 return {"success": True, "message": "Save file deleted"}
             else:
@@ -182,25 +263,70 @@ class SaveSystem:
             logger.error(f"Error deleting save file: {e}")
             return {"success": False, "error": str(e)}
     
+    def _auto_save_base(self, character_id: str) -> Optional[Dict[str, Any]]:
+        """Last full auto-save of a character, recovered from the index if not in memory"""
+        base = self.auto_save_bases.get(character_id)
+        if base is not None:
+            return base
+        save_id = self.index.latest_full_auto_save(character_id)
+        save_file = self._save_file(save_id) if save_id else None
+        if save_file is None:
+            return None
+        try:
+            kind, record = read_save(save_file)
+        except (OSError, SaveFormatError) as e:
+            logger.warning(f"Error reading auto-save base {save_id}: {e}")
+            return None
+        if kind != FULL:
+            return None
+        base = {"save_id": save_id, "record": record, "size": save_file.stat().st_size,
+                "deltas": len(self.index.dependents(save_id))}
+        self.auto_save_bases[character_id] = base
+        return base
+    
     def auto_save(self, character_id: str, game_engine: Any, campaign_manager: Any) -> Dict[str, Any]:
         """Create an auto-save"""
         try:
-            # Create auto-save with special ID
-            auto_save_id = f"autosave_{character_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            character = game_engine.get_character(character_id)
+            if not character:
+                return {"success": False, "error": "Character not found"}
             
-            # Save game with auto-save ID
-            result = self.save_game(character_id, game_engine, campaign_manager)
-            if result["success"]:
-                # Rename to auto-save
-                old_file = self.save_directory / f"{result['save_id']}.json"
-                new_file = self.save_directory / f"{auto_save_id}.json"
-                old_file.rename(new_file)
-                
-                logger.info(f"Auto-save created: {auto_save_id}")
-                return {"success": True, "auto_save_id": auto_save_id}
+            # Create auto-save with special ID (microseconds: auto-saves can come faster than once a second)
+            auto_save_id = f"autosave_{character_id}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            record = self._build_save_record(auto_save_id, character, character_id, game_engine,
+                                             campaign_manager, None)
+            save_file = self.save_directory / f"{auto_save_id}{SAVE_EXTENSION}"
+            
+            # Delta against the last full auto-save while the chain is short and the delta small
+            base = self._auto_save_base(character_id)
+            blob = None
+            if (base and base["save_id"] != auto_save_id and base["deltas"] < AUTO_SAVE_COMPACT_EVERY
+                    and self._save_file(base["save_id"]) is not None):
+                delta = {
+                    "save_id": auto_save_id,
+                    "base_id": base["save_id"],
+                    "timestamp": record["timestamp"],
+                    "changes": diff(base["record"], record)
+                }
+                blob = encode(delta, DELTA)
+                if len(blob) > base["size"] // 2:
+                    blob = None
+            
+            if blob is not None:
+                temp_file = save_file.with_suffix(".tmp")
+                temp_file.write_bytes(blob)
+                temp_file.replace(save_file)
+                base["deltas"] += 1
+                self.index.upsert(self._index_entry(save_file, record, base["save_id"]))
             else:
-                return result
-                
+                size = write_save(save_file, record, FULL)
+                self.auto_save_bases[character_id] = {"save_id": auto_save_id, "record": record,
+                                                      "size": size, "deltas": 0}
+                self.index.upsert(self._index_entry(save_file, record))
+            
+            logger.info(f"Auto-save created: {auto_save_id}")
+            return {"success": True, "auto_save_id": auto_save_id, "delta": blob is not None}
+            
         except Exception as e:
             logger.error(f"Error creating auto-save: {e}")
             return {"success": False, "error": str(e)}
@@ -290,12 +416,12 @@ class SaveSystem:
     def export_save(self, save_id: str, export_path: str) -> Dict[str, Any]:
         """Export save file to external location"""
         try:
-            save_file = self.save_directory / f"{save_id}.json"
-            if not save_file.exists():
+            record = self._read_record(save_id)
+            if record is None:
                 return {"success": False, "error": "Save file not found"}
             
-            import shutil
-            shutil.copy2(save_file, export_path)
+            # Always a full save, so the export does not depend on other files
+            write_save(export_path, record)
             
             logger.info(f"Save exported to: {export_path}")
             return {"success": True, "export_path": export_path}
@@ -307,7 +433,6 @@ class SaveSystem:
     def import_save(self, import_path: str) -> Dict[str, Any]:
         """Import save file from external location"""
         try:
-            import shutil
             import pathlib
             
             # Validate file
@@ -315,9 +440,10 @@ class SaveSystem:
             if not import_file.exists():
                 return {"success": False, "error": "Import file not found"}
             
-            # Read and validate save data
-            with open(import_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            # Read and validate save data (binary or legacy JSON)
+            kind, save_data = read_save(import_file)
+            if kind != FULL:
+                return {"success": False, "error": "Invalid save file: delta saves cannot be imported"}
             
             # Validate save data structure
             required_fields = ["save_id", "character_data", "game_state"]
@@ -325,10 +451,11 @@ class SaveSystem:
                 if field not in save_data:
                     return {"success": False, "error": f"Invalid save file: missing {field}"}
             
-            # Copy to save directory
+            # Store in the save directory
             save_id = save_data["save_id"]
-            target_file = self.save_directory / f"{save_id}.json"
-            shutil.copy2(import_file, target_file)
+            target_file = self.save_directory / f"{save_id}{SAVE_EXTENSION}"
+            write_save(target_file, save_data)
+            self.index.upsert(self._index_entry(target_file, save_data))
             
             logger.info(f"Save imported: {save_id}")
             return {"success": True, "save_id": save_id}
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Skill Graph
+===========
+
+Skill prerequisites compiled once into an immutable DAG.
+
+Every skill gets one bit, assigned in topological order (prerequisites
+before the skills that need them, otherwise in definition order). For each
+skill the transitive prerequisite closure is stored as an int bitset, so
+with a player's learned skills as a bitset:
+
+- "are all prerequisites of X learned" is closure[X] & ~learned == 0
+- "what is still missing for X" is closure[X] & ~learned
+- "what can be learned now" is one such test per skill, no dict scans
+
+Class views are bitsets too: the skills in a class tree plus everything
+they depend on.
+"""
+
+import heapq
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+class SkillGraph:
+    """Topologically ordered skill DAG with prerequisite closures as bitsets"""
+
+    __slots__ = ("ids", "index", "direct", "closure", "class_masks", "all_mask")
+
+    def __init__(self, prerequisites: Mapping[str, Iterable[str]],
+                 classes: Optional[Mapping[str, Iterable[str]]] = None):
+        """
+        prerequisites maps skill id -> direct prerequisite ids; ids that only
+        appear as prerequisites or in classes become nodes without prerequisites.
+        Raises ValueError if the prerequisites contain a cycle.
+        """
+        requires: Dict[str, List[str]] = {}
+        for skill_id, needed in prerequisites.items():
+            requires.setdefault(skill_id, [])
+            for prerequisite in needed:
+                requires.setdefault(prerequisite, [])
+                if prerequisite not in requires[skill_id]:
+                    requires[skill_id].append(prerequisite)
+        for skill_ids in (classes or {}).values():
+            for skill_id in skill_ids:
+                requires.setdefault(skill_id, [])
+
+        order = self._topological_order(requires)
+        self.ids: Tuple[str, ...] = tuple(order)
+        self.index: Mapping[str, int] = MappingProxyType({skill_id: bit for bit, skill_id in enumerate(order)})
+
+        direct, closure = [], []
+        for skill_id in order:
+            mask = 0
+            full = 0
+            for prerequisite in requires[skill_id]:
+                bit = self.index[prerequisite]
+                mask |= 1 << bit
+                # Prerequisites come earlier in the order, so their closure is done
+                full |= (1 << bit) | closure[bit]
+            direct.append(mask)
+            closure.append(full)
+        self.direct: Tuple[int, ...] = tuple(direct)
+        self.closure: Tuple[int, ...] = tuple(closure)
+        self.all_mask = (1 << len(order)) - 1
+
+        class_masks = {}
+        for class_name, skill_ids in (classes or {}).items():
+            mask = 0
+            for skill_id in skill_ids:
+                bit = self.index[skill_id]
+                mask |= (1 << bit) | self.closure[bit]
+            class_masks[class_name] = mask
+        self.class_masks: Mapping[str, int] = MappingProxyType(class_masks)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"SkillGraph is immutable ({name})")
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _topological_order(requires: Dict[str, List[str]]) -> List[str]:
+        """Kahn's algorithm, always taking the earliest defined ready skill"""
+        position = {skill_id: i for i, skill_id in enumerate(requires)}
+        dependents: Dict[str, List[str]] = {skill_id: [] for skill_id in requires}
+        waiting = {}
+        for skill_id, needed in requires.items():
+            waiting[skill_id] = len(needed)
+            for prerequisite in needed:
+                dependents[prerequisite].append(skill_id)
+
+        ready = [position[skill_id] for skill_id, count in waiting.items() if count == 0]
+        heapq.heapify(ready)
+        ids = list(requires)
+        order = []
+        while ready:
+            skill_id = ids[heapq.heappop(ready)]
+            order.append(skill_id)
+            for dependent in dependents[skill_id]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    heapq.heappush(ready, position[dependent])
+
+        if len(order) != len(requires):
+            stuck = sorted((skill_id for skill_id, count in waiting.items() if count), key=position.get)
+            raise ValueError(f"Skill prerequisites contain a cycle: {', '.join(stuck)}")
+        return order
+
+    # Bitsets
+
+    def bit(self, skill_id: str) -> Optional[int]:
+        return self.index.get(skill_id)
+
+    def mask(self, skill_ids: Iterable[str]) -> int:
+        """Bitset of the given skills (unknown ids are ignored)"""
+        mask = 0
+        index = self.index
+        for skill_id in skill_ids:
+            bit = index.get(skill_id)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def ids_of(self, mask: int) -> List[str]:
+        """Skill ids in a bitset, in topological order"""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self.ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+    # Queries
+
+    def prerequisites(self, skill_id: str) -> List[str]:
+        """Every skill needed (directly or not) before skill_id, in learning order"""
+        bit = self.index.get(skill_id)
+        return [] if bit is None else self.ids_of(self.closure[bit])
+
+    def missing(self, skill_id: str, learned: int) -> int:
+        """Bitset of prerequisites of skill_id not in learned"""
+        return self.closure[self.index[skill_id]] & ~learned
+
+    def learnable(self, learned: int, within: Optional[int] = None) -> int:
+        """Bitset of skills not learned yet whose whole prerequisite closure is learned"""
+        candidates = (self.all_mask if within is None else within) & ~learned
+        result = 0
+        closure = self.closure
+        while candidates:
+            low = candidates & -candidates
+            if not closure[low.bit_length() - 1] & ~learned:
+                result |= low
+            candidates ^= low
+        return result
+
+    def class_mask(self, class_name: str) -> int:
+        return self.class_masks.get(class_name, 0)
+
+    def class_skills(self, class_name: str) -> List[str]:
+        """A class tree's skills and their prerequisites, in topological order"""
+        return self.ids_of(self.class_mask(class_name))
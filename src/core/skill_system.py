@@ -7,6 +7,7 @@ Comprehensive skill system with skill-based action requirements, progression,
 and learning mechanics.
 """
 
+import copy
 import json
 import os
 import uuid
@@ -14,6 +15,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
+from .skill_graph import SkillGraph
+
 class SkillType(Enum):
     COMBAT = "combat"
     SOCIAL = "social"
@@ -30,6 +33,156 @@ class SkillDifficulty(Enum):
     EXPERT = "expert"
     MASTER = "master"
 
+# Skill trees offered per character class, in learning order
+CLASS_SKILL_TREES = {
+    "warrior": {
+        "class_name": "Savaşçı",
+        "description": "Savaş odaklı beceri ağacı",
+        "skills": [
+            {
+                "id": "weapon_mastery",
+                "name": "Silah Ustalığı",
+                "type": "combat",
+                "description": "Silahları etkili kullanma",
+                "max_level": 5,
+                "prerequisites": []
+            },
+            {
+                "id": "armor_training",
+                "name": "Zırh Eğitimi",
+                "type": "combat",
+                "description": "Zırh kullanma becerisi",
+                "max_level": 3,
+                "prerequisites": []
+            },
+            {
+                "id": "battle_tactics",
+                "name": "Savaş Taktikleri",
+                "type": "combat",
+                "description": "Savaş stratejileri",
+                "max_level": 4,
+                "prerequisites": ["weapon_mastery"]
+            }
+        ],
+        "current_skill_points": 5,
+        "max_skill_points": 20
+    },
+    "mage": {
+        "class_name": "Büyücü",
+        "description": "Büyü odaklı beceri ağacı",
+        "skills": [
+            {
+                "id": "spellcasting",
+                "name": "Büyü Yapma",
+                "type": "magic",
+                "description": "Büyü yapma becerisi",
+                "max_level": 5,
+                "prerequisites": []
+            },
+            {
+                "id": "magic_knowledge",
+                "name": "Büyü Bilgisi",
+                "type": "knowledge",
+                "description": "Büyü teorisi",
+                "max_level": 4,
+                "prerequisites": []
+            },
+            {
+                "id": "elemental_magic",
+                "name": "Elemental Büyü",
+                "type": "magic",
+                "description": "Elemental büyüler",
+                "max_level": 5,
+                "prerequisites": ["spellcasting"]
+            }
+        ],
+        "current_skill_points": 5,
+        "max_skill_points": 20
+    },
+    "rogue": {
+        "class_name": "Hırsız",
+        "description": "Gizlilik odaklı beceri ağacı",
+        "skills": [
+            {
+                "id": "stealth",
+                "name": "Gizlilik",
+                "type": "stealth",
+                "description": "Gizli hareket etme",
+                "max_level": 5,
+                "prerequisites": []
+            },
+            {
+                "id": "lockpicking",
+                "name": "Kilit Açma",
+                "type": "stealth",
+                "description": "Kilit açma becerisi",
+                "max_level": 4,
+                "prerequisites": []
+            },
+            {
+                "id": "trap_disarming",
+                "name": "Tuzak Etkisizleştirme",
+                "type": "stealth",
+                "description": "Tuzakları etkisizleştirme",
+                "max_level": 4,
+                "prerequisites": ["lockpicking"]
+            }
+        ],
+        "current_skill_points": 5,
+        "max_skill_points": 20
+    },
+    "cleric": {
+        "class_name": "Rahip",
+        "description": "İyileştirme odaklı beceri ağacı",
+        "skills": [
+            {
+                "id": "healing",
+                "name": "İyileştirme",
+                "type": "magic",
+                "description": "Yaraları iyileştirme",
+                "max_level": 5,
+                "prerequisites": []
+            },
+            {
+                "id": "divine_magic",
+                "name": "İlahi Büyü",
+                "type": "magic",
+                "description": "İlahi büyüler",
+                "max_level": 5,
+                "prerequisites": []
+            },
+            {
+                "id": "protection_magic",
+                "name": "Koruma Büyüsü",
+                "type": "magic",
+                "description": "Koruyucu büyüler",
+                "max_level": 4,
+                "prerequisites": ["divine_magic"]
+            }
+        ],
+        "current_skill_points": 5,
+        "max_skill_points": 20
+    }
+}
+
+# Served when a class has no tree of its own
+DEFAULT_SKILL_TREE = {
+    "class_name": "Genel",
+    "description": "Genel beceri ağacı",
+    "skills": [
+        {
+            "id": "basic_combat",
+            "name": "Temel Savaş",
+            "type": "combat",
+            "description": "Temel savaş becerileri",
+            "max_level": 3,
+            "prerequisites": []
+        }
+    ],
+    "current_skill_points": 3,
+    "max_skill_points": 15
+}
+
 class SkillSystem:
     """Comprehensive skill system with progression and learning"""
     
@@ -53,9 +206,27 @@ class SkillSystem:
             else:
                 self.skills = self._create_default_skills()
                 self._save_skills()
+            self._compile_skill_graph()
         except Exception as e:
             print(f"Error loading skills: {e}")
             self.skills = self._create_default_skills()
+            self._compile_skill_graph()
+    
+    def _compile_skill_graph(self):
+        """Compile skill definitions and class trees into the prerequisite DAG and tree payloads"""
+        prerequisites = {skill_id: skill_def.get("prerequisites", []) for skill_id, skill_def in self.skills.items()}
+        for tree in CLASS_SKILL_TREES.values():
+            for skill in tree["skills"]:
+                prerequisites[skill["id"]] = list(prerequisites.get(skill["id"], [])) + skill["prerequisites"]
+        classes = {class_name: [skill["id"] for skill in tree["skills"]]
+                   for class_name, tree in CLASS_SKILL_TREES.items()}
+        self.skill_graph = SkillGraph(prerequisites, classes)
+        
+        order = self.skill_graph.index
+        self._skill_trees = {
+            class_name: dict(tree, skills=sorted(tree["skills"], key=lambda skill: order[skill["id"]]))
+            for class_name, tree in CLASS_SKILL_TREES.items()
+        }
     
     def _save_skills(self):
         """Save skill definitions"""
@@ -289,40 +460,11 @@ class SkillSystem:
                 return {"success": False, "error": f"Skill {skill_id} not found"}
             
             player_data = self.get_player_skills(player_id)
-            
-            # Check prerequisites
-            for prerequisite in skill_def.get("prerequisites", []):
-                if prerequisite not in player_data["skills"]:
-                    return {
-                        "success": False,
-                        "error": f"Requires {prerequisite} skill"
-                    }
-            
-            # Check requirements
-            requirements = skill_def.get("requirements", {})
-            
-            # Check level requirement
-            if "level" in requirements:
-                player_level = self._calculate_player_level(player_id)
-                if player_level < requirements["level"]:
-                    return {
-                        "success": False,
-                        "error": f"Requires level {requirements['level']}"
-                    }
-            
-            # Check skill points
-            if player_data["skill_points"] < requirements.get("skill_points", 1):
-                return {
-                    "success": False,
-                    "error": f"Not enough skill points"
-                }
-            
-            # Check if already learned
-            if skill_id in player_data["skills"]:
-                return {
-                    "success": False,
-                    "error": f"Skill already learned"
-                }
+            error = self._learn_error(skill_id, skill_def, player_data,
+                                      self.skill_graph.mask(player_data["skills"]),
+                                      self._calculate_player_level(player_id))
+            if error:
+                return {"success": False, "error": error}
             
             return {
                 "success": True,
@@ -334,6 +476,31 @@ class SkillSystem:
         except Exception as e:
             return {"success": False, "error": f"Error checking skill requirements: {str(e)}"}
     
+    def _learn_error(self, skill_id: str, skill_def: Dict[str, Any], player_data: Dict[str, Any],
+                     learned: int, player_level: int) -> Optional[str]:
+        """Why a skill cannot be learned (None if it can), given the player's learned skill bitset"""
+        # Check prerequisites (transitively); report the first one to learn
+        missing = self.skill_graph.missing(skill_id, learned)
+        if missing:
+            return f"Requires {self.skill_graph.ids_of(missing & -missing)[0]} skill"
+        
+        # Check requirements
+        requirements = skill_def.get("requirements", {})
+        
+        # Check level requirement
+        if "level" in requirements and player_level < requirements["level"]:
+            return f"Requires level {requirements['level']}"
+        
+        # Check skill points
+        if player_data["skill_points"] < requirements.get("skill_points", 1):
+            return "Not enough skill points"
+        
+        # Check if already learned
+        if skill_id in player_data["skills"]:
+            return "Skill already learned"
+        
+        return None
+    
     def learn_skill(self, player_id: str, skill_id: str) -> Dict[str, Any]:
         """Learn a skill"""
         try:
@@ -533,9 +700,12 @@ class SkillSystem:
         """Get all skills available to the player"""
         available_skills = []
         player_data = self.get_player_skills(player_id)
+        learned = self.skill_graph.mask(player_data["skills"])
+        player_level = self._calculate_player_level(player_id)
         
         for skill_id, skill_def in self.skills.items():
-            can_learn = self.can_learn_skill(player_id, skill_id)
+            error = self._learn_error(skill_id, skill_def, player_data, learned, player_level)
+            skill_data = player_data["skills"].get(skill_id)
             
             available_skills.append({
                 "id": skill_id,
@@ -545,171 +715,21 @@ class SkillSystem:
                 "difficulty": skill_def["difficulty"],
                 "max_level": skill_def["max_level"],
                 "requirements": skill_def.get("requirements", {}),
-                "can_learn": can_learn["success"],
-                "error": can_learn.get("error", ""),
-                "learned": skill_id in player_data["skills"],
-                "current_level": player_data["skills"].get(skill_id, {}).get("level", 0) if skill_id in player_data["skills"] else 0
+                "can_learn": error is None,
+                "error": error or "",
+                "learned": skill_data is not None,
+                "current_level": skill_data.get("level", 0) if skill_data is not None else 0
             })
         
         return available_skills
+    
+    def get_learnable_skills(self, player_id: str, character_class: Optional[str] = None) -> List[str]:
+        """Skill ids whose prerequisites the player has all learned (optionally within a class tree), in learning order"""
+        player_data = self.get_player_skills(player_id)
+        within = self.skill_graph.class_mask(character_class) if character_class else None
+        learnable = self.skill_graph.learnable(self.skill_graph.mask(player_data["skills"]), within)
+        return [skill_id for skill_id in self.skill_graph.ids_of(learnable) if skill_id in self.skills]
 
     def get_skill_tree(self, character_class: str) -> Dict[str, Any]:
-        """Get skill tree for a specific character class"""
-        try:
-            # Define skill trees for different character classes
-            skill_trees = {
-                "warrior": {
-                    "class_name": "Savaşçı",
-                    "description": "Savaş odaklı beceri ağacı",
-                    "skills": [
-                        {
-                            "id": "weapon_mastery",
-                            "name": "Silah Ustalığı",
-                            "type": "combat",
-                            "description": "Silahları etkili kullanma",
-                            "max_level": 5,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "armor_training",
-                            "name": "Zırh Eğitimi",
-                            "type": "combat",
-                            "description": "Zırh kullanma becerisi",
-                            "max_level": 3,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "battle_tactics",
-                            "name": "Savaş Taktikleri",
-                            "type": "combat",
-                            "description": "Savaş stratejileri",
-                            "max_level": 4,
-                            "prerequisites": ["weapon_mastery"]
-                        }
-                    ],
-                    "current_skill_points": 5,
-                    "max_skill_points": 20
-                },
-                "mage": {
-                    "class_name": "Büyücü",
-                    "description": "Büyü odaklı beceri ağacı",
-                    "skills": [
-                        {
-                            "id": "spellcasting",
-                            "name": "Büyü Yapma",
-                            "type": "magic",
-                            "description": "Büyü yapma becerisi",
-                            "max_level": 5,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "magic_knowledge",
-                            "name": "Büyü Bilgisi",
-                            "type": "knowledge",
-                            "description": "Büyü teorisi",
-                            "max_level": 4,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "elemental_magic",
-                            "name": "Elemental Büyü",
-                            "type": "magic",
-                            "description": "Elemental büyüler",
-                            "max_level": 5,
-                            "prerequisites": ["spellcasting"]
-                        }
-                    ],
-                    "current_skill_points": 5,
-                    "max_skill_points": 20
-                },
-                "rogue": {
-                    "class_name": "Hırsız",
-                    "description": "Gizlilik odaklı beceri ağacı",
-                    "skills": [
-                        {
-                            "id": "stealth",
-                            "name": "Gizlilik",
-                            "type": "stealth",
-                            "description": "Gizli hareket etme",
-                            "max_level": 5,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "lockpicking",
-                            "name": "Kilit Açma",
-                            "type": "stealth",
-                            "description": "Kilit açma becerisi",
-                            "max_level": 4,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "trap_disarming",
-                            "name": "Tuzak Etkisizleştirme",
-                            "type": "stealth",
-                            "description": "Tuzakları etkisizleştirme",
-                            "max_level": 4,
-                            "prerequisites": ["lockpicking"]
-                        }
-                    ],
-                    "current_skill_points": 5,
-                    "max_skill_points": 20
-                },
-                "cleric": {
-                    "class_name": "Rahip",
-                    "description": "İyileştirme odaklı beceri ağacı",
-                    "skills": [
-                        {
-                            "id": "healing",
-                            "name": "İyileştirme",
-                            "type": "magic",
-                            "description": "Yaraları iyileştirme",
-                            "max_level": 5,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "divine_magic",
-                            "name": "İlahi Büyü",
-                            "type": "magic",
-                            "description": "İlahi büyüler",
-                            "max_level": 5,
-                            "prerequisites": []
-                        },
-                        {
-                            "id": "protection_magic",
-                            "name": "Koruma Büyüsü",
-                            "type": "magic",
-                            "description": "Koruyucu büyüler",
-                            "max_level": 4,
-                            "prerequisites": ["divine_magic"]
-                        }
-                    ],
-                    "current_skill_points": 5,
-                    "max_skill_points": 20
-                }
-            }
-            
-            # Return the skill tree for the specified class
-            if character_class in skill_trees:
-                return skill_trees[character_class]
-            else:
-                # Return a default skill tree if class not found
-                return {
-                    "class_name": "Genel",
-                    "description": "Genel beceri ağacı",
-                    "skills": [
-                        {
-                            "id": "basic_combat",
-                            "name": "Temel Savaş",
-                            "type": "combat",
-                            "description": "Temel savaş becerileri",
-                            "max_level": 3,
-                            "prerequisites": []
-                        }
-                    ],
-                    "current_skill_points": 3,
-                    "max_skill_points": 15
-                }
-                
-        except Exception as e:
-            print(f"Error getting skill tree: {e}")
-            return None
+        """Get skill tree for a specific character class (a copy of the precomputed, sorted payload)"""
+        return copy.deepcopy(self._skill_trees.get(character_class, DEFAULT_SKILL_TREE))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Connection Index for Multiplayer
+================================
+
+Secondary indexes over live connections so that lookups and broadcasts
+never scan every connection:
+- connection -> player / session
+- player -> connection
+- session (or room) -> set of connections
+"""
+
+from typing import Dict, Optional, Set, Tuple
+
+
+class ConnectionIndex:
+    """Keeps player and session lookups for connections in sync"""
+
+    def __init__(self):
+        self.connection_players: Dict[str, str] = {}
+        self.connection_sessions: Dict[str, str] = {}
+        self.player_connections: Dict[str, str] = {}
+        self.session_connections: Dict[str, Set[str]] = {}
+
+    def bind_player(self, connection_id: str, player_id: str):
+        """Associate a connection with a player (the latest connection wins)"""
+        previous_player = self.connection_players.get(connection_id)
+        if previous_player and previous_player != player_id:
+            self._unbind_player(connection_id, previous_player)
+
+        self.connection_players[connection_id] = player_id
+        self.player_connections[player_id] = connection_id
+
+    def join_session(self, connection_id: str, session_id: str):
+        """Move a connection into a session"""
+        current = self.connection_sessions.get(connection_id)
+        if current == session_id:
+            return
+        if current is not None:
+            self.leave_session(connection_id)
+
+        self.connection_sessions[connection_id] = session_id
+        self.session_connections.setdefault(session_id, set()).add(connection_id)
+
+    def leave_session(self, connection_id: str) -> Optional[str]:
+        """Remove a connection from its session; returns the session it left"""
+        session_id = self.connection_sessions.pop(connection_id, None)
+        if session_id is None:
+            return None
+
+        connections = self.session_connections.get(session_id)
+        if connections is not None:
+            connections.discard(connection_id)
+            if not connections:
+                del self.session_connections[session_id]
+        return session_id
+
+    def remove_connection(self, connection_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """Drop a connection from every index; returns (player_id, session_id)"""
+        session_id = self.leave_session(connection_id)
+        player_id = self.connection_players.get(connection_id)
+        if player_id is not None:
+            self._unbind_player(connection_id, player_id)
+        return player_id, session_id
+
+    def _unbind_player(self, connection_id: str, player_id: str):
+        """Remove the player mapping for a connection"""
+        self.connection_players.pop(connection_id, None)
+        if self.player_connections.get(player_id) == connection_id:
+            del self.player_connections[player_id]
+
+    def get_player(self, connection_id: str) -> Optional[str]:
+        """Player bound to a connection"""
+        return self.connection_players.get(connection_id)
+
+    def get_session(self, connection_id: str) -> Optional[str]:
+        """Session a connection is in"""
+        return self.connection_sessions.get(connection_id)
+
+    def get_connection(self, player_id: str) -> Optional[str]:
+        """Current connection of a player"""
+        return self.player_connections.get(player_id)
+
+    def get_session_connections(self, session_id: str) -> Set[str]:
+        """Snapshot of the connections in a session"""
+        return set(self.session_connections.get(session_id, ()))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Index sizes"""
+        return {
+            "active_players": len(self.player_connections),
+            "active_sessions": len(self.session_connections)
+        }
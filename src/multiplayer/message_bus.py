@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Socket.IO Message Bus
+=====================
+
+Pluggable message queue for Socket.IO so that `emit(..., room=room_id)` on
+one worker reaches players connected to any other worker.
+
+SOCKETIO_MESSAGE_QUEUE selects the backend:
+- unset                - single process, no queue
+- local://[channel]    - in-process bus; several Socket.IO servers in one
+                         process share rooms (tests)
+- redis://, amqp://... - passed to Flask-SocketIO's own queue managers
+"""
+
+import os
+import pickle
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+LOCAL_SCHEME = "local://"
+DEFAULT_CHANNEL = "flask-socketio"
+
+
+class LocalMessageBus:
+    """In-process publish/subscribe bus; each subscriber gets its own queue"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[queue.Queue]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> queue.Queue:
+        """Register a subscriber and return its inbox"""
+        inbox = queue.Queue()
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(inbox)
+        return inbox
+
+    def unsubscribe(self, channel: str, inbox: queue.Queue):
+        """Remove a subscriber"""
+        with self._lock:
+            subscribers = self._subscribers.get(channel, [])
+            if inbox in subscribers:
+                subscribers.remove(inbox)
+
+    def publish(self, channel: str, message: Any) -> int:
+        """Deliver a copy of message to every subscriber; returns the receiver count"""
+        payload = pickle.dumps(message)
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, []))
+        for inbox in subscribers:
+            inbox.put(pickle.loads(payload))
+        return len(subscribers)
+
+
+local_bus = LocalMessageBus()
+
+
+def create_local_client_manager(channel: str = DEFAULT_CHANNEL, bus: LocalMessageBus = None,
+                                write_only: bool = False):
+    """Socket.IO client manager that fans messages out over a LocalMessageBus"""
+    import socketio
+
+    class LocalPubSubManager(socketio.PubSubManager):
+        name = "local"
+
+        def __init__(self):
+            super().__init__(channel=channel, write_only=write_only)
+            self.bus = bus or local_bus
+            self.inbox = None if write_only else self.bus.subscribe(channel)
+
+        def _publish(self, data):
+            return self.bus.publish(self.channel, data)
+
+        def _listen(self):
+            while True:
+                yield self.inbox.get()
+
+    return LocalPubSubManager()
+
+
+def socketio_options(message_queue: Optional[str] = None) -> Dict[str, Any]:
+    """Keyword arguments for SocketIO(...) for the configured message queue"""
+    url = message_queue if message_queue is not None else os.environ.get("SOCKETIO_MESSAGE_QUEUE")
+    if not url:
+        return {}
+    if url.startswith(LOCAL_SCHEME):
+        channel = url[len(LOCAL_SCHEME):] or DEFAULT_CHANNEL
+        return {"client_manager": create_local_client_manager(channel)}
+    return {"message_queue": url}
+
+
+def create_socketio(app, message_queue: Optional[str] = None, **kwargs):
+    """Create a SocketIO server bound to the configured message queue"""
+    from flask_socketio import SocketIO
+
+    options = socketio_options(message_queue)
+    options.update(kwargs)
+    return SocketIO(app, **options)
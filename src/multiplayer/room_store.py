@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Room State Store
+================
+
+Externalized multiplayer room state so one room can be served by several
+workers. Every write is an optimistic compare-and-set against the version
+the writer read; concurrent writers retry instead of overwriting each other.
+
+Backends:
+- memory:// - in-process store, shared by every worker object in the process
+               (tests and single-worker deployments)
+- redis://  - shared Redis store using WATCH/MULTI for the version check
+"""
+
+import copy
+import json
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class VersionConflict(Exception):
+    """Raised when a room changed since it was read"""
+
+
+class RoomStore:
+    """Base room store; backends implement get/create/compare_and_set/delete"""
+
+    max_retries = 10
+
+    def get(self, room_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Return (state, version) or None when the room does not exist"""
+        raise NotImplementedError
+
+    def create(self, room_id: str, state: Dict[str, Any]) -> bool:
+        """Create a room at version 1; False if it already exists"""
+        raise NotImplementedError
+
+    def compare_and_set(self, room_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        """Write state if the stored version matches; returns the new version"""
+        raise NotImplementedError
+
+    def delete(self, room_id: str) -> bool:
+        """Remove a room"""
+        raise NotImplementedError
+
+    def get_state(self, room_id: str) -> Optional[Dict[str, Any]]:
+        """Room state without its version"""
+        entry = self.get(room_id)
+        return entry[0] if entry else None
+
+    def update(self, room_id: str, mutator: Callable[[Dict[str, Any]], Any]) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """
+        Apply mutator to a fresh copy of the room state and write it back.
+
+        The mutator may run more than once when other workers write the same
+        room concurrently, so it must only touch the state it is given.
+        Returns (new state, mutator result), or None if the room is missing.
+        """
+        for _ in range(self.max_retries):
+            entry = self.get(room_id)
+            if entry is None:
+                return None
+
+            state, version = entry
+            result = mutator(state)
+            try:
+                self.compare_and_set(room_id, state, version)
+                return state, result
+            except VersionConflict:
+                continue
+
+        raise VersionConflict(f"Room {room_id} kept changing during update")
+
+
+class LocalRoomStore(RoomStore):
+    """In-process room store"""
+
+    def __init__(self):
+        self._rooms: Dict[str, Tuple[Dict[str, Any], int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, room_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        with self._lock:
+            entry = self._rooms.get(room_id)
+            if entry is None:
+                return None
+            state, version = entry
+        return copy.deepcopy(state), version
+
+    def create(self, room_id: str, state: Dict[str, Any]) -> bool:
+        with self._lock:
+            if room_id in self._rooms:
+                return False
+            self._rooms[room_id] = (copy.deepcopy(state), 1)
+            return True
+
+    def compare_and_set(self, room_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        with self._lock:
+            entry = self._rooms.get(room_id)
+            if entry is None or entry[1] != expected_version:
+                raise VersionConflict(f"Room {room_id} is no longer at version {expected_version}")
+            new_version = expected_version + 1
+            self._rooms[room_id] = (copy.deepcopy(state), new_version)
+            return new_version
+
+    def delete(self, room_id: str) -> bool:
+        with self._lock:
+            return self._rooms.pop(room_id, None) is not None
+
+
+class RedisRoomStore(RoomStore):
+    """Redis-backed room store shared by every worker"""
+
+    def __init__(self, url: str, prefix: str = "room:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RedisRoomStore requires the 'redis' package") from e
+
+        self.redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._watch_error = redis.WatchError
+
+    def _key(self, room_id: str) -> str:
+        return f"{self.prefix}{room_id}"
+
+    @staticmethod
+    def _encode(state: Dict[str, Any], version: int) -> str:
+        return json.dumps({"version": version, "state": state}, ensure_ascii=False)
+
+    def get(self, room_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        raw = self.redis.get(self._key(room_id))
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry["state"], entry["version"]
+
+    def create(self, room_id: str, state: Dict[str, Any]) -> bool:
+        return bool(self.redis.set(self._key(room_id), self._encode(state, 1), nx=True))
+
+    def compare_and_set(self, room_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        key = self._key(room_id)
+        with self.redis.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                raw = pipe.get(key)
+                if raw is None or json.loads(raw)["version"] != expected_version:
+                    raise VersionConflict(f"Room {room_id} is no longer at version {expected_version}")
+                new_version = expected_version + 1
+                pipe.multi()
+                pipe.set(key, self._encode(state, new_version))
+                pipe.execute()
+                return new_version
+            except self._watch_error as e:
+                raise VersionConflict(f"Room {room_id} changed during write") from e
+
+    def delete(self, room_id: str) -> bool:
+        return bool(self.redis.delete(self._key(room_id)))
+
+
+_local_store = LocalRoomStore()
+
+
+def create_room_store(url: Optional[str] = None) -> RoomStore:
+    """Create a room store from a URL (memory:// or redis://)"""
+    if not url or url.startswith("memory://"):
+        return _local_store
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisRoomStore(url)
+    raise ValueError(f"Unsupported room store URL: {url}")
@@ -15,6 +15,8 @@ from typing import Dict, List, Any, Optional, Set
 from enum import Enum
 from dataclasses import dataclass, asdict
 
+from src.utils.expiry import ExpiryScheduler
+
 class SessionStatus(Enum):
     LOBBY = "lobby"
     IN_GAME = "in_game"
@@ -52,6 +54,8 @@ class MultiplayerSessionManager:
     
     def __init__(self):
         self.sessions_file = "data/multiplayer_sessions.json"
+        # Sessions ordered by last_updated, so cleanup only visits stale ones
+        self.session_activity = ExpiryScheduler(on_expire=self._expire_session)
         self._ensure_data_directory()
         self._load_sessions()
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
@@ -71,6 +75,17 @@ class MultiplayerSessionManager:
         except Exception as e:
             print(f"Error loading multiplayer sessions: {e}")
             self.sessions = {}
+        
+        for session_id, session in self.sessions.items():
+            self._touch_session(session_id, session["last_updated"])
+    
+    def _touch_session(self, session_id: str, last_updated: str):
+        """Record session activity for inactivity cleanup"""
+        self.session_activity.schedule(session_id, last_updated)
+    
+    def _expire_session(self, session_id: str):
+        """Drop a session whose activity fell behind the cleanup cutoff"""
+        self.sessions.pop(session_id, None)
     
     def _save_sessions(self):
         """Save multiplayer sessions"""
@@ -126,6 +141,7 @@ class MultiplayerSessionManager:
             
             session_data["players"].append(asdict(creator_player))
             self.sessions[session_id] = session_data
+            self._touch_session(session_id, now)
             self._save_sessions()
             
             return {
@@ -174,6 +190,7 @@ class MultiplayerSessionManager:
             
             session["players"].append(asdict(new_player))
             session["last_updated"] = now
+            self._touch_session(session_id, now)
             self._save_sessions()
             
             return {
@@ -213,6 +230,7 @@ class MultiplayerSessionManager:
                         team["leader_id"] = team["players"][0] if team["players"] else None
             
             session["last_updated"] = datetime.now().isoformat()
+            self._touch_session(session_id, session["last_updated"])
             
             # If no players left, end session
             if len(session["players"]) == 0:
@@ -265,6 +283,7 @@ class MultiplayerSessionManager:
             
             session["teams"].append(asdict(new_team))
             session["last_updated"] = now
+            self._touch_session(session_id, now)
             self._save_sessions()
             
             return {
@@ -315,6 +334,7 @@ class MultiplayerSessionManager:
             
             session["game_state"]["team_actions"].append(team_action_record)
             session["last_updated"] = datetime.now().isoformat()
+            self._touch_session(session_id, session["last_updated"])
             self._save_sessions()
             
             return {
@@ -446,24 +466,16 @@ class MultiplayerSessionManager:
                 break
         
         session["last_updated"] = now
+        self._touch_session(session_id, now)
         self._save_sessions()
         return True
     
     def cleanup_inactive_sessions(self, max_inactive_hours: int = 24) -> int:
         """Clean up inactive sessions"""
-        now = datetime.now()
-        cleanup_count = 0
-        
-        sessions_to_remove = []
-        
-        for session_id, session in self.sessions.items():
-            last_updated = datetime.fromisoformat(session["last_updated"])
-            if now - last_updated > timedelta(hours=max_inactive_hours):
-                sessions_to_remove.append(session_id)
+        cutoff = datetime.now() - timedelta(hours=max_inactive_hours)
         
-        for session_id in sessions_to_remove:
-            del self.sessions[session_id]
-            cleanup_count += 1
+        # Expired sessions are removed by _expire_session
+        cleanup_count = len(self.session_activity.expire_due(cutoff))
         
         if cleanup_count > 0:
             self._save_sessions()
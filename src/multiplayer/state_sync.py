@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Versioned Game State Sync
+=========================
+
+Every change to a room's game_state produces a compact JSON-Patch
+(RFC 6902 add/remove/replace) tagged with a monotonically increasing
+state version. Clients apply patches in order; a client whose version has
+fallen out of the patch history asks for a full snapshot instead.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+# Patches kept per room for clients that fall a few versions behind
+PATCH_HISTORY = 64
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_state(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Return the JSON-Patch operations that turn old into new"""
+    ops: List[Dict[str, Any]] = []
+    _diff(old, new, path, ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: str, ops: List[Dict[str, Any]]):
+    if old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child_path = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child_path, "value": value})
+            else:
+                _diff(old[key], value, child_path, ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, ops)
+    else:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def _diff_list(old: List[Any], new: List[Any], path: str, ops: List[Dict[str, Any]]):
+    # Trim the unchanged head and tail so appends, inserts and single
+    # removals become one operation instead of a shifted replace per item
+    start = 0
+    while start < len(old) and start < len(new) and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    common = min(old_end, new_end) - start
+    for offset in range(common):
+        index = start + offset
+        _diff(old[index], new[index], f"{path}/{index}", ops)
+    for index in range(old_end - 1, start + common - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{index}"})
+    for index in range(start + common, new_end):
+        ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply JSON-Patch operations in place; returns the (possibly replaced) document"""
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            document = copy.deepcopy(op.get("value"))
+            continue
+
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        value = copy.deepcopy(op.get("value"))
+        if isinstance(parent, list):
+            if op["op"] == "add":
+                parent.insert(len(parent) if last == "-" else int(last), value)
+            elif op["op"] == "remove":
+                del parent[int(last)]
+            else:
+                parent[int(last)] = value
+        else:
+            if op["op"] == "remove":
+                del parent[last]
+            else:
+                parent[last] = value
+    return document
+
+
+def record_patch(room: Dict[str, Any], previous_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Diff room['game_state'] against its previous value and log the patch.
+
+    Bumps room['state_version'] and keeps the last PATCH_HISTORY patches in
+    room['patches']. Returns the patch, or None when nothing changed.
+    """
+    ops = diff_state(previous_state, room["game_state"])
+    if not ops:
+        return None
+
+    base_version = room.get("state_version", 0)
+    patch = {"base_version": base_version, "version": base_version + 1, "ops": ops}
+    room["state_version"] = patch["version"]
+
+    patches = room.setdefault("patches", [])
+    patches.append(patch)
+    if len(patches) > PATCH_HISTORY:
+        del patches[:len(patches) - PATCH_HISTORY]
+    return patch
+
+
+def patches_since(room: Dict[str, Any], version: int) -> Optional[List[Dict[str, Any]]]:
+    """Patches that bring a client at version up to date, or None if a snapshot is needed"""
+    current = room.get("state_version", 0)
+    if version == current:
+        return []
+    if version > current:
+        return None
+
+    patches = room.get("patches", [])
+    if not patches or patches[0]["base_version"] > version:
+        return None
+    return [patch for patch in patches if patch["base_version"] >= version]
+
+
+def snapshot(room: Dict[str, Any]) -> Dict[str, Any]:
+    """Full game state with its version"""
+    return {"version": room.get("state_version", 0), "game_state": room["game_state"]}
@@ -15,9 +15,12 @@ import asyncio
 import json
 import logging
 from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 
+from .connection_index import ConnectionIndex
+from ..utils.expiry import ExpiryScheduler
+
 logger = logging.getLogger(__name__)
 
 class MessageType(Enum):
@@ -53,6 +56,9 @@ class WebSocketHandler:
         self.session_manager = session_manager
         self.game_engine = game_engine
         self.connections: Dict[str, Any] = {}
+        self.connection_index = ConnectionIndex()
+        # Connections ordered by last ping, so idle cleanup skips live ones
+        self.connection_activity = ExpiryScheduler()
         self.message_handlers: Dict[str, Callable] = {}
         self._setup_message_handlers()
     
@@ -74,13 +80,15 @@ class WebSocketHandler:
     async def handle_connection(self, websocket, path):
         """Handle new WebSocket connection"""
         connection_id = str(id(websocket))
+        now = datetime.now()
         self.connections[connection_id] = {
             "websocket": websocket,
-            "connected_at": datetime.now(),
+            "connected_at": now,
             "player_id": None,
             "session_id": None,
-            "last_ping": datetime.now()
+            "last_ping": now
         }
+        self.connection_activity.schedule(connection_id, now)
         
         logger.info(f"New WebSocket connection: {connection_id}")
         
@@ -120,6 +128,7 @@ class WebSocketHandler:
         
         # Update connection info
         self.connections[connection_id]["player_id"] = player_id
+        self.connection_index.bind_player(connection_id, player_id)
         
         # Send connection confirmation
         await self._send_message(connection_id, {
@@ -146,6 +155,8 @@ class WebSocketHandler:
         
         # Remove connection
         del self.connections[connection_id]
+        self.connection_index.remove_connection(connection_id)
+        self.connection_activity.cancel(connection_id)
         
         logger.info(f"Player {player_id} disconnected: {connection_id}")
     
@@ -165,6 +176,7 @@ class WebSocketHandler:
         if result["success"]:
             # Update connection info
             self.connections[connection_id]["session_id"] = session_id
+            self.connection_index.join_session(connection_id, session_id)
             
             # Send success response
             await self._send_message(connection_id, {
@@ -195,6 +207,7 @@ class WebSocketHandler:
         if result["success"]:
             # Update connection info
             self.connections[connection_id]["session_id"] = None
+            self.connection_index.leave_session(connection_id)
             
             await self._send_message(connection_id, {
                 "type": MessageType.SUCCESS.value,
@@ -358,7 +371,9 @@ class WebSocketHandler:
         """Handle ping message"""
         # Update last ping time
         if connection_id in self.connections:
-            self.connections[connection_id]["last_ping"] = datetime.now()
+            now = datetime.now()
+            self.connections[connection_id]["last_ping"] = now
+            self.connection_activity.schedule(connection_id, now)
         
         # Send pong response
         await self._send_message(connection_id, {
@@ -389,19 +404,20 @@ class WebSocketHandler:
     async def _broadcast_to_session(self, session_id: str, message: Dict[str, Any], 
                                    exclude_player_id: str = None):
         """Broadcast message to all players in session"""
-        session = self.session_manager.active_sessions.get(session_id)
-        if not session:
-            return
-        
-        for player in session.current_players:
-            if player.id == exclude_player_id:
+        for connection_id in self.connection_index.get_session_connections(session_id):
+            if exclude_player_id and self.connection_index.get_player(connection_id) == exclude_player_id:
                 continue
             
-            # Find connection for player
-            for connection_id, connection in self.connections.items():
-                if connection.get("player_id") == player.id:
-                    await self._send_message(connection_id, message)
-                    break
+            await self._send_message(connection_id, message)
+    
+    async def send_to_player(self, player_id: str, message: Dict[str, Any]) -> bool:
+        """Send message to a player's current connection"""
+        connection_id = self.connection_index.get_connection(player_id)
+        if connection_id is None:
+            return False
+        
+        await self._send_message(connection_id, message)
+        return True
     
     async def broadcast_notification(self, session_id: str, notification: str, 
                                    notification_type: str = "info"):
@@ -415,25 +431,16 @@ class WebSocketHandler:
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get WebSocket connection statistics"""
-        total_connections = len(self.connections)
-        active_players = len(set(c.get("player_id") for c in self.connections.values() if c.get("player_id")))
-        active_sessions = len(set(c.get("session_id") for c in self.connections.values() if c.get("session_id")))
-        
         return {
-            "total_connections": total_connections,
-            "active_players": active_players,
-            "active_sessions": active_sessions
+            "total_connections": len(self.connections),
+            **self.connection_index.get_stats()
         }
     
     async def cleanup_inactive_connections(self, max_idle_minutes: int = 30):
         """Clean up inactive connections"""
-        cutoff_time = datetime.now().replace(minute=datetime.now().minute - max_idle_minutes)
-        
-        connections_to_remove = []
-        for connection_id, connection in self.connections.items():
-            if connection["last_ping"] < cutoff_time:
-                connections_to_remove.append(connection_id)
+        cutoff_time = datetime.now() - timedelta(minutes=max_idle_minutes)
         
+        connections_to_remove = self.connection_activity.expire_due(cutoff_time)
         for connection_id in connections_to_remove:
             await self._handle_disconnect(connection_id)
         
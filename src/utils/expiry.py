@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Expiry Scheduler
+================
+
+Shared expiry service for sessions, connections and guest accounts.
+
+Entities are kept in a min-heap keyed by deadline (a POSIX timestamp).
+Touching an entity reschedules it in O(log n); the old heap entry is left
+behind and skipped lazily. Expiring pops only entries whose deadline has
+passed, so cleanup cost is proportional to what actually expires instead
+of a scan over every record.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+Deadline = Union[float, datetime, str]
+
+
+def to_timestamp(value: Deadline) -> float:
+    """Normalize a datetime, ISO string or timestamp to a POSIX timestamp"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class ExpiryScheduler:
+    """Min-heap of deadlines with lazy invalidation"""
+
+    def __init__(self, on_expire: Optional[Callable[[Hashable], Any]] = None,
+                 clock: Callable[[], float] = time.time):
+        self.on_expire = on_expire
+        self.clock = clock
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def schedule(self, key: Hashable, deadline: Deadline):
+        """Set (or move) the deadline of key"""
+        deadline = to_timestamp(deadline)
+        with self._lock:
+            sequence = next(self._sequence)
+            self._entries[key] = (deadline, sequence)
+            heapq.heappush(self._heap, (deadline, sequence, key))
+            self._compact_if_needed()
+
+    def touch(self, key: Hashable, ttl_seconds: float):
+        """Reschedule key to expire ttl_seconds from now"""
+        self.schedule(key, self.clock() + ttl_seconds)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Stop tracking key"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Current deadline of key, if tracked"""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest live deadline"""
+        with self._lock:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def expire_due(self, until: Optional[Deadline] = None) -> List[Hashable]:
+        """
+        Remove every key whose deadline is at or before until (default: now).
+
+        on_expire is called for each expired key, outside the lock.
+        Returns the expired keys in deadline order.
+        """
+        limit = self.clock() if until is None else to_timestamp(until)
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= limit:
+                deadline, sequence, key = heapq.heappop(self._heap)
+                if self._entries.get(key) == (deadline, sequence):
+                    del self._entries[key]
+                    expired.append(key)
+
+        if self.on_expire:
+            for key in expired:
+                self.on_expire(key)
+        return expired
+
+    def _drop_stale_head(self):
+        while self._heap:
+            deadline, sequence, key = self._heap[0]
+            if self._entries.get(key) == (deadline, sequence):
+                return
+            heapq.heappop(self._heap)
+
+    def _compact_if_needed(self):
+        # Rebuild once stale entries dominate so memory stays O(live keys)
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [(deadline, sequence, key) for key, (deadline, sequence) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
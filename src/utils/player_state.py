@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Player State Manager
+====================
+
+Per-player state (story progress, NPC interactions, saves, ...) with a
+bounded in-memory working set.
+
+Each player's sections live in one record. Recently used records stay
+resident in an LRU; when the resident set exceeds its budget (player count
+or estimated bytes) the least recently used player is written to its own
+JSON file and dropped from memory. Accessing that player again faults the
+record back in from disk.
+
+section(name) returns a dict-like view keyed by username, so code written
+against plain ``{username: value}`` dicts keeps working:
+
+    STORY_DATA["story_progress"] = player_state.section("story_progress")
+    STORY_DATA["story_progress"][username][scenario_id] = {...}
+
+Values handed out by a section are the resident objects and may be mutated
+in place, so handing out a dict or list marks the player dirty, as do
+section assignments and deletions. Membership tests and reads of unknown
+players neither mark nor create anything. Usernames must be non-empty
+strings: reads treat anything else (e.g. None for a session without a
+user) as an unknown player, writes raise ValueError. flush() writes dirty players
+back, skipping those whose record serializes to what is already on disk.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+DEFAULT_MAX_PLAYERS = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def _valid_username(username: Any) -> bool:
+    return isinstance(username, str) and username != ""
+
+
+def _file_key(username: str) -> str:
+    """File name stem for a username; unsafe names are hex encoded behind '%'"""
+    if _SAFE_NAME.match(username) and not username.startswith("."):
+        return username
+    return "%" + username.encode("utf-8").hex()
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _username(file_key: str) -> str:
+    if file_key.startswith("%"):
+        return bytes.fromhex(file_key[1:]).decode("utf-8")
+    return file_key
+
+
+class PlayerSection(MutableMapping):
+    """{username: value} view of one section of every player's record"""
+
+    def __init__(self, manager: "PlayerStateManager", name: str):
+        self.manager = manager
+        self.name = name
+
+    def __contains__(self, username) -> bool:
+        record = self.manager.get_record(username)
+        return record is not None and self.name in record
+
+    def __getitem__(self, username: str) -> Any:
+        record = self.manager.get_record(username)
+        if record is None or self.name not in record:
+            raise KeyError(username)
+        value = record[self.name]
+        if isinstance(value, (dict, list)):
+            # The caller may change it in place
+            self.manager.mark_dirty(username)
+        return value
+
+    def __setitem__(self, username: str, value: Any):
+        self.manager.get_record(username, create=True)[self.name] = value
+        self.manager.mark_dirty(username)
+
+    def __delitem__(self, username: str):
+        record = self.manager.get_record(username)
+        if record is None or self.name not in record:
+            raise KeyError(username)
+        del record[self.name]
+        self.manager.mark_dirty(username)
+
+    def __iter__(self) -> Iterator[str]:
+        # Walks every known player, faulting spilled ones in; meant for admin use
+        for username in self.manager.usernames():
+            if username in self:
+                yield username
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class PlayerStateManager:
+    """LRU working set of player records, spilled to one JSON file per player"""
+
+    def __init__(self, directory: str = "data/player_state", max_players: int = DEFAULT_MAX_PLAYERS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_players = max(1, max_players)
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._resident: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._digests: Dict[str, bytes] = {}  # Of the JSON last read from or written to disk
+        self._dirty = set()
+        self._on_disk = {_username(name[:-len(".json")]) for name in os.listdir(directory) if name.endswith(".json")}
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.faults = 0
+
+    def _path(self, username: str) -> str:
+        return os.path.join(self.directory, f"{_file_key(username)}.json")
+
+    def section(self, name: str) -> PlayerSection:
+        return PlayerSection(self, name)
+
+    def usernames(self):
+        with self._lock:
+            return sorted(self._on_disk | set(self._resident))
+
+    def get_record(self, username: str, create: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Resident record of a player, loading it from disk if it was spilled.
+
+        Returns None for an unknown player unless create is set. Reading does
+        not mark the player dirty; call mark_dirty after changing the record.
+        Raises ValueError when asked to create a record for an empty or
+        non-string username; reading one returns None.
+        """
+        if not _valid_username(username):
+            if create:
+                raise ValueError(f"Player state needs a non-empty username, got {username!r}")
+            return None
+        with self._lock:
+            record = self._resident.get(username)
+            if record is not None:
+                self._resident.move_to_end(username)
+                return record
+
+            if username in self._on_disk:
+                record = self._load(username)
+                self.faults += 1
+            elif create:
+                record = {}
+                self._sizes[username] = 0
+            else:
+                return None
+
+            self._resident[username] = record
+            self._enforce_budget()
+            return record
+
+    def mark_dirty(self, username: str):
+        """Have the next flush (or spill) write this resident player"""
+        with self._lock:
+            if username in self._resident:
+                self._dirty.add(username)
+
+    def _load(self, username: str) -> Dict[str, Any]:
+        try:
+            with open(self._path(username), 'r', encoding='utf-8') as f:
+                text = f.read()
+            self._sizes[username] = len(text)
+            self._digests[username] = _digest(text)
+            return json.loads(text)
+        except Exception as e:
+            print(f"Error loading player state for {username}: {e}")
+            self._sizes[username] = 0
+            self._digests.pop(username, None)
+            return {}
+
+    def _write(self, username: str, record: Dict[str, Any]):
+        path = self._path(username)
+        if not record:
+            # Nothing worth keeping; don't leave empty files behind
+            if username in self._on_disk:
+                os.remove(path)
+                self._on_disk.discard(username)
+            self._sizes[username] = 0
+            self._digests.pop(username, None)
+            return
+
+        text = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        digest = _digest(text)
+        self._sizes[username] = len(text)
+        if username in self._on_disk and self._digests.get(username) == digest:
+            # Handed out but not actually changed
+            return
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        self._on_disk.add(username)
+        self._digests[username] = digest
+
+    def _resident_bytes(self) -> int:
+        return sum(self._sizes.get(username, 0) for username in self._resident)
+
+    def _enforce_budget(self):
+        resident_bytes = self._resident_bytes()
+        # The most recently used player always stays resident
+        while len(self._resident) > 1 and (len(self._resident) > self.max_players
+                                           or resident_bytes > self.max_bytes):
+            username, record = self._resident.popitem(last=False)
+            resident_bytes -= self._sizes.get(username, 0)
+            if not self._spill(username, record):
+                break
+
+    def _spill(self, username: str, record: Dict[str, Any]) -> bool:
+        if username in self._dirty:
+            try:
+                self._write(username, record)
+            except Exception as e:
+                # Keep the player in memory rather than lose their state
+                print(f"Error spilling player state for {username}: {e}")
+                self._resident[username] = record
+                self._resident.move_to_end(username, last=False)
+                return False
+            self._dirty.discard(username)
+        self._sizes.pop(username, None)
+        self._digests.pop(username, None)
+        self.evictions += 1
+        return True
+
+    def evict(self, username: str) -> bool:
+        """Write a player to disk and drop them from memory"""
+        with self._lock:
+            record = self._resident.pop(username, None)
+            if record is None:
+                return False
+            return self._spill(username, record)
+
+    def flush(self):
+        """Write every dirty resident player to disk"""
+        with self._lock:
+            for username in list(self._dirty):
+                record = self._resident.get(username)
+                if record is None:
+                    self._dirty.discard(username)
+                    continue
+                try:
+                    self._write(username, record)
+                    self._dirty.discard(username)
+                except Exception as e:
+                    print(f"Error saving player state for {username}: {e}")
+            self._enforce_budget()
+
+    def delete_player(self, username: str) -> bool:
+        """Forget a player entirely, in memory and on disk"""
+        with self._lock:
+            found = self._resident.pop(username, None) is not None
+            self._dirty.discard(username)
+            self._sizes.pop(username, None)
+            self._digests.pop(username, None)
+            if username in self._on_disk:
+                os.remove(self._path(username))
+                self._on_disk.discard(username)
+                found = True
+            return found
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            resident = set(self._resident)
+            return {
+                "resident_players": len(resident),
+                "evicted_players": len(self._on_disk - resident),
+                "known_players": len(self._on_disk | resident),
+                "resident_bytes": self._resident_bytes(),
+                "max_players": self.max_players,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "faults": self.faults,
+                "dirty_players": len(self._dirty)
+            }
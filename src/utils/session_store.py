@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Session Store
+=============
+
+Incremental persistence for session records (combat sessions and similar).
+
+Every active session lives in its own JSON file, so saving after an action
+rewrites only that session no matter how many others exist. Finished
+sessions are appended to a gzip-compressed JSONL archive and their active
+file is removed, which keeps the active set small.
+
+Each archived session is its own gzip member. An id -> member offset index
+is built on the first archive lookup and extended with whatever was
+appended since, so a lookup decompresses one member instead of the whole
+archive and an unknown id costs a stat. Recently archived or loaded
+entries are also kept in a small LRU.
+
+A legacy single-file store (one JSON object keyed by session id) is
+imported once, the first time the session directory is created.
+"""
+
+import gzip
+import json
+import os
+import re
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+ARCHIVE_CACHE_SIZE = 64  # archived entries kept decoded-ready in memory
+_READ_CHUNK = 1 << 16
+
+
+def _iter_members(f, offset: int) -> Iterator[Tuple[int, int, str]]:
+    """(start, end, text) of every complete gzip member from offset, f positioned at offset"""
+    decompressor = zlib.decompressobj(31)
+    pieces = []
+    start = position = offset
+    while True:
+        chunk = f.read(_READ_CHUNK)
+        if not chunk:
+            return
+        while chunk:
+            pieces.append(decompressor.decompress(chunk))
+            if not decompressor.eof:
+                position += len(chunk)
+                break
+            rest = decompressor.unused_data
+            position += len(chunk) - len(rest)
+            yield start, position, b"".join(pieces).decode("utf-8")
+            start, pieces, chunk = position, [], rest
+            decompressor = zlib.decompressobj(31)
+
+
+class SessionStore:
+    """One JSON file per active session plus a compressed archive"""
+
+    def __init__(self, directory: str, archive_file: str, legacy_file: Optional[str] = None,
+                 legacy_filter: Optional[Callable[[Dict[str, Any]], bool]] = None):
+        self.directory = directory
+        self.archive_file = archive_file
+        self._archive_index: Dict[str, int] = {}  # session id -> offset of its latest member
+        self._indexed_size = 0
+        self._recent: "OrderedDict[str, str]" = OrderedDict()  # session id -> archive line
+
+        first_run = not os.path.isdir(directory)
+        os.makedirs(directory, exist_ok=True)
+        if first_run and legacy_file and os.path.exists(legacy_file):
+            self._import_legacy(legacy_file, legacy_filter)
+
+    def _path(self, session_id: str) -> str:
+        if not _SAFE_ID.match(session_id) or session_id.startswith("."):
+            raise ValueError(f"Invalid session id: {session_id}")
+        return os.path.join(self.directory, f"{session_id}.json")
+
+    def _import_legacy(self, legacy_file: str, legacy_filter: Optional[Callable[[Dict[str, Any]], bool]]):
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except Exception as e:
+            print(f"Error importing legacy sessions from {legacy_file}: {e}")
+            return
+
+        for session_id, record in records.items():
+            if isinstance(record, dict) and (legacy_filter is None or legacy_filter(record)):
+                self.save(session_id, record)
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Load every active session"""
+        records = {}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json"):
+                continue
+            session_id = filename[:-len(".json")]
+            try:
+                with open(os.path.join(self.directory, filename), 'r', encoding='utf-8') as f:
+                    records[session_id] = json.load(f)
+            except Exception as e:
+                print(f"Error loading session {session_id}: {e}")
+        return records
+
+    def save(self, session_id: str, record: Dict[str, Any]):
+        """Write one session; the file is replaced atomically"""
+        path = self._path(session_id)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def delete(self, session_id: str) -> bool:
+        """Remove an active session file"""
+        try:
+            os.remove(self._path(session_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def archive(self, session_id: str, record: Dict[str, Any]):
+        """Append a finished session to the archive and drop its active file"""
+        entry = {"id": session_id, "archived_at": datetime.now().isoformat(), "record": record}
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        offset = os.path.getsize(self.archive_file) if os.path.exists(self.archive_file) else 0
+        with gzip.open(self.archive_file, 'at', encoding='utf-8') as f:
+            f.write(line + "\n")
+        if offset == self._indexed_size:
+            # Nothing unindexed before this member, so the index stays complete
+            self._archive_index[session_id] = offset
+            self._indexed_size = os.path.getsize(self.archive_file)
+        self._remember(session_id, line)
+        self.delete(session_id)
+
+    def _remember(self, session_id: str, line: str):
+        self._recent[session_id] = line
+        self._recent.move_to_end(session_id)
+        while len(self._recent) > ARCHIVE_CACHE_SIZE:
+            self._recent.popitem(last=False)
+
+    def _index_archive(self):
+        """Index the members appended to the archive since the last call"""
+        try:
+            size = os.path.getsize(self.archive_file)
+        except OSError:
+            size = 0
+        if size < self._indexed_size:
+            # Archive replaced or truncated: start over
+            self._archive_index = {}
+            self._indexed_size = 0
+            self._recent.clear()
+        if size == self._indexed_size:
+            return
+
+        with open(self.archive_file, 'rb') as f:
+            f.seek(self._indexed_size)
+            for start, end, text in _iter_members(f, self._indexed_size):
+                for line in text.splitlines():
+                    if line.strip():
+                        self._archive_index[json.loads(line)["id"]] = start
+                # Stop at the last complete member; a half-written one is retried next time
+                self._indexed_size = end
+
+    def iter_archive(self) -> Iterator[Dict[str, Any]]:
+        """Archived entries ({id, archived_at, record}), oldest first"""
+        if not os.path.exists(self.archive_file):
+            return
+        with gzip.open(self.archive_file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def load_archived(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Latest archived record of a session"""
+        line = self._recent.get(session_id)
+        if line is None:
+            self._index_archive()
+            offset = self._archive_index.get(session_id)
+            if offset is None:
+                return None
+            with open(self.archive_file, 'rb') as f:
+                f.seek(offset)
+                _, _, text = next(_iter_members(f, offset))
+            for candidate in text.splitlines():
+                if candidate.strip() and json.loads(candidate)["id"] == session_id:
+                    line = candidate
+            if line is None:
+                return None
+        self._remember(session_id, line)
+        return json.loads(line)["record"]
@@ -408,61 +408,78 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
             logger.error(f"Error getting character skills: {e}")
             return jsonify({'error': 'Failed to get character skills'}), 500
 
+    def is_xp_amount(value) -> bool:
+        """XP amounts from clients must be non-negative integers (not bools or strings)"""
+        return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+    
     @app.route('/api/characters/<character_id>/gain_xp', methods=['POST'])
     def gain_character_xp(character_id):
         """Gain XP and check for level up"""
         try:
-            data = request.get_json()
+            data = request.get_json(silent=True) or {}
             xp_gain = data.get('xp_gain', 0)
+            if not is_xp_amount(xp_gain):
+                return jsonify({'error': 'xp_gain must be a non-negative integer'}), 400
             
             from characters.character_system import CharacterSystem
+            from core.level_system import LevelSystem
             char_system = CharacterSystem()
-            character = char_system.get_character(character_id)
-            if character:
-                current_xp = character.get('xp', 0)
-                current_level = character.get('level', 1)
-                
-                new_xp = current_xp + xp_gain
-                
-                # Check for level up
-                with open('data/level_requirements.json', 'r', encoding='utf-8') as f:
-                    level_data = json.load(f)
-                
-                level_progression = level_data['level_progression']
-                new_level = current_level
-                
-                for level, requirements in level_progression.items():
-                    level_num = int(level)
-                    if new_xp >= requirements['xp_required'] and level_num > current_level:
-                        new_level = level_num
-                
-                # Update character
-                character['xp'] = new_xp
-                character['level'] = new_level
-                
-                if new_level > current_level:
-                    # Level up bonuses
-                    level_bonuses = level_progression[str(new_level)]
-                    character['hp'] = character.get('hp', 0) + level_bonuses['hp_bonus']
-                    character['attack'] = character.get('attack', 0) + level_bonuses['attack_bonus']
-                    character['defense'] = character.get('defense', 0) + level_bonuses['defense_bonus']
-                    character['special'] = character.get('special', 0) + level_bonuses['special_bonus']
-                    character['skill_points'] = character.get('skill_points', 0) + level_bonuses['skill_points']
-                
-                char_system.save_characters()
-                
+            result = char_system.award_experience({character_id: xp_gain}, LevelSystem())
+            if character_id in result['results']:
+                character = result['results'][character_id]['character_data']
                 return jsonify({
                     'xp_gained': xp_gain,
-                    'new_xp': new_xp,
-                    'level_up': new_level > current_level,
-                    'new_level': new_level,
-                    'skill_points': character.get('skill_points', 0)
+                    'new_xp': character['experience'],
+                    'level_up': result['results'][character_id]['level_up'],
+                    'new_level': character['level'],
+                    'skill_points': character['skill_points']
                 })
             return jsonify({'error': 'Character not found'}), 404
         except Exception as e:
             logger.error(f"Error gaining XP: {e}")
             return jsonify({'error': 'Failed to gain XP'}), 500
 
+    @app.route('/api/characters/gain_xp', methods=['POST'])
+    def gain_party_xp():
+        """Award XP to several characters at once (e.g. a party's quest reward)"""
+        try:
+            data = request.get_json(silent=True) or {}
+            # Either {"awards": {character_id: xp}} or {"character_ids": [...], "xp_gain": xp}
+            awards = data.get('awards') or data.get('xp_gain', 0)
+            character_ids = data.get('character_ids')
+            if isinstance(awards, dict):
+                if not all(isinstance(character_id, str) and is_xp_amount(xp) for character_id, xp in awards.items()):
+                    return jsonify({'error': 'awards must map character ids to non-negative integers'}), 400
+            elif not is_xp_amount(awards):
+                return jsonify({'error': 'xp_gain must be a non-negative integer'}), 400
+            elif not isinstance(character_ids, list) or not all(isinstance(character_id, str)
+                                                                 for character_id in character_ids):
+                return jsonify({'error': 'character_ids must be a list of character ids'}), 400
+            
+            from characters.character_system import CharacterSystem
+            from core.level_system import LevelSystem
+            char_system = CharacterSystem()
+            result = char_system.award_experience(awards, LevelSystem(), character_ids)
+            
+            return jsonify({
+                'characters': {
+                    character_id: {
+                        'xp_gained': character_result['xp_gained'],
+                        'new_xp': character_result['character_data']['experience'],
+                        'level_up': character_result['level_up'],
+                        'new_level': character_result['character_data']['level'],
+                        'skill_points': character_result['character_data']['skill_points']
+                    }
+                    for character_id, character_result in result['results'].items()
+                },
+                'missing': result['missing'],
+                'level_ups': result['level_ups'],
+                'xp_awarded': result['xp_awarded']
+            }), (200 if result['results'] else 404)
+        except Exception as e:
+            logger.error(f"Error gaining party XP: {e}")
+            return jsonify({'error': 'Failed to gain XP'}), 500
+
     @app.route('/api/characters/<character_id>/unlock_skill', methods=['POST'])
     def unlock_character_skill(character_id):
         """Unlock a skill using skill points"""
@@ -779,6 +796,15 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
     app.socketio.on('chat_message', handle_chat_message)
     
     # Save/Load System Routes
+    save_systems = {}
+    
+    def get_save_system():
+        """Save system shared by the save routes, so auto-saves keep their delta base between requests"""
+        if "shared" not in save_systems:
+            from core.save_system import SaveSystem
+            save_systems["shared"] = SaveSystem()
+        return save_systems["shared"]
+    
     @app.route('/api/save/game', methods=['POST'])
     def save_game():
         """Save game state"""
@@ -790,8 +816,7 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
             if not character_id:
                 return jsonify({"error": "Missing character_id"}), 400
             
-            from core.save_system import SaveSystem
-            save_system = SaveSystem()
+            save_system = get_save_system()
             
             result = save_system.save_game(
                 character_id=character_id,
@@ -815,8 +840,7 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
             if not save_id:
                 return jsonify({"error": "Missing save_id"}), 400
             
-            from core.save_system import SaveSystem
-            save_system = SaveSystem()
+            save_system = get_save_system()
             
             result = save_system.load_game(
                 save_id=save_id,
@@ -835,11 +859,16 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
         """Get list of save files"""
         try:
             character_id = request.args.get('character_id')
+            username = request.args.get('username')
+            limit = request.args.get('limit', type=int)
+            offset = request.args.get('offset', 0, type=int)
             
-            from core.save_system import SaveSystem
-            save_system = SaveSystem()
+            save_system = get_save_system()
+            
+            if request.args.get('rebuild') == 'true':
+                save_system.rebuild_index()
             
-            save_files = save_system.get_save_files(character_id)
+            save_files = save_system.get_save_files(character_id, username=username, limit=limit, offset=offset)
             
             return jsonify(save_files), 200
             
@@ -857,8 +886,7 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
             if not save_id:
                 return jsonify({"error": "Missing save_id"}), 400
             
-            from core.save_system import SaveSystem
-            save_system = SaveSystem()
+            save_system = get_save_system()
             
             result = save_system.delete_save(save_id)
             
@@ -878,8 +906,7 @@ def register_routes(app, game_engine, campaign_manager, ai_dm):
             if not character_id:
                 return jsonify({"error": "Missing character_id"}), 400
             
-            from core.save_system import SaveSystem
-            save_system = SaveSystem()
+            save_system = get_save_system()
             
             result = save_system.auto_save(
                 character_id=character_id,
@@ -2,17 +2,34 @@
 """
 AI Dungeon Master - Streaming Manager
 Handles live game broadcasting and viewer interactions
+
+Chat and game events are queued per stream and sent to viewers as one
+coalesced 'stream_update' frame per tick. The app attaches its Socket.IO
+server once (streaming_manager.attach(socketio) in app.py); the tick loop
+then starts as a background task when the first stream goes live and stops
+when the last one ends. Without an attached server, call
+flush_broadcasts(emit) yourself.
+
+Frames go to a Socket.IO room named after the stream: join_stream and
+leave_stream take the viewer's socket sid and move it in and out of that
+room (app.py's 'join_stream' / 'leave_stream' handlers pass request.sid).
 """
 
-import asyncio
-import json
-import time
+import itertools
+import uuid
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass
-from flask_socketio import emit, join_room, leave_room
+from typing import Callable, Deque, Dict, List, Optional, Set
+from dataclasses import dataclass, field
 import threading
 
+MAX_CHAT_MESSAGES = 100
+MAX_GAME_EVENTS = 50
+# Per-frame caps; under heavier bursts the oldest unsent items are dropped
+MAX_FRAME_CHAT = 500
+MAX_FRAME_EVENTS = 200
+BROADCAST_INTERVAL = 0.25  # seconds between coalesced fan-out frames
+
 @dataclass
 class StreamSession:
     """Represents a live streaming session"""
@@ -22,12 +39,15 @@ class StreamSession:
     title: str
     description: str
     game_scenario: str
-    viewers: List[str]
+    viewers: Set[str]
     is_live: bool
     started_at: datetime
-    chat_messages: List[Dict]
-    game_events: List[Dict]
+    chat_messages: Deque[Dict]
+    game_events: Deque[Dict]
     max_viewers: int = 100
+    # Traffic not yet sent to viewers, flushed once per broadcast tick
+    pending_chat: Deque[Dict] = field(default_factory=lambda: deque(maxlen=MAX_FRAME_CHAT))
+    pending_events: Deque[Dict] = field(default_factory=lambda: deque(maxlen=MAX_FRAME_EVENTS))
 
 class StreamingManager:
     """Manages live streaming sessions and viewer interactions"""
@@ -35,12 +55,43 @@ class StreamingManager:
     def __init__(self):
         self.active_streams: Dict[str, StreamSession] = {}
         self.viewer_sessions: Dict[str, str] = {}  # viewer_id -> stream_id
+        self.viewer_sids: Dict[str, str] = {}  # viewer_id -> Socket.IO sid in the stream's room
+        self._sid_viewers: Dict[str, str] = {}  # sid -> viewer_id
         self.stream_history: List[StreamSession] = []
+        # Process-unique token, so ids never repeat across workers or restarts
+        self._token = uuid.uuid4().hex[:12]
+        self._ids = itertools.count(1)
+        self._dirty_streams: Set[str] = set()
+        self._lock = threading.Lock()
+        self._broadcasting = False
+        self._loop_generation = 0
+        self._socketio = None
+        self._interval = BROADCAST_INTERVAL
+    
+    def attach(self, socketio, interval: float = BROADCAST_INTERVAL):
+        """Use socketio for fan-out; the broadcast loop starts with the first live stream"""
+        self._socketio = socketio
+        self._interval = interval
+        if self.active_streams:
+            self.start_broadcasting(socketio, interval)
+    
+    def _next_id(self, prefix: str) -> str:
+        """Unique id; the counter part increases monotonically within a process"""
+        return f"{prefix}_{self._token}_{next(self._ids)}"
+    
+    def _enter_room(self, sid: str, stream_id: str):
+        if self._socketio is not None:
+            self._socketio.server.enter_room(sid, stream_id, namespace="/")
+    
+    def _leave_room(self, sid: str, stream_id: str):
+        if self._socketio is not None:
+            self._socketio.server.leave_room(sid, stream_id, namespace="/")
         
     def create_stream(self, broadcaster_id: str, broadcaster_name: str, 
-                     title: str, description: str, game_scenario: str) -> str:
+                     title: str, description: str, game_scenario: str,
+                     max_viewers: int = 100) -> str:
         """Create a new streaming session"""
-        stream_id = f"stream_{int(time.time())}_{broadcaster_id}"
+        stream_id = f"{self._next_id('stream')}_{broadcaster_id}"
         
         stream = StreamSession(
             stream_id=stream_id,
@@ -49,14 +100,17 @@ class StreamingManager:
             title=title,
             description=description,
             game_scenario=game_scenario,
-            viewers=[],
+            viewers=set(),
             is_live=True,
             started_at=datetime.now(),
-            chat_messages=[],
-            game_events=[]
+            chat_messages=deque(maxlen=MAX_CHAT_MESSAGES),
+            game_events=deque(maxlen=MAX_GAME_EVENTS),
+            max_viewers=max_viewers
         )
         
         self.active_streams[stream_id] = stream
+        if self._socketio is not None and not self._broadcasting:
+            self.start_broadcasting(self._socketio, self._interval)
         return stream_id
     
     def end_stream(self, stream_id: str) -> bool:
@@ -66,22 +120,35 @@ class StreamingManager:
             stream.is_live = False
             self.stream_history.append(stream)
             del self.active_streams[stream_id]
+            with self._lock:
+                self._dirty_streams.discard(stream_id)
             
             # Remove all viewers
             for viewer_id in stream.viewers:
                 if viewer_id in self.viewer_sessions:
                     del self.viewer_sessions[viewer_id]
+                self._sid_viewers.pop(self.viewer_sids.pop(viewer_id, None), None)
+            if self._socketio is not None:
+                self._socketio.server.close_room(stream_id, namespace="/")
             
+            if not self.active_streams:
+                self.stop_broadcasting()
             return True
         return False
     
-    def join_stream(self, stream_id: str, viewer_id: str, viewer_name: str) -> bool:
-        """Add a viewer to a stream"""
+    def join_stream(self, stream_id: str, viewer_id: str, viewer_name: str, sid: Optional[str] = None) -> bool:
+        """Add a viewer to a stream; sid is the socket that should receive its frames"""
         if stream_id in self.active_streams:
             stream = self.active_streams[stream_id]
             if len(stream.viewers) < stream.max_viewers and viewer_id not in stream.viewers:
-                stream.viewers.append(viewer_id)
+                # Watching one stream at a time
+                self.leave_stream(viewer_id)
+                stream.viewers.add(viewer_id)
                 self.viewer_sessions[viewer_id] = stream_id
+                if sid is not None:
+                    self.viewer_sids[viewer_id] = sid
+                    self._sid_viewers[sid] = viewer_id
+                    self._enter_room(sid, stream_id)
                 return True
         return False
     
@@ -91,29 +158,38 @@ class StreamingManager:
             stream_id = self.viewer_sessions[viewer_id]
             if stream_id in self.active_streams:
                 stream = self.active_streams[stream_id]
-                if viewer_id in stream.viewers:
-                    stream.viewers.remove(viewer_id)
+                stream.viewers.discard(viewer_id)
             del self.viewer_sessions[viewer_id]
+            sid = self.viewer_sids.pop(viewer_id, None)
+            if sid is not None:
+                self._sid_viewers.pop(sid, None)
+                self._leave_room(sid, stream_id)
             return True
         return False
     
+    def disconnect(self, sid: str) -> bool:
+        """Remove whichever viewer was watching through a closed socket"""
+        viewer_id = self._sid_viewers.get(sid)
+        return viewer_id is not None and self.leave_stream(viewer_id)
+    
     def add_chat_message(self, stream_id: str, viewer_id: str, 
                         viewer_name: str, message: str) -> bool:
         """Add a chat message to a stream"""
         if stream_id in self.active_streams:
             stream = self.active_streams[stream_id]
             chat_msg = {
-                "id": f"msg_{int(time.time())}_{viewer_id}",
+                "id": self._next_id("msg"),
                 "viewer_id": viewer_id,
                 "viewer_name": viewer_name,
                 "message": message,
                 "timestamp": datetime.now().isoformat()
             }
-            stream.chat_messages.append(chat_msg)
             
-            # Keep only last 100 messages
-            if len(stream.chat_messages) > 100:
-                stream.chat_messages = stream.chat_messages[-100:]
+            # Ring buffers keep only the last MAX_CHAT_MESSAGES messages
+            with self._lock:
+                stream.chat_messages.append(chat_msg)
+                stream.pending_chat.append(chat_msg)
+                self._dirty_streams.add(stream_id)
             
             return True
         return False
@@ -124,16 +200,17 @@ class StreamingManager:
         if stream_id in self.active_streams:
             stream = self.active_streams[stream_id]
             game_event = {
-                "id": f"event_{int(time.time())}",
+                "id": self._next_id("event"),
                 "type": event_type,
                 "data": event_data,
                 "timestamp": datetime.now().isoformat()
             }
-            stream.game_events.append(game_event)
             
-            # Keep only last 50 events
-            if len(stream.game_events) > 50:
-                stream.game_events = stream.game_events[-50:]
+            # Ring buffers keep only the last MAX_GAME_EVENTS events
+            with self._lock:
+                stream.game_events.append(game_event)
+                stream.pending_events.append(game_event)
+                self._dirty_streams.add(stream_id)
             
             return True
         return False
@@ -173,14 +250,63 @@ class StreamingManager:
     def get_stream_chat(self, stream_id: str) -> List[Dict]:
         """Get chat messages for a stream"""
         if stream_id in self.active_streams:
-            return self.active_streams[stream_id].chat_messages
+            return list(self.active_streams[stream_id].chat_messages)
         return []
     
     def get_stream_events(self, stream_id: str) -> List[Dict]:
         """Get game events for a stream"""
         if stream_id in self.active_streams:
-            return self.active_streams[stream_id].game_events
+            return list(self.active_streams[stream_id].game_events)
         return []
+    
+    def flush_broadcasts(self, emit: Callable[..., None]) -> int:
+        """
+        Send one coalesced frame per stream with new chat or events.
+        
+        emit is called as emit('stream_update', frame, room=stream_id), e.g.
+        socketio.emit. Only streams that received traffic since the last
+        flush are visited. Returns the number of frames sent.
+        """
+        with self._lock:
+            dirty = self._dirty_streams
+            self._dirty_streams = set()
+            frames = []
+            for stream_id in dirty:
+                stream = self.active_streams.get(stream_id)
+                if not stream:
+                    continue
+                frames.append((stream_id, {
+                    "stream_id": stream_id,
+                    "chat": list(stream.pending_chat),
+                    "events": list(stream.pending_events),
+                    "viewer_count": len(stream.viewers)
+                }))
+                stream.pending_chat.clear()
+                stream.pending_events.clear()
+        
+        for stream_id, frame in frames:
+            emit('stream_update', frame, room=stream_id)
+        return len(frames)
+    
+    def start_broadcasting(self, socketio, interval: float = BROADCAST_INTERVAL):
+        """Run the tick-based fan-out loop as a Socket.IO background task"""
+        if self._broadcasting:
+            return
+        self._broadcasting = True
+        # A loop stopped and restarted within one tick must not keep running next to the new one
+        self._loop_generation += 1
+        generation = self._loop_generation
+        
+        def broadcast_loop():
+            while self._broadcasting and generation == self._loop_generation:
+                self.flush_broadcasts(socketio.emit)
+                socketio.sleep(interval)
+        
+        socketio.start_background_task(broadcast_loop)
+    
+    def stop_broadcasting(self):
+        """Stop the fan-out loop after its current tick"""
+        self._broadcasting = False
 
 # Global streaming manager instance
 streaming_manager = StreamingManager()
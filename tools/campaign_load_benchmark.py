@@ -0,0 +1,64 @@
+"""
+Campaign loading benchmark.
+
+Measures, each in a fresh interpreter, the time and peak RSS growth of
+importing the campaign manager and creating one:
+
+- lazy: CampaignManager() + list_campaigns() (manifest only)
+- all campaigns: the same, then get_campaign() for every campaign
+- legacy (optional): the campaign_manager.py of an older git revision,
+  which built every campaign from an inline Python literal
+
+Usage:
+    python tools/campaign_load_benchmark.py [legacy_git_revision]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SNIPPET = r"""
+import resource, sys, time
+sys.path.insert(0, {path!r})
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+from {module} import CampaignManager
+manager = CampaignManager()
+campaigns = manager.list_campaigns()
+if {load_all}:
+    for campaign in campaigns:
+        manager.get_campaign(campaign["id"])
+elapsed = time.perf_counter() - started
+print(len(campaigns), elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base)
+"""
+
+
+def measure(label: str, path: str, module: str, load_all: bool = False, runs: int = 5):
+    times, rss = [], []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", SNIPPET.format(path=path, module=module, load_all=load_all)],
+                                capture_output=True, text=True, check=True, cwd=ROOT).stdout.split()
+        count, elapsed, grown = int(output[0]), float(output[1]), int(output[2])
+        times.append(elapsed)
+        rss.append(grown)
+    print(f"  {label:<16} {count} campaigns  {min(times) * 1e3:7.1f} ms  +{min(rss) / 1024:6.1f} MiB RSS")
+
+
+def main():
+    measure("lazy", ROOT, "src.core.campaign_manager")
+    measure("all campaigns", ROOT, "src.core.campaign_manager", load_all=True)
+
+    if len(sys.argv) > 1:
+        source = subprocess.run(["git", "show", f"{sys.argv[1]}:src/core/campaign_manager.py"],
+                                capture_output=True, text=True, check=True, cwd=ROOT).stdout
+        with tempfile.TemporaryDirectory() as workdir:
+            with open(os.path.join(workdir, "legacy_campaign_manager.py"), "w", encoding="utf-8") as f:
+                f.write(source)
+            measure("legacy literal", workdir, "legacy_campaign_manager")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Intent classifier regression check.
+
+Classifies a few texts that were mislabelled in the past and compares the
+result with what the game expects. Prints every mismatch and exits with
+status 1 if there was one.
+
+Usage:
+    python tools/check_intent_classifier.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.intent_classifier import classify_intent  # noqa: E402
+from src.core.npc_system import NPCRelationshipSystem  # noqa: E402
+
+# Action text -> moral alignment from NPCRelationshipSystem._get_action_morality
+MORALITY = {
+    "kill the guard": "bad",
+    "attack the guard": "bad",
+    "steal from the guards": "bad",
+    "talk to the guard": "neutral",
+    "help the guard": "good",
+    "protect the village": "good",
+    "tend to the wounded": "good",
+    "help the merchant, then rob him": "bad",
+}
+
+# Text -> labels that must not be found in it
+ABSENT = {
+    "guard_001": ["protect"],
+    "tendril": ["heal"],
+    "a tendril of smoke": ["heal"],
+    "vurgun": ["combat"],
+    "büyük bir vurgun yaptı": ["combat"],
+}
+
+# Text -> labels that must be found in it
+PRESENT = {
+    "guarding the gate": ["protect"],
+    "ejderhaya vurdu": ["combat"],
+    "tending the fire": ["heal"],
+}
+
+
+def main() -> int:
+    failures = []
+    system = NPCRelationshipSystem()
+    for action, expected in MORALITY.items():
+        found = system._get_action_morality(action)
+        if found != expected:
+            failures.append(f"morality of {action!r}: {found}, expected {expected}")
+    for text, labels in ABSENT.items():
+        intents = classify_intent(text)
+        failures += [f"{text!r} classified as {label}" for label in labels if label in intents]
+    for text, labels in PRESENT.items():
+        intents = classify_intent(text)
+        failures += [f"{text!r} not classified as {label}" for label in labels if label not in intents]
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(MORALITY) + len(ABSENT) + len(PRESENT) - len(failures)} ok, {len(failures)} failed")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
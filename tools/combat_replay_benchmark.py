@@ -0,0 +1,104 @@
+"""
+Combat replay benchmark and regression check.
+
+Records fights through CombatSystem (random but seeded player/enemy choices)
+in a scratch directory, then replays every fight from its event log:
+- the final replayed state must equal the live state
+- every recorded die must be rolled again (ReplayMismatch otherwise)
+- reconstructing a mid-fight state must read only a snapshot plus a short tail
+
+Pass a directory of existing logs to replay that corpus instead.
+
+Usage:
+    python tools/combat_replay_benchmark.py [fights]
+    python tools/combat_replay_benchmark.py --corpus data/combat_logs
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.combat.combat_system import CombatSystem  # noqa: E402
+from src.combat.combat_log import CombatEventLog  # noqa: E402
+
+ACTIONS = ["attack"] * 6 + ["defend", "spell", "item", "flee"]
+
+
+def record_fights(system: CombatSystem, fights: int, rng: random.Random) -> dict:
+    final_states = {}
+    for _ in range(fights):
+        enemies = [{"name": f"Goblin {i}", "health": rng.randint(20, 60), "armor_class": rng.randint(10, 15),
+                    "damage_die": rng.choice(["1d6", "1d8+1", "2d4"])} for i in range(rng.randint(1, 3))]
+        started = system.start_combat(
+            {"name": "Kahraman", "health": 200, "max_health": 200, "armor_class": 14, "damage_die": "1d10+2"},
+            enemies)
+        session_id = started["session_id"]
+
+        while session_id in system.combat_sessions:
+            session = system.combat_sessions[session_id]
+            actor = session.entities[session.turn_order[session.current_turn]]
+            opponents = [e.id for e in session.entities.values() if e.is_alive and e.is_player != actor.is_player]
+            action = rng.choice(ACTIONS) if actor.is_player else "attack"
+            system.perform_action(session_id, action, target_id=rng.choice(opponents) if opponents else None,
+                                  item_name="Health Potion", spell_name=rng.choice(["Fireball", "Heal"]))
+            final_states[session_id] = asdict(session)
+            if session.round > 200:
+                break
+    return final_states
+
+
+def replay_corpus(system: CombatSystem, session_ids) -> tuple:
+    events = 0
+    started = time.perf_counter()
+    replayed = {}
+    for session_id in session_ids:
+        session = system.replay_combat(session_id, from_start=True)
+        replayed[session_id] = session
+        events += session.event_seq
+    return replayed, events, time.perf_counter() - started
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--corpus":
+        corpus = os.path.abspath(sys.argv[2])
+        os.chdir(tempfile.mkdtemp())
+        system = CombatSystem()
+        system.event_log = CombatEventLog(corpus)
+        session_ids = [name[:-len(".jsonl")] for name in os.listdir(corpus) if name.endswith(".jsonl")]
+        _, events, elapsed = replay_corpus(system, session_ids)
+        print(f"replayed {len(session_ids)} fights / {events} actions in {elapsed:.3f}s, all rolls matched")
+        return
+
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    os.chdir(tempfile.mkdtemp())
+    system = CombatSystem()
+
+    started = time.perf_counter()
+    final_states = record_fights(system, fights, random.Random(7))
+    record_time = time.perf_counter() - started
+
+    replayed, events, replay_time = replay_corpus(system, final_states)
+    for session_id, state in final_states.items():
+        assert asdict(replayed[session_id]) == state, f"replay diverged for {session_id}"
+
+    # Mid-fight reconstruction: snapshot + tail only
+    longest = max(replayed.values(), key=lambda session: session.event_seq)
+    middle = longest.event_seq // 2 + 1
+    started = time.perf_counter()
+    for _ in range(100):
+        system.replay_combat(longest.id, upto_seq=middle)
+    point_time = (time.perf_counter() - started) / 100
+
+    print(f"recorded {fights} fights / {events} actions in {record_time:.2f}s")
+    print(f"full replay   : {replay_time:.3f}s ({events / replay_time:,.0f} actions/s), final states identical")
+    print(f"state at seq {middle} of {longest.event_seq}: {point_time * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
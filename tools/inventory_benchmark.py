@@ -0,0 +1,107 @@
+"""
+Inventory benchmark.
+
+Fills one player's inventory with 1,000 items (plus a few hundred other
+players) and times the hot operations: stacking, removing, equipment
+stats and contextual actions. The legacy column replays what the system
+did before: a linear scan of the item list for stacks, a get_item per
+entry and a full dump of every inventory on each change.
+
+Usage:
+    python tools/inventory_benchmark.py [items] [other_players]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.inventory_system import InventorySystem, ItemType  # noqa: E402
+
+TYPES = [ItemType.CONSUMABLE.value, ItemType.MATERIAL.value, ItemType.TOOL.value, ItemType.MAGIC.value,
+         ItemType.QUEST.value]
+
+
+def make_items(count: int):
+    items = {}
+    for i in range(count):
+        item_type = TYPES[i % len(TYPES)]
+        items[f"item_{i:04d}"] = {"id": f"item_{i:04d}", "name": f"Eşya {i}", "type": item_type, "slot": None,
+                                  "effects": ["heal"] if item_type == ItemType.CONSUMABLE.value else [],
+                                  "stats": {}, "stackable": i % 2 == 0, "max_stack": 10}
+    return items
+
+
+def legacy_find_stack(inventory, items, item_id):
+    for item in inventory["items"]:
+        if item["item_id"] == item_id and item.get("quantity", 1) < items[item_id].get("max_stack", 1):
+            return item
+    return None
+
+
+def legacy_contextual(system, inventory):
+    return [item for item in inventory["items"]
+            if (system.get_item(item["item_id"]) or {}).get("type") == ItemType.CONSUMABLE.value]
+
+
+def timed(label: str, repeats: int, call, legacy=None):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    elapsed = (time.perf_counter() - started) / repeats
+    line = f"  {label:<28} {elapsed * 1e6:10.1f} us"
+    if legacy is not None:
+        started = time.perf_counter()
+        for _ in range(repeats):
+            legacy()
+        line += f"   legacy {(time.perf_counter() - started) / repeats * 1e6:10.1f} us"
+    print(line)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    others = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    rng = random.Random(5)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        system = InventorySystem()
+        system.items.update(make_items(count))
+        item_ids = [item_id for item_id in system.items if item_id.startswith("item_")]
+
+        for item_id in item_ids:
+            system.add_item("hero", item_id, 1)
+        for p in range(others):
+            for item_id in rng.sample(item_ids, 20):
+                system.add_item(f"player_{p:04d}", item_id, 1)
+        inventory = system.get_player_inventory("hero")
+        print(f"{len(inventory['items'])} items for one player, {others} other players")
+
+        # In-memory cost first; saving is timed on its own below
+        save = system._save_inventories
+        system._save_inventories = lambda: None
+        stackable = [item_id for item_id in item_ids if system.items[item_id]["stackable"]]
+        timed("add_item (stack)", 200, lambda: system.add_item("hero", rng.choice(stackable), 1),
+              lambda: legacy_find_stack(inventory, system.items, rng.choice(stackable)))
+        timed("remove_item + add_item", 200, lambda: (system.remove_item("hero", "item_0001", 1),
+                                                      system.add_item("hero", "item_0001", 1)))
+        system.add_item("hero", "steel_sword")
+        system.equip_item("hero", "steel_sword")
+        timed("get_equipment_stats", 2000, lambda: system.get_equipment_stats("hero"))
+        timed("contextual actions (combat)", 200,
+              lambda: system.get_contextual_actions("hero", "fantasy", {"situation": "combat"}),
+              lambda: legacy_contextual(system, inventory))
+        system._save_inventories = save
+        timed("save after a change", 50, lambda: system._changed("hero", inventory),
+              lambda: json.dumps(system.inventories, indent=2, ensure_ascii=False))
+        print("  (legacy save column is the json.dumps of every inventory alone, without the file write)")
+        os.chdir(ROOT)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Multiplayer index load test.
+
+Fills a WebSocketHandler with thousands of rooms and measures room lookup
+and per-room broadcast cost as the number of rooms grows. With the
+connection index both should stay flat; the legacy full scan over every
+connection is timed alongside for comparison.
+
+Usage: python tools/multiplayer_load_test.py [players_per_room]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.multiplayer.websocket_handler import WebSocketHandler  # noqa: E402
+
+ROOM_COUNTS = [100, 1000, 5000, 10000]
+SAMPLES = 2000
+
+
+class CountingSocket:
+    """Stand-in websocket that only counts sent frames."""
+
+    def __init__(self):
+        self.sent = 0
+
+    async def send(self, payload: str):
+        self.sent += 1
+
+
+class AcceptAllSessions:
+    """Session manager stub: every join succeeds."""
+
+    def join_session(self, session_id, player_id, username, connection_id=None):
+        return {"success": True, "session": {"id": session_id}}
+
+    def leave_session(self, player_id):
+        return {"success": True}
+
+
+def build_handler(room_count: int, players_per_room: int) -> WebSocketHandler:
+    handler = WebSocketHandler(AcceptAllSessions(), game_engine=None)
+    for room in range(room_count):
+        session_id = f"room_{room}"
+        for seat in range(players_per_room):
+            connection_id = f"conn_{room}_{seat}"
+            player_id = f"player_{room}_{seat}"
+            handler.connections[connection_id] = {
+                "websocket": CountingSocket(),
+                "player_id": player_id,
+                "session_id": session_id,
+            }
+            handler.connection_index.bind_player(connection_id, player_id)
+            handler.connection_index.join_session(connection_id, session_id)
+    return handler
+
+
+async def legacy_broadcast(handler: WebSocketHandler, players: List[str], message: Dict):
+    """Pre-index broadcast: scan every connection for every player."""
+    for player_id in players:
+        for connection_id, connection in handler.connections.items():
+            if connection.get("player_id") == player_id:
+                await handler._send_message(connection_id, message)
+                break
+
+
+def per_op_us(elapsed: float, ops: int) -> float:
+    return elapsed / ops * 1_000_000
+
+
+async def measure(room_count: int, players_per_room: int) -> Dict[str, float]:
+    handler = build_handler(room_count, players_per_room)
+    index = handler.connection_index
+    message = {"type": "notification", "notification": "load test"}
+    rooms = [f"room_{(i * 7919) % room_count}" for i in range(SAMPLES)]
+
+    start = time.perf_counter()
+    for room in rooms:
+        index.get_session_connections(room)
+    lookup = per_op_us(time.perf_counter() - start, SAMPLES)
+
+    start = time.perf_counter()
+    for room in rooms:
+        await handler._broadcast_to_session(room, message)
+    broadcast = per_op_us(time.perf_counter() - start, SAMPLES)
+
+    legacy_samples = max(1, SAMPLES // max(1, room_count // 100))
+    start = time.perf_counter()
+    for room in rooms[:legacy_samples]:
+        room_number = room.split("_")[1]
+        players = [f"player_{room_number}_{seat}" for seat in range(players_per_room)]
+        await legacy_broadcast(handler, players, message)
+    legacy = per_op_us(time.perf_counter() - start, legacy_samples)
+
+    # Disconnect half of one room and check the indexes follow
+    for seat in range(0, players_per_room, 2):
+        await handler._handle_disconnect(f"conn_0_{seat}")
+    assert len(index.get_session_connections("room_0")) == players_per_room // 2
+    assert index.get_connection("player_0_0") is None
+
+    return {"lookup": lookup, "broadcast": broadcast, "legacy": legacy}
+
+
+def main():
+    players_per_room = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"Players per room: {players_per_room}")
+    print(f"{'rooms':>8} {'lookup us':>12} {'broadcast us':>14} {'legacy scan us':>16}")
+    for room_count in ROOM_COUNTS:
+        result = asyncio.run(measure(room_count, players_per_room))
+        print(f"{room_count:>8} {result['lookup']:>12.2f} {result['broadcast']:>14.2f} {result['legacy']:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
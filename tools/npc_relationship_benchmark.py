@@ -0,0 +1,96 @@
+"""
+NPC relationship matrix benchmark.
+
+Fills a RelationshipMatrix with many players and NPCs and compares its
+memory with the equivalent {player: {npc: {field: value}}} dicts, then
+times point lookups and the bulk queries ("NPCs who trust player X",
+"players NPC Y hates").
+
+Usage:
+    python tools/npc_relationship_benchmark.py [players] [npcs] [met_per_player]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core import npc_relationships  # noqa: E402
+from src.core.npc_relationships import RelationshipMatrix  # noqa: E402
+
+MOODS = ("neutral", "happy", "pleased", "angry", "disappointed", "hostile")
+
+
+def deep_size(value, seen=None) -> int:
+    """Recursive sys.getsizeof for dicts, lists, strings and ints"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in value)
+    return size
+
+
+def fill(players: int, npcs: int, met: int, rng: random.Random):
+    matrix = RelationshipMatrix()
+    npc_ids = [f"npc_{i:04d}" for i in range(npcs)]
+    for npc_id in npc_ids:
+        matrix.add_npc(npc_id, relationship_level=rng.randint(-20, 40))
+
+    dicts = {}
+    for p in range(players):
+        player_id = f"player_{p:06d}"
+        states = dicts.setdefault(player_id, {})
+        for npc_id in rng.sample(npc_ids, met):
+            values = {"relationship_level": rng.randint(-100, 100), "trust_level": rng.randint(0, 100),
+                      "fear_level": rng.randint(0, 100), "respect_level": rng.randint(0, 100),
+                      "current_mood": rng.choice(MOODS)}
+            matrix.update(player_id, npc_id, **values)
+            states[npc_id] = values
+    return matrix, dicts, npc_ids
+
+
+def timed(label: str, repeats: int, call):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    elapsed = (time.perf_counter() - started) / repeats
+    print(f"  {label:<38} {elapsed * 1e6:10.1f} us")
+
+
+def main():
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    npcs = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    met = min(npcs, int(sys.argv[3]) if len(sys.argv) > 3 else 20)
+    rng = random.Random(7)
+
+    started = time.perf_counter()
+    matrix, dicts, npc_ids = fill(players, npcs, met, rng)
+    print(f"{players:,} players x {npcs} NPCs, {met} met each "
+          f"({time.perf_counter() - started:.1f}s to fill), numpy: {npc_relationships.np is not None}")
+
+    matrix_bytes = matrix.memory_bytes()
+    dict_bytes = deep_size(dicts)
+    print(f"  matrix  {matrix_bytes / 2 ** 20:8.2f} MiB  ({matrix_bytes / max(1, players * met):.1f} B per pair)")
+    print(f"  dicts   {dict_bytes / 2 ** 20:8.2f} MiB  ({dict_bytes / max(1, players * met):.1f} B per pair)")
+
+    player_ids = list(dicts)
+    sample = [(rng.choice(player_ids), rng.choice(npc_ids)) for _ in range(1000)]
+    timed("get() x1000", 20, lambda: [matrix.get(player_id, npc_id) for player_id, npc_id in sample])
+    timed("adjust() x1000", 20,
+          lambda: [matrix.adjust(player_id, npc_id, "trust_level", 1) for player_id, npc_id in sample])
+    timed("npcs_where(trust > 50)", 200, lambda: matrix.npcs_where(rng.choice(player_ids), "trust_level", ">", 50))
+    timed("players_where(relationship < -50)", 20,
+          lambda: matrix.players_where(rng.choice(npc_ids), "relationship_level", "<", -50))
+    timed("for_player() (all NPCs)", 50, lambda: matrix.for_player(rng.choice(player_ids)))
+
+
+if __name__ == '__main__':
+    main()
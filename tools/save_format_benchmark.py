@@ -0,0 +1,143 @@
+"""
+Save format benchmark.
+
+Builds a typical late-game character (level 20, full inventory, many
+skills, NPC relationships and finished quests) and compares the old
+pretty-printed JSON save with the binary save format and with delta
+auto-saves: bytes on disk plus save and load latency.
+
+Usage:
+    python tools/save_format_benchmark.py [repeats]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core import save_format  # noqa: E402
+from src.core.save_system import SaveSystem  # noqa: E402
+
+
+class BenchCharacter(dict):
+    """Character record the way SaveSystem reads it (dict plus .name)"""
+
+    @property
+    def name(self):
+        return self["name"]
+
+
+def late_game_character(rng: random.Random) -> BenchCharacter:
+    return BenchCharacter(
+        id="hero", name="Aelric", level=20, xp=355000, hp=212, mana=140, skill_points=3,
+        character_class="paladin",
+        stats={stat: rng.randint(12, 20) for stat in
+               ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")},
+        inventory=[f"item_{i}_{rng.choice(['sword', 'potion', 'scroll', 'gem', 'armor'])}" for i in range(250)],
+        skills={f"skill_{i}": {"rank": rng.randint(1, 5), "unlocked_at": 2 + i % 18} for i in range(80)},
+        equipment={slot: f"legendary_{slot}" for slot in ("weapon", "armor", "shield", "helm", "boots", "ring")},
+        journal=[{"day": day, "entry": f"Gün {day}: zindanın {rng.randint(1, 9)}. katı temizlendi"}
+                 for day in range(300)]
+    )
+
+
+class BenchEngine:
+    combat_systems = {}
+
+    def __init__(self, character: BenchCharacter, rng: random.Random):
+        self.character = character
+        self.relationships = {f"npc_{i}": {"trust": rng.randint(-100, 100), "met": True,
+                                           "history": [f"event_{j}" for j in range(10)]} for i in range(120)}
+
+    def get_character(self, character_id):
+        return self.character
+
+    def active_sessions(self):
+        return []
+
+    def get_all_npc_relationships(self, character_id):
+        return self.relationships
+
+
+def play_a_little(character: BenchCharacter, engine: BenchEngine, rng: random.Random):
+    """Changes typical between two auto-saves"""
+    character["xp"] += rng.randint(50, 400)
+    character["hp"] = rng.randint(100, 212)
+    character["inventory"].append(f"loot_{rng.randint(0, 10 ** 6)}")
+    npc = engine.relationships[f"npc_{rng.randint(0, 119)}"]
+    npc["trust"] = min(100, npc["trust"] + 1)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rng = random.Random(3)
+    os.chdir(tempfile.mkdtemp())
+    character = late_game_character(rng)
+    engine = BenchEngine(character, rng)
+    system = SaveSystem("saves")
+
+    record = system._build_save_record("bench", character, "hero", engine, None, None)
+    legacy_path = os.path.join("saves", "legacy.json")
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, default=str)
+    legacy_save = (time.perf_counter() - started) / repeats
+    started = time.perf_counter()
+    for _ in range(repeats):
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            json.load(f)
+    legacy_load = (time.perf_counter() - started) / repeats
+
+    binary_path = os.path.join("saves", "binary.sav")
+    started = time.perf_counter()
+    for _ in range(repeats):
+        save_format.write_save(binary_path, record)
+    binary_save = (time.perf_counter() - started) / repeats
+    started = time.perf_counter()
+    for _ in range(repeats):
+        save_format.read_save(binary_path)
+    binary_load = (time.perf_counter() - started) / repeats
+
+    # Whole SaveSystem calls, including building the record from the engine
+    started = time.perf_counter()
+    for _ in range(repeats):
+        system.save_game("hero", engine, None)
+    full_call = (time.perf_counter() - started) / repeats
+
+    # Auto-saves: the first is full, the following ones are deltas until compaction
+    delta_sizes, auto_times, delta_ids = [], [], []
+    for _ in range(repeats):
+        play_a_little(character, engine, rng)
+        started = time.perf_counter()
+        result = system.auto_save("hero", engine, None)
+        auto_times.append(time.perf_counter() - started)
+        if result["delta"]:
+            delta_ids.append(result["auto_save_id"])
+            delta_sizes.append(os.path.getsize(os.path.join("saves", f"{result['auto_save_id']}.sav")))
+    started = time.perf_counter()
+    for save_id in delta_ids:
+        system._read_record(save_id)
+    delta_load = (time.perf_counter() - started) / max(1, len(delta_ids))
+
+    print(f"serializer: {'msgpack' if save_format.msgpack else 'json'}, "
+          f"compressor: {'zstd' if save_format.zstandard else 'zlib'}")
+    print(f"legacy JSON : {os.path.getsize(legacy_path):>9,} bytes  "
+          f"save {legacy_save * 1000:6.2f} ms  load {legacy_load * 1000:6.2f} ms")
+    print(f"binary full : {os.path.getsize(binary_path):>9,} bytes  "
+          f"save {binary_save * 1000:6.2f} ms  load {binary_load * 1000:6.2f} ms")
+    if delta_sizes:
+        print(f"delta auto  : {sum(delta_sizes) / len(delta_sizes):>9,.0f} bytes  "
+              f"                load {delta_load * 1000:6.2f} ms (base + delta)")
+    print(f"save_game {full_call * 1000:.2f} ms vs auto_save {sum(auto_times) / len(auto_times) * 1000:.2f} ms "
+          f"per call ({len(delta_ids)} of {repeats} auto-saves were deltas)")
+
+
+if __name__ == '__main__':
+    main()
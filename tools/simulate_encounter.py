@@ -0,0 +1,76 @@
+"""
+Encounter balancing CLI.
+
+Runs Monte Carlo fights between a party and the enemies (plus boss) of one
+level in data/enhanced_scenarios.json and prints win rate, rounds-to-kill
+and expected HP remaining.
+
+Usage:
+    python tools/simulate_encounter.py dragon_hunters_path level_1
+    python tools/simulate_encounter.py dragon_hunters_path level_2 --party-level 4 --fights 500000
+    python tools/simulate_encounter.py dragon_hunters_path level_1 --party party.json --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.combat.encounter_simulator import (  # noqa: E402
+    DEFAULT_FIGHTS, DEFAULT_MAX_ROUNDS, Combatant, load_level_enemies, simulate_encounter, standard_party
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Monte Carlo encounter simulator")
+    parser.add_argument("scenario_id")
+    parser.add_argument("level_id")
+    parser.add_argument("--fights", type=int, default=DEFAULT_FIGHTS)
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS)
+    parser.add_argument("--party-size", type=int, default=4)
+    parser.add_argument("--party-level", type=int, help="defaults to the level's min_level")
+    parser.add_argument("--party", help="JSON file with a list of party stat blocks")
+    parser.add_argument("--no-boss", action="store_true", help="leave the level boss out")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--python", action="store_true", help="force the pure-Python engine")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    enemies, level = load_level_enemies(args.scenario_id, args.level_id, include_boss=not args.no_boss)
+
+    if args.party:
+        with open(args.party, 'r', encoding='utf-8') as f:
+            party = [Combatant.from_dict(member, is_player=True) for member in json.load(f)]
+    else:
+        party = standard_party(args.party_size, args.party_level or level.get("min_level", 1))
+
+    report = simulate_encounter(party, enemies, fights=args.fights, max_rounds=args.max_rounds,
+                                seed=args.seed, use_numpy=False if args.python else None)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    print(f"{level.get('title', args.level_id)}: {len(party)} players vs {len(enemies)} enemies")
+    print(f"  fights        : {report['fights']} ({report['engine']}, {report['fights_per_second']} fights/s)")
+    print(f"  win rate      : {report['win_rate']:.2%}")
+    print(f"  loss rate     : {report['loss_rate']:.2%}")
+    print(f"  timeout rate  : {report['timeout_rate']:.2%}")
+    for label, key in (("rounds to win ", "rounds_to_victory"), ("rounds to lose", "rounds_to_defeat")):
+        summary = report[key]
+        if summary["mean"] is not None:
+            print(f"  {label}: mean {summary['mean']}, p50 {summary['p50']}, p90 {summary['p90']}")
+    print(f"  party HP left : {report['expected_party_hp_ratio']:.2%}")
+    for member in report["party"]:
+        on_win = member["expected_hp_remaining_on_win"]
+        on_win_text = f", {on_win} on win" if on_win is not None else ""
+        print(f"    {member['name']:<12} {member['expected_hp_remaining']}/{member['max_health']}{on_win_text}")
+
+
+if __name__ == '__main__':
+    main()
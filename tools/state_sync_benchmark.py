@@ -0,0 +1,117 @@
+"""
+Delta state sync benchmark.
+
+Plays turns in an 8-player room and compares the bytes sent per turn when
+every client receives the full game_state (old behaviour) against sending
+only the versioned JSON-Patch for that turn.
+
+Usage: python tools/state_sync_benchmark.py [turns]
+"""
+
+import copy
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.multiplayer.room_store import LocalRoomStore  # noqa: E402
+from src.multiplayer.state_sync import apply_patch, record_patch, snapshot  # noqa: E402
+
+PLAYERS = 8
+ITEMS = ["healing_potion", "rope", "torch", "ancient_key", "silver_dagger", "scroll_of_light"]
+
+
+def encoded_size(payload) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def new_room(room_id: str) -> dict:
+    return {
+        'room_id': room_id,
+        'room_name': 'Benchmark Odası',
+        'max_players': PLAYERS,
+        'status': 'lobby',
+        'state_version': 0,
+        'patches': [],
+        'game_state': {
+            'room_id': room_id,
+            'current_turn': 0,
+            'turn_order': [],
+            'current_player': None,
+            'game_phase': 'lobby',
+            'scenario_progress': 0,
+            'shared_inventory': [],
+            'group_decisions': [],
+            'players': []
+        }
+    }
+
+
+def play_turn(room: dict, turn: int, rng: random.Random):
+    state = room['game_state']
+    players = state['players']
+    player = players[turn % len(players)]
+    state['current_turn'] = turn + 1
+    state['current_player'] = players[(turn + 1) % len(players)]['id']
+    state['scenario_progress'] += 1
+    state['group_decisions'].append({
+        'player_id': player['id'],
+        'choice_id': f"choice_{rng.randint(1, 4)}",
+        'turn': turn + 1
+    })
+    if rng.random() < 0.3:
+        state['shared_inventory'].append(rng.choice(ITEMS))
+    if rng.random() < 0.1:
+        player['status'] = 'away' if player['status'] == 'online' else 'online'
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(42)
+    store = LocalRoomStore()
+    room_id = 'bench_room'
+    store.create(room_id, new_room(room_id))
+
+    def mutate(mutator):
+        def apply(room):
+            previous = copy.deepcopy(room['game_state'])
+            mutator(room)
+            return record_patch(room, previous)
+        return store.update(room_id, apply)
+
+    # Players join, then the game starts
+    for seat in range(PLAYERS):
+        mutate(lambda room, seat=seat: room['game_state']['players'].append(
+            {'id': f"player_{seat}", 'name': f"Oyuncu_{seat}", 'status': 'online'}))
+    mutate(lambda room: room['game_state'].update(
+        game_phase='in_game', turn_order=[p['id'] for p in room['game_state']['players']]))
+
+    client_state = snapshot(store.get_state(room_id))
+    client_doc = copy.deepcopy(client_state['game_state'])
+
+    full_bytes = 0
+    patch_bytes = 0
+    elapsed = 0.0
+    for turn in range(turns):
+        start = time.perf_counter()
+        room, patch = mutate(lambda room: play_turn(room, turn, rng))
+        elapsed += time.perf_counter() - start
+
+        full_bytes += encoded_size({'room_id': room_id, 'game_state': room['game_state']}) * PLAYERS
+        patch_bytes += encoded_size({'room_id': room_id, **patch}) * PLAYERS
+        client_doc = apply_patch(client_doc, patch['ops'])
+
+    assert client_doc == store.get_state(room_id)['game_state'], "patched client diverged"
+
+    print(f"{PLAYERS}-player room, {turns} turns")
+    print(f"  full state per turn : {full_bytes / turns:>10.0f} bytes")
+    print(f"  patch per turn      : {patch_bytes / turns:>10.0f} bytes")
+    print(f"  reduction           : {full_bytes / patch_bytes:>10.1f}x")
+    print(f"  update + diff cost  : {elapsed / turns * 1_000_000:>10.1f} us/turn")
+
+
+if __name__ == '__main__':
+    main()
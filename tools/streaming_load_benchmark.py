@@ -0,0 +1,80 @@
+"""
+Spectator streaming load benchmark.
+
+Simulates a stream with 10k viewers: joins, chat bursts, game events and
+leaves. Compares the legacy one-emit-per-message fan-out with the
+tick-based coalesced frames from StreamingManager.flush_broadcasts.
+
+Usage: python tools/streaming_load_benchmark.py [viewers] [messages_per_tick]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from streaming_manager import StreamingManager  # noqa: E402
+
+TICKS = 40  # 10 seconds at the default 0.25s interval
+
+
+class CountingEmitter:
+    """Counts frames and per-viewer deliveries instead of sending them."""
+
+    def __init__(self, manager: StreamingManager):
+        self.manager = manager
+        self.frames = 0
+        self.deliveries = 0
+
+    def __call__(self, event, data, room=None):
+        self.frames += 1
+        self.deliveries += len(self.manager.active_streams[room].viewers)
+
+
+def timed(label: str, count: int, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:>9.1f} ms  ({elapsed / count * 1_000_000:.2f} us/op)")
+
+
+def main():
+    viewers = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    per_tick = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    manager = StreamingManager()
+    stream_id = manager.create_stream("gm_1", "GameMaster", "Load Test", "benchmark",
+                                      "dragon_hunt", max_viewers=viewers)
+    emitter = CountingEmitter(manager)
+    viewer_ids = [f"viewer_{i}" for i in range(viewers)]
+
+    print(f"{viewers} viewers, {per_tick} chat messages + 5 events per tick, {TICKS} ticks")
+    timed("join", viewers, lambda: [manager.join_stream(stream_id, v, v) for v in viewer_ids])
+    timed("duplicate join check", viewers, lambda: [manager.join_stream(stream_id, v, v) for v in viewer_ids])
+
+    def run_ticks():
+        for tick in range(TICKS):
+            for i in range(per_tick):
+                viewer = viewer_ids[(tick * per_tick + i) % viewers]
+                manager.add_chat_message(stream_id, viewer, viewer, f"mesaj {tick}-{i}")
+            for i in range(5):
+                manager.add_game_event(stream_id, "dice_roll", {"tick": tick, "roll": i})
+            manager.flush_broadcasts(emitter)
+
+    messages = TICKS * (per_tick + 5)
+    timed("chat + events + flush", messages, run_ticks)
+
+    chat = manager.get_stream_chat(stream_id)
+    ids = [m["id"] for m in chat]
+    assert len(chat) == 100 and len(set(ids)) == len(ids), "ring buffer or ids broken"
+
+    timed("leave", viewers, lambda: [manager.leave_stream(v) for v in viewer_ids])
+
+    legacy_frames = messages
+    print(f"  legacy emits (one per message) : {legacy_frames:>10}  deliveries {legacy_frames * viewers:>12}")
+    print(f"  coalesced frames               : {emitter.frames:>10}  deliveries {emitter.deliveries:>12}")
+
+
+if __name__ == '__main__':
+    main()